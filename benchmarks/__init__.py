@@ -0,0 +1,82 @@
+# benchmarks/__init__.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Performance benchmarks for this code base.
+
+    Each ‘bench_*’ module is a program to run with the ‘src’ directory on
+    the import path, for example::
+
+        $ PYTHONPATH=src python3 -m benchmarks.bench_rest_parser
+    """
+
+import datetime
+import textwrap
+
+
+body_item_texts = [
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+    "Donec venenatis nisl aliquam ipsum, pellentesque elementum\n"
+    "  mollis finibus.",
+]
+""" Texts of the items in each entry body, repeated in turn. """
+
+
+def make_change_log_document_text(entry_count, *, body_item_count=2):
+    """ Make the text of a Change Log document with `entry_count` entries.
+
+        :param entry_count: Number of entries (integer) in the document.
+        :param body_item_count: Number of bullet list items (integer) in
+            the body of each entry.
+        :return: Text of the document, in reStructuredText format.
+
+        The document is the same for the same arguments, so that results
+        are comparable between runs.
+        """
+    first_release_date = datetime.date(2000, 1, 1)
+    entry_template = textwrap.dedent("""\
+        Version {version}
+        {underline}
+
+        :Released: {release_date}
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+        {body}
+
+        """)
+    body = "\n".join(
+        "* " + body_item_texts[index % len(body_item_texts)]
+        for index in range(body_item_count))
+    entries_text = "\n".join(
+        entry_template.format(
+            version=version,
+            underline=("=" * len("Version {}".format(version))),
+            release_date=(
+                first_release_date + datetime.timedelta(days=number)
+            ).isoformat(),
+            body=body,
+        )
+        for (number, version) in (
+            (number, "{}.{}.{}".format(
+                number // 100, number // 10 % 10, number % 10))
+            for number in reversed(range(entry_count))))
+    document_text = "Change Log\n##########\n\n" + entries_text
+    return document_text
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
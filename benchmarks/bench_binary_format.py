@@ -0,0 +1,146 @@
+# benchmarks/bench_binary_format.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Benchmark of the compact binary format, compared with JSON. """
+
+import json
+import sys
+import timeit
+
+import chug.model
+import chug.writers
+
+
+def make_entries(entry_count):
+    """ Make `entry_count` distinct entries.
+
+        :param entry_count: Number of entries (integer) to make.
+        :return: Sequence of `chug.model.ChangeLogEntry` instances.
+        """
+    entries = [
+        chug.model.ChangeLogEntry(
+            "20{:02d}-{:02d}-01".format(number // 12 % 100, number % 12 + 1),
+            "{}.{}.{}".format(number // 100, number // 10 % 10, number % 10),
+            ["Foo Bar <foo.bar@example.org>", "Baz Qux <baz@example.org>"][
+                number % 2],
+            "Lorem ipsum dolor sit amet, number {}.".format(number))
+        for number in range(entry_count)]
+    return entries
+
+
+def serialise_entries_to_json(entries, *, indent=None):
+    """ Serialise the `entries` to JSON, as a list of version info mappings.
+
+        :param entries: Sequence of `chug.model.ChangeLogEntry` instances.
+        :param indent: The indent for `json.dumps`.
+        :return: The serialised data (bytes).
+        """
+    content = json.dumps(
+        [entry.as_version_info_entry() for entry in entries], indent=indent)
+    result = content.encode('utf-8')
+    return result
+
+
+def read_entries_from_json(data):
+    """ Read the entries from JSON `data`.
+
+        :param data: The serialised data (bytes).
+        :return: A list of `chug.model.ChangeLogEntry` instances.
+        """
+    result = [
+        chug.model.ChangeLogEntry(**fields) for fields in json.loads(data)]
+    return result
+
+
+def read_entry_from_json(data, index):
+    """ Read the entry at `index` from JSON `data`.
+
+        :param data: The serialised data (bytes).
+        :param index: The index (integer) of the entry.
+        :return: The `chug.model.ChangeLogEntry` at `index`.
+        """
+    result = chug.model.ChangeLogEntry(**json.loads(data)[index])
+    return result
+
+
+def measure(func, *, repeat=5):
+    """ Measure the best duration of calling `func`.
+
+        :param func: The callable to measure.
+        :param repeat: Number of times to call `func`.
+        :return: The least duration (float, in seconds) of the calls.
+        """
+    result = min(timeit.repeat(func, number=1, repeat=repeat))
+    return result
+
+
+def main(argv=None):
+    """ Run the benchmark, and report the results.
+
+        :param argv: Sequence of command-line arguments; the optional first
+            argument is the number of entries (integer) to make.
+        :return: Exit status (integer) of the program.
+        """
+    argv = sys.argv if argv is None else argv
+    entry_count = int(argv[1]) if len(argv) > 1 else 10000
+    entries = make_entries(entry_count)
+    index = entry_count // 2
+
+    formats = [
+        (
+            "JSON (indent=4)",
+            (lambda: serialise_entries_to_json(entries, indent=4)),
+            read_entries_from_json, read_entry_from_json),
+        (
+            "JSON (compact)",
+            (lambda: serialise_entries_to_json(entries)),
+            read_entries_from_json, read_entry_from_json),
+        (
+            "binary",
+            (lambda: chug.writers.serialise_entries_to_binary(entries)),
+            chug.writers.read_entries_from_binary,
+            (lambda data, index: (
+                chug.writers.BinaryEntryReader(data)[index])),
+        ),
+    ]
+
+    print("Serialise and read {count} entries:".format(count=entry_count))
+    for (name, serialise, read_all, read_one) in formats:
+        data = serialise()
+        if read_all(data) != entries:
+            raise AssertionError(
+                "entries read from {name} differ".format(name=name))
+        print(
+            "  {name:<16} {size:8.1f} KiB"
+            " {write:8.4f} s write {read:8.4f} s read all"
+            " {read_one:10.6f} s read entry {index}".format(
+                name=name, size=(len(data) / 2**10),
+                write=measure(serialise),
+                read=measure(lambda: read_all(data)),
+                read_one=measure(lambda: read_one(data, index)),
+                index=index))
+
+    return 0
+
+
+if __name__ == '__main__':  # pragma: nocover
+    sys.exit(main())
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -0,0 +1,99 @@
+# benchmarks/bench_entry_memory.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Benchmark of memory used by the Change Log entry types. """
+
+import sys
+import timeit
+import tracemalloc
+
+import chug.model
+
+
+def make_entries_fields(entry_count):
+    """ Make the fields for `entry_count` distinct entries.
+
+        :param entry_count: Number of entries (integer) to make.
+        :return: Sequence of tuples of field values.
+        """
+    entries_fields = [
+        (
+            "2009-01-01",
+            "{}.{}.{}".format(number // 100, number // 10 % 10, number % 10),
+            "Foo Bar <foo.bar@example.org>",
+            "Lorem ipsum dolor sit amet, number {}.".format(number),
+        )
+        for number in range(entry_count)]
+    return entries_fields
+
+
+def measure_entries_memory(entry_type, entries_fields):
+    """ Measure the memory allocated to make entries of `entry_type`.
+
+        :param entry_type: The class of entry to make.
+        :param entries_fields: Sequence of tuples of field values.
+        :return: The memory (integer, in bytes) allocated for the entries,
+            not counting the field values themselves.
+        """
+    tracemalloc.start()
+    try:
+        entries = [entry_type(*fields) for fields in entries_fields]
+        (size, __) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del entries
+    return size
+
+
+def main(argv=None):
+    """ Run the benchmark, and report the results.
+
+        :param argv: Sequence of command-line arguments; the optional first
+            argument is the number of entries (integer) to make.
+        :return: Exit status (integer) of the program.
+        """
+    argv = sys.argv if argv is None else argv
+    entry_count = int(argv[1]) if len(argv) > 1 else 100000
+    entries_fields = make_entries_fields(entry_count)
+
+    print("Make {count} entries:".format(count=entry_count))
+    for entry_type in [
+            chug.model.ChangeLogEntry,
+            chug.model.CompactChangeLogEntry,
+    ]:
+        size = measure_entries_memory(entry_type, entries_fields)
+        entries = [entry_type(*fields) for fields in entries_fields]
+        equality_duration = min(timeit.repeat(
+            lambda: [a == b for (a, b) in zip(entries, entries[1:])],
+            number=1, repeat=3))
+        print(
+            "  {name:<22} {size:8.1f} MiB {each:6.1f} bytes/entry"
+            " {equality:8.3f} s for equality".format(
+                name=entry_type.__name__,
+                size=(size / 2**20), each=(size / entry_count),
+                equality=equality_duration))
+
+    return 0
+
+
+if __name__ == '__main__':  # pragma: nocover
+    sys.exit(main())
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -0,0 +1,84 @@
+# benchmarks/bench_node_verification.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Benchmark of the overhead of verifying Docutils node types. """
+
+import sys
+import timeit
+
+import chug.parsers.rest
+
+from . import make_change_log_document_text
+
+
+def main(argv=None):
+    """ Run the benchmark, and report the results.
+
+        :param argv: Sequence of command-line arguments; the optional first
+            argument is the number of entries (integer) in the document.
+        :return: Exit status (integer) of the program.
+        """
+    argv = sys.argv if argv is None else argv
+    entry_count = int(argv[1]) if len(argv) > 1 else 1000
+    document = chug.parsers.rest.parse_rest_document_from_text(
+        make_change_log_document_text(entry_count))
+    entry_nodes = chug.parsers.rest.get_changelog_entry_nodes_from_document(
+        document)
+    entry_node_type = tuple(
+        chug.parsers.rest.get_field_list_type_by_entry_node_type())
+
+    def verify_with_message():
+        # The cost of each verification, when the message was always made.
+        for entry_node in entry_nodes:
+            __ = chug.parsers.rest.make_node_type_error_message(
+                entry_node, entry_node_type)
+            chug.parsers.rest.verify_is_docutils_node(
+                entry_node, node_type=entry_node_type)
+
+    def verify():
+        for entry_node in entry_nodes:
+            chug.parsers.rest.verify_is_docutils_node(
+                entry_node, node_type=entry_node_type)
+
+    def make_entries(*, trusted):
+        for entry_node in entry_nodes:
+            entry = chug.parsers.rest.make_change_log_entry_from_node(
+                entry_node, trusted=trusted)
+            __ = entry.body
+
+    print("Verify and make {count} entries:".format(count=entry_count))
+    for (name, func) in [
+            ("verify, eager message", verify_with_message),
+            ("verify", verify),
+            ("make entry", lambda: make_entries(trusted=False)),
+            ("make entry, trusted", lambda: make_entries(trusted=True)),
+    ]:
+        duration = min(timeit.repeat(func, number=1, repeat=5))
+        print("  {name:<22} {total:8.3f} s {each:8.2f} µs/entry".format(
+            name=name, total=duration,
+            each=(duration * 1000000 / entry_count)))
+
+    return 0
+
+
+if __name__ == '__main__':  # pragma: nocover
+    sys.exit(main())
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -0,0 +1,271 @@
+# benchmarks/bench_pipeline.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Benchmark of each stage of the parse pipeline, for documents of any size.
+
+    Each stage is timed, and its peak memory allocation measured, for
+    documents made by `make_change_log_document_text`. The results are
+    compared with the stored baseline results, so that a regression between
+    releases is visible::
+
+        $ PYTHONPATH=src python3 -m benchmarks.bench_pipeline
+        $ PYTHONPATH=src python3 -m benchmarks.bench_pipeline --save-baseline
+    """
+
+import argparse
+import json
+import pathlib
+import sys
+import timeit
+import tracemalloc
+
+import chug.model
+import chug.parsers.rest
+import chug.writers
+
+from . import make_change_log_document_text
+
+
+default_baseline_path = pathlib.Path(__file__).with_name(
+    "baseline_pipeline.json")
+""" Filesystem path of the stored baseline results. """
+
+default_cases = [
+    (10, 2),
+    (10, 20),
+    (1000, 2),
+    (1000, 20),
+    (100000, 2),
+]
+""" Default cases to measure, as (entry count, body item count) pairs. """
+
+default_docutils_entry_limit = 1000
+""" Largest document (number of entries) to parse with Docutils, by default.
+
+    Parsing with Docutils takes time more than proportional to the number of
+    entries, so the Docutils stages are skipped for larger documents.
+    """
+
+regression_ratio = 1.25
+""" Ratio of result to baseline that is reported as a regression. """
+
+
+def make_stages(*, use_docutils):
+    """ Make the stages of the pipeline to measure.
+
+        :param use_docutils: If true, include the stages that parse with
+            Docutils.
+        :return: Sequence of (name, function) pairs. Each function takes the
+            mapping of results so far, and returns its own result.
+        """
+    stages = []
+    if use_docutils:
+        stages.extend([
+            ('parse_rest_document_from_text', (
+                lambda results: (
+                    chug.parsers.rest.parse_rest_document_from_text(
+                        results['document_text'])))),
+            ('make_change_log_entries_from_document', (
+                lambda results: (
+                    chug.parsers.rest.make_change_log_entries_from_document(
+                        results['parse_rest_document_from_text'])))),
+        ])
+    stages.extend([
+        ('make_change_log_entries_from_text', (
+            lambda results: (
+                chug.parsers.rest.make_change_log_entries_from_text(
+                    results['document_text'])))),
+        ('as_version_info_entry', (
+            lambda results: [
+                entry.as_version_info_entry()
+                for entry in results['make_change_log_entries_from_text']])),
+        ('get_latest_version', (
+            lambda results: chug.model.get_latest_version(
+                results['as_version_info_entry']))),
+        ('serialise_version_info_from_mapping_to_json', (
+            lambda results: (
+                chug.writers.serialise_version_info_from_mapping_to_json(
+                    results['as_version_info_entry'])))),
+    ])
+    return stages
+
+
+def measure_peak_memory(func):
+    """ Measure the peak memory allocated while calling `func`.
+
+        :param func: The function to call, with no arguments.
+        :return: A tuple (`result`, `peak_size`) of the result of `func`, and
+            the peak memory (integer, in bytes) allocated during the call.
+        """
+    tracemalloc.start()
+    try:
+        result = func()
+        (__, peak_size) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (result, peak_size)
+
+
+def measure_case(entry_count, body_item_count, *, repeat, docutils_limit):
+    """ Measure the pipeline stages for one case.
+
+        :param entry_count: Number of entries (integer) in the document.
+        :param body_item_count: Number of items (integer) in each body.
+        :param repeat: Number of times (integer) to time each stage; the
+            fastest time is the result.
+        :param docutils_limit: Largest document (number of entries) to parse
+            with Docutils.
+        :return: Mapping of stage name, to mapping of measurement name
+            (‘seconds’ and ‘peak_bytes’) to value.
+        """
+    results = {
+        'document_text': make_change_log_document_text(
+            entry_count, body_item_count=body_item_count),
+    }
+    measurements = {}
+    for (name, stage) in make_stages(
+            use_docutils=(entry_count <= docutils_limit)):
+        (results[name], peak_size) = measure_peak_memory(
+            lambda: stage(results))
+        duration = min(timeit.repeat(
+            lambda: stage(results), number=1, repeat=repeat))
+        measurements[name] = {'seconds': duration, 'peak_bytes': peak_size}
+    return measurements
+
+
+def get_case_name(entry_count, body_item_count):
+    """ Get the name (text) of a case, as a key for results. """
+    name = "entries={:d} body_items={:d}".format(entry_count, body_item_count)
+    return name
+
+
+def format_comparison(value, baseline_value):
+    """ Format the comparison of `value` to `baseline_value`.
+
+        :param value: The measured value (number).
+        :param baseline_value: The baseline value (number), or ``None``.
+        :return: Text of the ratio of the values, marked if it is a
+            regression.
+        """
+    if not baseline_value:
+        return ""
+    ratio = value / baseline_value
+    text = "×{:.2f}{}".format(
+        ratio, (" REGRESSION" if ratio > regression_ratio else ""))
+    return text
+
+
+def report_case(name, measurements, baseline_measurements):
+    """ Print the `measurements` of a case, compared with the baseline.
+
+        :param name: The name (text) of the case.
+        :param measurements: Mapping of stage name to measurements.
+        :param baseline_measurements: Mapping of stage name to baseline
+            measurements.
+        :return: ``None``.
+        """
+    print("{name}:".format(name=name))
+    for (stage_name, stage_measurements) in measurements.items():
+        baseline_stage = baseline_measurements.get(stage_name, {})
+        print(
+            "  {stage:<44} {seconds:9.4f} s {seconds_ratio:<17}"
+            " {peak:10.1f} KiB {peak_ratio}".format(
+                stage=stage_name,
+                seconds=stage_measurements['seconds'],
+                seconds_ratio=format_comparison(
+                    stage_measurements['seconds'],
+                    baseline_stage.get('seconds')),
+                peak=(stage_measurements['peak_bytes'] / 1024),
+                peak_ratio=format_comparison(
+                    stage_measurements['peak_bytes'],
+                    baseline_stage.get('peak_bytes')),
+            ).rstrip())
+
+
+def parse_case(text):
+    """ Parse a case from command-line `text` ‘ENTRIES[:BODY_ITEMS]’. """
+    (entry_count_text, __, body_item_count_text) = text.partition(":")
+    case = (int(entry_count_text), int(body_item_count_text or 2))
+    return case
+
+
+def make_argument_parser():
+    """ Make the parser for the command-line arguments. """
+    parser = argparse.ArgumentParser(
+        prog="bench_pipeline", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'cases', metavar="ENTRIES[:BODY_ITEMS]", nargs='*', type=parse_case,
+        help="number of entries, and of items in each entry body, to measure"
+        " (default: {})".format(" ".join(
+            "{:d}:{:d}".format(*case) for case in default_cases)))
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help="number of times to time each stage (default: %(default)s)")
+    parser.add_argument(
+        '--docutils-limit', type=int, default=default_docutils_entry_limit,
+        help="largest number of entries to parse with Docutils"
+        " (default: %(default)s)")
+    parser.add_argument(
+        '--baseline', type=pathlib.Path, default=default_baseline_path,
+        help="path of the baseline results file (default: %(default)s)")
+    parser.add_argument(
+        '--save-baseline', action='store_true',
+        help="store these results as the baseline")
+    return parser
+
+
+def main(argv=None):
+    """ Run the benchmark, and report the results.
+
+        :param argv: Sequence of command-line arguments.
+        :return: Exit status (integer) of the program.
+        """
+    argv = sys.argv if argv is None else argv
+    options = make_argument_parser().parse_args(argv[1:])
+    cases = options.cases or default_cases
+
+    try:
+        baseline = json.loads(options.baseline.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        baseline = {}
+
+    all_measurements = {}
+    for (entry_count, body_item_count) in cases:
+        name = get_case_name(entry_count, body_item_count)
+        measurements = measure_case(
+            entry_count, body_item_count,
+            repeat=options.repeat, docutils_limit=options.docutils_limit)
+        report_case(name, measurements, baseline.get(name, {}))
+        all_measurements[name] = measurements
+
+    if options.save_baseline:
+        baseline.update(all_measurements)
+        options.baseline.write_text(
+            json.dumps(baseline, indent=4, sort_keys=True) + "\n",
+            encoding='utf-8')
+        print("Saved baseline results to ‘{}’.".format(options.baseline))
+
+    return 0
+
+
+if __name__ == '__main__':  # pragma: nocover
+    sys.exit(main())
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -0,0 +1,71 @@
+# benchmarks/bench_rest_parser.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Benchmark of re-using a `ChangeLogRestParser` for many documents. """
+
+import sys
+import timeit
+
+import docutils.core
+
+import chug.parsers.rest
+
+from . import make_change_log_document_text
+
+
+def main(argv=None):
+    """ Run the benchmark, and report the results.
+
+        :param argv: Sequence of command-line arguments; the optional first
+            argument is the number of documents (integer) to parse.
+        :return: Exit status (integer) of the program.
+        """
+    argv = sys.argv if argv is None else argv
+    document_count = int(argv[1]) if len(argv) > 1 else 500
+    document_texts = [
+        make_change_log_document_text(number % 10 + 1)
+        for number in range(document_count)]
+
+    def parse_with_publish_doctree():
+        for document_text in document_texts:
+            __ = docutils.core.publish_doctree(document_text)
+
+    def parse_with_reused_parser():
+        parser = chug.parsers.rest.ChangeLogRestParser()
+        for document_text in document_texts:
+            __ = parser.parse(document_text)
+
+    print("Parse {count} small documents:".format(count=document_count))
+    for (name, func) in [
+            ("publish_doctree", parse_with_publish_doctree),
+            ("ChangeLogRestParser", parse_with_reused_parser),
+    ]:
+        duration = min(timeit.repeat(func, number=1, repeat=3))
+        print("  {name:<20} {total:8.3f} s {each:8.3f} ms/document".format(
+            name=name, total=duration,
+            each=(duration * 1000 / document_count)))
+
+    return 0
+
+
+if __name__ == '__main__':  # pragma: nocover
+    sys.exit(main())
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
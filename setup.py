@@ -29,14 +29,16 @@ main_module_docstring = util.metadata.docstring_from_object(main_module)
     main_module_docstring)
 
 changelog_infile_path = package_root_dir.joinpath("ChangeLog")
-latest_changelog_entry = util.metadata.get_latest_changelog_entry(
-    changelog_infile_path)
+changelog_memo_path = package_root_dir.joinpath(
+    "build", "changelog-metadata.json")
+latest_changelog_metadata = util.metadata.get_latest_changelog_metadata(
+    changelog_infile_path, memo_path=changelog_memo_path)
 
 
 setup_kwargs = dict(
     description=synopsis,
-    version=latest_changelog_entry.version,
-    maintainer=latest_changelog_entry.maintainer,
+    version=latest_changelog_metadata['version'],
+    maintainer=latest_changelog_metadata['maintainer'],
 )
 
 
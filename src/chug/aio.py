@@ -0,0 +1,163 @@
+# src/chug/aio.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Reading and parsing of Change Log documents, for use with `asyncio`.
+
+    Reading a document file and parsing it are done in an executor, not in
+    the event loop, so the event loop is not blocked while they run. The
+    executor is the event loop's default executor, unless another (such as
+    a `concurrent.futures.ProcessPoolExecutor`) is specified.
+    """
+
+import asyncio
+
+from .parsers import batch
+
+
+default_concurrency = 8
+""" Number of documents to read and parse at once, by default. """
+
+
+async def load_result(infile_path, *, executor=None):
+    """ Get the `batch.DocumentParseResult` for the document at a path.
+
+        :param infile_path: Filesystem path of the document to read.
+        :param executor: The `concurrent.futures.Executor` in which to read
+            and parse the document, or ``None`` for the default executor
+            of the event loop.
+        :return: The `batch.DocumentParseResult` for the document.
+        """
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        executor, batch.parse_document, infile_path)
+    return result
+
+
+async def load_entries(infile_path, *, executor=None):
+    """ Get the Change Log entries from the document at `infile_path`.
+
+        :param infile_path: Filesystem path of the document to read.
+        :param executor: The `concurrent.futures.Executor` in which to read
+            and parse the document, or ``None`` for the default executor
+            of the event loop.
+        :return: A sequence of `model.CompactChangeLogEntry` instances,
+            representing the Change Log entries from the document.
+        :raises batch.DocumentParseError: If the document could not be read
+            or parsed.
+        """
+    result = await load_result(infile_path, executor=executor)
+    if result.error is not None:
+        raise result.error
+    return result.entries
+
+
+async def iter_entries(infile_path, *, executor=None):
+    """ Generate the Change Log entries from the document at `infile_path`.
+
+        :param infile_path: Filesystem path of the document to read.
+        :param executor: The `concurrent.futures.Executor` to use, as for
+            `load_result`.
+        :return: Asynchronous generator of `model.CompactChangeLogEntry`
+            instances, representing the Change Log entries from the
+            document in document order.
+        :raises batch.DocumentParseError: If the document could not be read
+            or parsed.
+        """
+    for entry in await load_entries(infile_path, executor=executor):
+        yield entry
+
+
+def make_bounded_load_result(concurrency, *, executor=None):
+    """ Make a coroutine function to load at most `concurrency` at once.
+
+        :param concurrency: The maximum number (integer) of documents to
+            read and parse at once.
+        :param executor: The `concurrent.futures.Executor` to use, as for
+            `load_result`.
+        :return: A coroutine function that takes a document path, and
+            returns the `batch.DocumentParseResult` from `load_result`.
+        :raises ValueError: If `concurrency` is less than 1.
+        """
+    if concurrency < 1:
+        raise ValueError(
+            "concurrency must be at least 1: {!r}".format(concurrency))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded_load_result(infile_path):
+        """ Get the result of `load_result`, when the semaphore allows. """
+        async with semaphore:
+            result = await load_result(infile_path, executor=executor)
+        return result
+
+    return bounded_load_result
+
+
+async def load_many(
+        infile_paths, *, concurrency=default_concurrency, executor=None):
+    """ Get the Change Log entries from each of the documents.
+
+        :param infile_paths: Iterable of filesystem paths of documents.
+        :param concurrency: The maximum number (integer) of documents to
+            read and parse at once.
+        :param executor: The `concurrent.futures.Executor` to use, as for
+            `load_result`.
+        :return: A sequence of `batch.DocumentParseResult` instances, one
+            for each document, in the same order as `infile_paths`.
+        :raises ValueError: If `concurrency` is less than 1.
+
+        An error reading or parsing any document is captured in its result.
+        If this is cancelled, documents not yet started are not loaded.
+        """
+    bounded_load_result = make_bounded_load_result(
+        concurrency, executor=executor)
+    results = await asyncio.gather(*(
+        bounded_load_result(infile_path) for infile_path in infile_paths))
+    return list(results)
+
+
+async def iter_load_many(
+        infile_paths, *, concurrency=default_concurrency, executor=None):
+    """ Generate the results of loading the documents, as they complete.
+
+        :param infile_paths: Iterable of filesystem paths of documents.
+        :param concurrency: The maximum number (integer) of documents to
+            read and parse at once.
+        :param executor: The `concurrent.futures.Executor` to use, as for
+            `load_result`.
+        :return: Asynchronous generator of `batch.DocumentParseResult`
+            instances, one for each document, in the order they complete.
+        :raises ValueError: If `concurrency` is less than 1.
+
+        If the generator is closed or cancelled before it is exhausted,
+        the loading of the remaining documents is cancelled.
+        """
+    bounded_load_result = make_bounded_load_result(
+        concurrency, executor=executor)
+    tasks = [
+        asyncio.ensure_future(bounded_load_result(infile_path))
+        for infile_path in infile_paths]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -7,13 +7,16 @@
 
 """ Data model for internal representation. """
 
+import array
 import collections
 import datetime
+import functools
+import heapq
+import itertools
+import operator
 import re
 import textwrap
 
-import semver
-
 
 class VersionInvalidError(ValueError):
     """ Raised when a version representation is formally invalid. """
@@ -30,9 +33,242 @@ class PersonDetailsInvalidError(ValueError):
 rfc822_person_regex = re.compile(r"^(?P<name>[^<]+) <(?P<email>[^>]+)>$")
 """ Regular Expression pattern to match a person's contact details. """
 
+
+@functools.total_ordering
+class SpecialValue:
+    """ A special value, in place of a date or version of an entry.
+
+        A special value compares with other values of the same field: a
+        value with negative `rank` sorts before every date or version, and
+        a value with positive `rank` sorts after every date or version.
+        """
+
+    def __init__(self, text, *, rank, name=None):
+        """ Set up a new instance.
+
+            :param text: The text (e.g. ``"UNKNOWN"``) representing this
+                value in a Change Log document.
+            :param rank: The rank (integer) of this value for sorting, as
+                described for this class.
+            :param name: The name (text) of the module-level variable bound
+                to this value, or ``None``. A named value is pickled and
+                copied by reference to that variable, so that the copy is
+                this same value.
+            """
+        self.text = text
+        self.rank = rank
+        self.name = name
+
+    def __repr__(self):
+        """ Programmer representation text of this instance. """
+        text = "<{0.__class__.__name__} {0.text}>".format(self)
+        return text
+
+    def __str__(self):
+        """ Informal representation text of this instance. """
+        return self.text
+
+    def __reduce__(self):
+        if self.name is None:
+            return super().__reduce__()
+        return self.name
+
+    def __hash__(self):
+        return id(self)
+
+    def __eq__(self, other):
+        return self is other
+
+    def __lt__(self, other):
+        if isinstance(other, SpecialValue):
+            result = (self.rank < other.rank)
+        else:
+            result = (self.rank < 0)
+        return result
+
+
+unknown_value = SpecialValue("UNKNOWN", rank=-1, name="unknown_value")
+""" Special value for an unknown release date or version. """
+
+next_value = SpecialValue("NEXT", rank=1, name="next_value")
+""" Special value for the version of the next release. """
+
+future_value = SpecialValue("FUTURE", rank=1, name="future_value")
+""" Special value for the release date of a future release. """
+
+special_version_values = {
+    value.text: value for value in [unknown_value, next_value]}
+""" Mapping of special version text to its `SpecialValue`. """
+
+special_release_date_values = {
+    value.text: value for value in [unknown_value, future_value]}
+""" Mapping of special release date text to its `SpecialValue`. """
+
+
+class VersionParseCache:
+    """ Bounded memoising parser of Semantic Version text.
+
+        Change Log documents often share version strings, so this keeps the
+        `semver.Version` most recently parsed from each text, up to
+        `max_size` items, and returns the same instance for the same text.
+        """
+
+    default_max_size = 1024
+
+    def __init__(self, max_size=default_max_size):
+        """ Set up a new instance.
+
+            :param max_size: Maximum number (integer) of parsed versions to
+                keep, or ``None`` for no limit.
+            """
+        self.set_max_size(max_size)
+
+    @staticmethod
+    def parse_uncached(text):
+        """ Parse `text` as a Semantic Version, without the cache.
+
+            :param text: The version text to parse.
+            :return: A `semver.Version` instance representing the version.
+            :raises ValueError: If `text` is not a valid Semantic Version.
+            """
+        # Import ‘semver’ only when a version is first parsed, so that
+        # importing this module does not pay for it.
+        import semver
+        result = semver.Version.parse(text, optional_minor_and_patch=True)
+        return result
+
+    def set_max_size(self, max_size):
+        """ Set the maximum number of parsed versions to keep.
+
+            :param max_size: Maximum number (integer) of parsed versions to
+                keep, or ``None`` for no limit.
+            :return: ``None``.
+
+            This discards any parsed versions and statistics so far.
+            """
+        self.max_size = max_size
+        self.parse = functools.lru_cache(maxsize=max_size)(
+            self.parse_uncached)
+
+    def cache_info(self):
+        """ Get the statistics of this cache.
+
+            :return: A named tuple (`hits`, `misses`, `maxsize`,
+                `currsize`), as from `functools.lru_cache`.
+            """
+        result = self.parse.cache_info()
+        return result
+
+    def clear(self):
+        """ Discard the parsed versions and statistics so far. """
+        self.parse.cache_clear()
+
+
+version_parse_cache = VersionParseCache()
+""" The `VersionParseCache` shared by this library. """
+
 
+class DeferredValue:
+    """ A value that is computed only when it is first needed.
+
+        This allows an expensive field value, such as the body text of an
+        entry, to be computed only if some caller actually asks for it.
+        """
+
+    def __init__(self, get_value):
+        """ Set up a new instance.
+
+            :param get_value: A callable, with no arguments, that returns
+                the value.
+            """
+        self.get_value = get_value
+        self.is_resolved = False
+        self.value = None
+
+    def __repr__(self):
+        """ Programmer representation text of this instance. """
+        text = "<{0.__class__.__name__} {1}>".format(
+            self,
+            ("value: {!r}".format(self.value) if self.is_resolved
+             else "unresolved"))
+        return text
+
+    def get(self):
+        """ Get the value, computing it if it is not yet computed.
+
+            :return: The value returned by `get_value`.
+
+            The value is computed only once; subsequent calls return the
+            same value, and the `get_value` callable is released.
+            """
+        if not self.is_resolved:
+            self.value = self.get_value()
+            self.is_resolved = True
+            self.get_value = None
+        return self.value
+
+    @classmethod
+    def resolve(cls, value):
+        """ Get the value of `value`, if it is deferred.
+
+            :param value: A `DeferredValue`, or any other value.
+            :return: The value of `value` if it is a `DeferredValue`;
+                otherwise, `value` itself.
+            """
+        result = value.get() if isinstance(value, cls) else value
+        return result
+
+
+class TextSpan:
+    """ A span of a text, referring to the text without copying it.
+
+        This represents the part of `text` from `start` to `end` (character
+        offsets, as for a slice), and gets that part only when it is
+        converted to text with `str`. Many spans can share the same text,
+        such as the whole of a Change Log document.
+        """
+
+    __slots__ = ['text', 'start', 'end']
+
+    def __init__(self, text, start, end):
+        """ Set up a new instance.
+
+            :param text: The whole text which contains the span.
+            :param start: The offset (integer) of the start of the span.
+            :param end: The offset (integer) of the end of the span.
+            """
+        self.text = text
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        """ Programmer representation text of this instance. """
+        text = "<{0.__class__.__name__} [{0.start}:{0.end}]>".format(self)
+        return text
+
+    def __str__(self):
+        """ The text of this span. """
+        return self.text[self.start:self.end]
+
+    def __len__(self):
+        return (self.end - self.start)
+
+    def __eq__(self, other):
+        if not isinstance(other, TextSpan):
+            return NotImplemented
+        return (str(self) == str(other))
+
+    def __hash__(self):
+        return hash(str(self))
+
+
 class ChangeLogEntry:
-    """ An individual entry from the Change Log document. """
+    """ An individual entry from the Change Log document.
+
+        The `body_source` attribute is a `TextSpan` of the source text of
+        the entry body in the document, or ``None`` if that is not known.
+        It is not one of the `field_names`.
+        """
 
     field_names = [
         'release_date',
@@ -41,6 +277,8 @@ class ChangeLogEntry:
         'body',
     ]
 
+    field_values_getter = operator.attrgetter(*field_names)
+
     date_format = "%Y-%m-%d"
     default_version = "UNKNOWN"
     default_release_date = "UNKNOWN"
@@ -48,16 +286,73 @@ class ChangeLogEntry:
     def __init__(
             self,
             release_date=default_release_date, version=default_version,
-            maintainer=None, body=None):
-        self.validate_release_date(release_date)
+            maintainer=None, body=None, *, body_source=None):
+        self.release_date_value = self.parse_release_date(release_date)
         self.release_date = release_date
 
-        self.validate_version(version)
+        self.version_info = self.parse_version(version)
         self.version = version
 
         self.validate_maintainer(maintainer)
         self.maintainer = maintainer
         self.body = body
+        self.body_source = body_source
+
+    @classmethod
+    def from_parsed_values(
+            cls,
+            release_date, version, maintainer=None, body=None, *,
+            release_date_value, version_info, body_source=None):
+        """ Make a new instance from fields whose values are already parsed.
+
+            :param release_date: The `release_date` text.
+            :param version: The `version` text.
+            :param maintainer: The `maintainer` text, or ``None``.
+            :param body: The `body` text, or ``None``.
+            :param release_date_value: The value parsed from
+                `release_date`, as from `parse_release_date`.
+            :param version_info: The value parsed from `version`, as from
+                `parse_version`.
+            :param body_source: The `TextSpan` of the body source, or
+                ``None``.
+            :return: A new instance of this class.
+            :raises PersonDetailsInvalidError: If `maintainer` is invalid.
+
+            The `release_date` and `version` are not parsed again; the
+            caller is responsible for the parsed values matching the text.
+            """
+        entry = cls.__new__(cls)
+        entry.release_date_value = release_date_value
+        entry.release_date = release_date
+        entry.version_info = version_info
+        entry.version = version
+        cls.validate_maintainer(maintainer)
+        entry.maintainer = maintainer
+        entry.body = body
+        entry.body_source = body_source
+        return entry
+
+    @property
+    def body(self):
+        """ The body text of this entry, or ``None``.
+
+            If the body was specified as a `DeferredValue`, its value is
+            computed when this is first accessed, and then stored in place
+            of the `DeferredValue`.
+            """
+        result = DeferredValue.resolve(self.__dict__['body'])
+        self.__dict__['body'] = result
+        return result
+
+    @body.setter
+    def body(self, value):
+        self.__dict__['body'] = value
+
+    def __getstate__(self):
+        # Resolve the body, so that a deferred body does not pickle or
+        # copy the document from which it is computed.
+        state = dict(self.__dict__, body=self.body)
+        return state
 
     def __repr__(self):
         """ Programmer representation text of this instance. """
@@ -74,42 +369,69 @@ class ChangeLogEntry:
         return text
 
     @classmethod
-    def validate_release_date(cls, value):
-        """ Validate the `release_date` value.
+    def parse_release_date(cls, value):
+        """ Parse the `release_date` value.
 
             :param value: The prospective `release_date` value.
-            :return: ``None`` if the value is valid.
+            :return: The `datetime.date` parsed from the value, or the
+                `SpecialValue` if the value is a valid non-date value.
             :raises DateInvalidError: If the value is invalid.
             """
-        if value in ["UNKNOWN", "FUTURE"]:
+        if value in special_release_date_values:
             # A valid non-date value.
-            return None
+            return special_release_date_values[value]
 
         try:
-            __ = datetime.datetime.strptime(value, ChangeLogEntry.date_format)
+            release_date_value = datetime.datetime.strptime(
+                value, ChangeLogEntry.date_format).date()
         except ValueError as exc:
             raise DateInvalidError(value) from exc
 
+        return release_date_value
+
+    @classmethod
+    def validate_release_date(cls, value):
+        """ Validate the `release_date` value.
+
+            :param value: The prospective `release_date` value.
+            :return: ``None`` if the value is valid.
+            :raises DateInvalidError: If the value is invalid.
+            """
+        __ = cls.parse_release_date(value)
+
         # No exception raised; return successfully.
         return None
 
     @classmethod
-    def validate_version(cls, value):
-        """ Validate the `version` value.
+    def parse_version(cls, value):
+        """ Parse the `version` value.
 
             :param value: The prospective `version` value.
-            :return: ``None`` if the value is valid.
+            :return: The `semver.Version` parsed from the value, or the
+                `SpecialValue` if the value is a valid non-version value.
             :raises VersionInvalidError: If the value is invalid.
             """
-        if value in ["UNKNOWN", "NEXT"]:
+        if value in special_version_values:
             # A valid non-version value.
-            return None
+            return special_version_values[value]
 
         try:
-            __ = semver.Version.parse(value, optional_minor_and_patch=True)
+            version_info = version_parse_cache.parse(value)
         except ValueError as exc:
             raise VersionInvalidError(value) from exc
 
+        return version_info
+
+    @classmethod
+    def validate_version(cls, value):
+        """ Validate the `version` value.
+
+            :param value: The prospective `version` value.
+            :return: ``None`` if the value is valid.
+            :raises VersionInvalidError: If the value is invalid.
+            """
+        __ = cls.parse_version(value)
+
         # No exception raised; return successfully.
         return None
 
@@ -144,42 +466,785 @@ class ChangeLogEntry:
             for name in cls.field_names)
         return result
 
+    def field_values(self):
+        """ Get the values of the fields, in the order of `field_names`. """
+        result = self.field_values_getter(self)
+        return result
+
     def as_version_info_entry(self):
         """ Format the changelog entry as a version info entry. """
-        fields = vars(self)
-        entry = self.make_ordered_dict(fields)
+        entry = collections.OrderedDict(
+            zip(self.field_names, self.field_values()))
 
         return entry
 
     def __eq__(self, other):
         result = False
         if isinstance(other, type(self)):
-            self_mapping = self.make_ordered_dict(vars(self))
-            other_mapping = self.make_ordered_dict(vars(other))
-            if self_mapping == other_mapping:
-                result = True
+            result = (self.field_values() == other.field_values())
+        return result
+
+
+class CompactChangeLogEntry:
+    """ An individual entry from the Change Log document, stored compactly.
+
+        This has the same fields, validation, and methods as
+        `ChangeLogEntry`, but stores its attributes in slots instead of an
+        instance dict, and is immutable. Instances are hashable, and compare
+        equal when their fields are equal.
+        """
+
+    __slots__ = [
+        'release_date',
+        'version',
+        'maintainer',
+        'body_content',
+        'body_source',
+        'release_date_value',
+        'version_info',
+    ]
+
+    field_names = ChangeLogEntry.field_names
+    field_values_getter = ChangeLogEntry.field_values_getter
+
+    date_format = ChangeLogEntry.date_format
+    default_version = ChangeLogEntry.default_version
+    default_release_date = ChangeLogEntry.default_release_date
+
+    def __init__(
+            self,
+            release_date=default_release_date, version=default_version,
+            maintainer=None, body=None, *, body_source=None):
+        set_attribute = super().__setattr__
+        set_attribute(
+            'release_date_value',
+            ChangeLogEntry.parse_release_date(release_date))
+        set_attribute('release_date', release_date)
+
+        set_attribute('version_info', ChangeLogEntry.parse_version(version))
+        set_attribute('version', version)
+
+        ChangeLogEntry.validate_maintainer(maintainer)
+        set_attribute('maintainer', maintainer)
+        set_attribute('body_content', body)
+        set_attribute('body_source', body_source)
+
+    @classmethod
+    def from_entry(cls, entry):
+        """ Make a new instance with the same fields as `entry`.
+
+            :param entry: The `ChangeLogEntry` to copy.
+            :return: A new instance of this class.
+            """
+        instance = cls(*entry.field_values(), body_source=entry.body_source)
+        return instance
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "{0.__class__.__name__} is immutable".format(self))
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            "{0.__class__.__name__} is immutable".format(self))
+
+    def __reduce__(self):
+        return (
+            functools.partial(type(self), body_source=self.body_source),
+            self.field_values())
+
+    @property
+    def body(self):
+        """ The body text of this entry, or ``None``.
+
+            If the body was specified as a `DeferredValue`, its value is
+            computed when this is first accessed.
+            """
+        result = DeferredValue.resolve(self.body_content)
         return result
 
+    __repr__ = ChangeLogEntry.__repr__
+
+    parse_release_date = ChangeLogEntry.__dict__['parse_release_date']
+    validate_release_date = ChangeLogEntry.__dict__['validate_release_date']
+    parse_version = ChangeLogEntry.__dict__['parse_version']
+    validate_version = ChangeLogEntry.__dict__['validate_version']
+    validate_maintainer = ChangeLogEntry.__dict__['validate_maintainer']
+    make_ordered_dict = ChangeLogEntry.__dict__['make_ordered_dict']
+    field_values = ChangeLogEntry.field_values
+    as_version_info_entry = ChangeLogEntry.as_version_info_entry
+    __eq__ = ChangeLogEntry.__eq__
+
+    def __hash__(self):
+        return hash(self.field_values())
+
 
+class ChangeLogEntryTable:
+    """ Columnar collection of Change Log entries.
+
+        The fields of the entries are stored in parallel columns: release
+        dates as an array of integer codes, versions as arrays of their
+        integer components, and text fields as integer indices into a pool
+        of distinct strings. This stores many entries compactly, and allows
+        filtering and sorting on a column without making an object for each
+        entry.
+
+        Each row is presented as a `ChangeLogEntryTableRow`, which behaves
+        like a `ChangeLogEntry`.
+        """
+
+    release_date_unknown_code = 0
+    release_date_future_code = datetime.date.max.toordinal() + 1
+    special_release_date_codes = {
+        unknown_value: release_date_unknown_code,
+        future_value: release_date_future_code,
+    }
+
+    version_unknown_rank = unknown_value.rank
+    version_next_rank = next_value.rank
+    special_version_ranks = {
+        unknown_value: version_unknown_rank,
+        next_value: version_next_rank,
+    }
+
+    no_string_index = -1
+
+    sort_column_names = ['release_date', 'version', 'maintainer']
+
+    def __init__(self):
+        """ Set up a new, empty instance. """
+        self.strings = []
+        self.string_indices = {}
+        self.release_date_codes = array.array('q')
+        self.release_date_texts = {}
+        self.version_text_indices = array.array('q')
+        self.version_ranks = array.array('b')
+        self.version_majors = array.array('q')
+        self.version_minors = array.array('q')
+        self.version_patches = array.array('q')
+        self.version_prerelease_indices = array.array('q')
+        self.maintainer_indices = array.array('q')
+        self.bodies = []
+        self.body_sources = []
+
+    @classmethod
+    def from_entries(cls, entries):
+        """ Make a new instance containing the `entries`.
+
+            :param entries: Iterable of `ChangeLogEntry` instances, such as
+                the result of `make_change_log_entries_from_document`.
+            :return: A new instance of this class.
+            """
+        table = cls()
+        table.extend(entries)
+        return table
+
+    def __len__(self):
+        return len(self.release_date_codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            result = self.take(range(len(self))[index])
+        else:
+            result = ChangeLogEntryTableRow(self, range(len(self))[index])
+        return result
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield ChangeLogEntryTableRow(self, index)
+
+    def __repr__(self):
+        """ Programmer representation text of this instance. """
+        text = "<{0.__class__.__name__}: {1} entries>".format(self, len(self))
+        return text
+
+    def intern_string(self, text):
+        """ Get the index of `text` in the string pool of this table.
+
+            :param text: The text to look up, or ``None``.
+            :return: The index (integer) of `text` in `strings`, added to
+                the pool if it is not already there; or `no_string_index`
+                if `text` is ``None``.
+            """
+        if text is None:
+            result = self.no_string_index
+        else:
+            result = self.string_indices.get(text)
+            if result is None:
+                result = len(self.strings)
+                self.strings.append(text)
+                self.string_indices[text] = result
+        return result
+
+    def get_string(self, index):
+        """ Get the text at `index` in the string pool of this table.
+
+            :param index: The index (integer) in `strings`, or
+                `no_string_index`.
+            :return: The text at `index`, or ``None`` if `index` is
+                `no_string_index`.
+            """
+        result = None if (index == self.no_string_index) else (
+            self.strings[index])
+        return result
+
+    @classmethod
+    def get_release_date_code(cls, value):
+        """ Get the integer code of the release date `value`.
+
+            :param value: A `datetime.date` or release date `SpecialValue`.
+            :return: The code (integer) representing `value`. The codes sort
+                in the same order as the values.
+            """
+        if isinstance(value, SpecialValue):
+            result = cls.special_release_date_codes[value]
+        else:
+            result = value.toordinal()
+        return result
+
+    @classmethod
+    def get_release_date_value(cls, code):
+        """ Get the release date value represented by `code`.
+
+            :param code: The code (integer) representing the value.
+            :return: The `datetime.date` or release date `SpecialValue`.
+            """
+        if code == cls.release_date_unknown_code:
+            result = unknown_value
+        elif code == cls.release_date_future_code:
+            result = future_value
+        else:
+            result = datetime.date.fromordinal(code)
+        return result
+
+    def append(self, entry):
+        """ Append the fields of `entry` as a new row of this table.
+
+            :param entry: The `ChangeLogEntry` to append.
+            :return: ``None``.
+
+            The release date and version values already parsed for `entry`
+            are used; they are parsed from the text only for an object that
+            does not have them.
+            """
+        release_date_value = getattr(entry, 'release_date_value', None)
+        if release_date_value is None:
+            release_date_value = ChangeLogEntry.parse_release_date(
+                entry.release_date)
+        version_info = getattr(entry, 'version_info', None)
+        if version_info is None:
+            version_info = ChangeLogEntry.parse_version(entry.version)
+
+        release_date_code = self.get_release_date_code(release_date_value)
+        if (
+                str(self.get_release_date_value(release_date_code))
+                != entry.release_date):
+            self.release_date_texts[len(self)] = entry.release_date
+
+        if isinstance(version_info, SpecialValue):
+            version_rank = self.special_version_ranks[version_info]
+            version_numbers = (0, 0, 0)
+            version_prerelease = None
+        else:
+            version_rank = 0
+            version_numbers = (
+                version_info.major, version_info.minor, version_info.patch)
+            version_prerelease = version_info.prerelease
+
+        self.release_date_codes.append(release_date_code)
+        self.version_text_indices.append(self.intern_string(entry.version))
+        self.version_ranks.append(version_rank)
+        self.version_majors.append(version_numbers[0])
+        self.version_minors.append(version_numbers[1])
+        self.version_patches.append(version_numbers[2])
+        self.version_prerelease_indices.append(
+            self.intern_string(version_prerelease))
+        self.maintainer_indices.append(self.intern_string(entry.maintainer))
+        self.bodies.append(entry.body)
+        self.body_sources.append(entry.body_source)
+
+    def extend(self, entries):
+        """ Append the fields of each of `entries` as rows of this table.
+
+            :param entries: Iterable of `ChangeLogEntry` instances.
+            :return: ``None``.
+            """
+        for entry in entries:
+            self.append(entry)
+
+    def take(self, indices):
+        """ Make a new table from the rows at `indices`.
+
+            :param indices: Iterable of row indices (integer), in the order
+                of the rows for the new table.
+            :return: A new instance of this class.
+
+            The new table shares the string pool of this table.
+            """
+        indices = list(indices)
+        table = type(self)()
+        table.strings = self.strings
+        table.string_indices = self.string_indices
+        for name in [
+                'release_date_codes',
+                'version_text_indices',
+                'version_ranks',
+                'version_majors',
+                'version_minors',
+                'version_patches',
+                'version_prerelease_indices',
+                'maintainer_indices',
+        ]:
+            column = getattr(self, name)
+            getattr(table, name).extend(column[index] for index in indices)
+        table.bodies = [self.bodies[index] for index in indices]
+        table.body_sources = [self.body_sources[index] for index in indices]
+        table.release_date_texts = {
+            new_index: self.release_date_texts[index]
+            for (new_index, index) in enumerate(indices)
+            if index in self.release_date_texts}
+        return table
+
+    def where(self, mask):
+        """ Make a new table from the rows selected by `mask`.
+
+            :param mask: Sequence of boolean values, one for each row.
+            :return: A new instance of this class, with the rows for which
+                `mask` is true.
+            """
+        result = self.take(itertools.compress(range(len(self)), mask))
+        return result
+
+    def release_date_mask(self, *, start=None, end=None):
+        """ Get the mask of rows with release date from `start` to `end`.
+
+            :param start: The earliest release date (a `datetime.date` or
+                `SpecialValue`) to select, or ``None`` for no limit.
+            :param end: The latest release date (a `datetime.date` or
+                `SpecialValue`) to select, or ``None`` for no limit.
+            :return: A list of boolean values, one for each row.
+            """
+        start_code = (
+            self.release_date_unknown_code if start is None
+            else self.get_release_date_code(start))
+        end_code = (
+            self.release_date_future_code if end is None
+            else self.get_release_date_code(end))
+        result = [
+            (start_code <= code <= end_code)
+            for code in self.release_date_codes]
+        return result
+
+    def maintainer_mask(self, maintainer):
+        """ Get the mask of rows with the specified `maintainer`.
+
+            :param maintainer: The maintainer text to select.
+            :return: A list of boolean values, one for each row.
+            """
+        maintainer_index = self.string_indices.get(maintainer)
+        if maintainer is None:
+            maintainer_index = self.no_string_index
+        result = [
+            (index == maintainer_index) for index in self.maintainer_indices]
+        return result
+
+    def get_version_sort_key(self, index):
+        """ Get the sort key for the version of the row at `index`.
+
+            :param index: The row index (integer).
+            :return: A tuple which sorts in the order of Semantic Version
+                precedence, with special versions before or after every
+                other version.
+            """
+        prerelease = self.get_string(self.version_prerelease_indices[index])
+        if prerelease is None:
+            prerelease_key = (1,)
+        else:
+            prerelease_key = (0, tuple(
+                (0, int(part), "") if part.isdigit() else (1, 0, part)
+                for part in prerelease.split(".")))
+        result = (
+            self.version_ranks[index],
+            self.version_majors[index],
+            self.version_minors[index],
+            self.version_patches[index],
+            prerelease_key)
+        return result
+
+    def get_maintainer_sort_key(self, index):
+        """ Get the sort key for the maintainer of the row at `index`.
+
+            :param index: The row index (integer).
+            :return: A tuple which sorts rows with no maintainer first,
+                then by maintainer text.
+            """
+        maintainer = self.get_string(self.maintainer_indices[index])
+        result = (maintainer is not None, maintainer or "")
+        return result
+
+    def sort_indices(self, *column_names, reverse=False):
+        """ Get the row indices in order of the values in `column_names`.
+
+            :param column_names: Names of the columns to sort by, each one
+                of `sort_column_names`; later columns break ties in earlier
+                ones.
+            :param reverse: If true, sort in descending order.
+            :return: A list of row indices (integer).
+            :raises ValueError: If a column name is not one of
+                `sort_column_names`.
+            """
+        key_getters = []
+        for name in column_names:
+            if name == 'release_date':
+                key_getters.append(self.release_date_codes.__getitem__)
+            elif name == 'version':
+                key_getters.append(self.get_version_sort_key)
+            elif name == 'maintainer':
+                key_getters.append(self.get_maintainer_sort_key)
+            else:
+                raise ValueError(
+                    "not a sortable column: {!r}".format(name))
+        result = sorted(
+            range(len(self)),
+            key=(lambda index: tuple(
+                get_key(index) for get_key in key_getters)),
+            reverse=reverse)
+        return result
+
+    def sorted_by(self, *column_names, reverse=False):
+        """ Make a new table with rows sorted by `column_names`.
+
+            :param column_names: Names of the columns to sort by, as for
+                `sort_indices`.
+            :param reverse: If true, sort in descending order.
+            :return: A new instance of this class.
+            :raises ValueError: If a column name is not one of
+                `sort_column_names`.
+            """
+        result = self.take(
+            self.sort_indices(*column_names, reverse=reverse))
+        return result
+
+
+class ChangeLogEntryTableRow:
+    """ View of a single row in a `ChangeLogEntryTable`.
+
+        This has the same attributes and methods as `ChangeLogEntry`,
+        reading its field values from the table columns. Rows compare
+        equal when their fields are equal; use `to_entry` to compare with
+        a `ChangeLogEntry`.
+        """
+
+    __slots__ = ['table', 'index']
+
+    field_names = ChangeLogEntry.field_names
+    field_values_getter = ChangeLogEntry.field_values_getter
+
+    def __init__(self, table, index):
+        """ Set up a new instance.
+
+            :param table: The `ChangeLogEntryTable` containing the row.
+            :param index: The index (integer) of the row in `table`.
+            """
+        self.table = table
+        self.index = index
+
+    @property
+    def release_date_value(self):
+        """ The release date, as a `datetime.date` or `SpecialValue`. """
+        result = self.table.get_release_date_value(
+            self.table.release_date_codes[self.index])
+        return result
+
+    @property
+    def release_date(self):
+        """ The release date text. """
+        result = self.table.release_date_texts.get(self.index)
+        if result is None:
+            result = str(self.release_date_value)
+        return result
+
+    @property
+    def version(self):
+        """ The version text. """
+        result = self.table.get_string(
+            self.table.version_text_indices[self.index])
+        return result
+
+    @property
+    def version_info(self):
+        """ The version, as a `semver.Version` or `SpecialValue`. """
+        result = ChangeLogEntry.parse_version(self.version)
+        return result
+
+    @property
+    def maintainer(self):
+        """ The maintainer text, or ``None``. """
+        result = self.table.get_string(
+            self.table.maintainer_indices[self.index])
+        return result
+
+    @property
+    def body(self):
+        """ The body text, or ``None``. """
+        result = self.table.bodies[self.index]
+        return result
+
+    @property
+    def body_source(self):
+        """ The `TextSpan` of the body source text, or ``None``. """
+        result = self.table.body_sources[self.index]
+        return result
+
+    def to_entry(self):
+        """ Make a `ChangeLogEntry` with the fields of this row. """
+        entry = ChangeLogEntry(
+            *self.field_values(), body_source=self.body_source)
+        return entry
+
+    __repr__ = ChangeLogEntry.__repr__
+
+    make_ordered_dict = ChangeLogEntry.__dict__['make_ordered_dict']
+    field_values = ChangeLogEntry.field_values
+    as_version_info_entry = ChangeLogEntry.as_version_info_entry
+
+    __eq__ = ChangeLogEntry.__eq__
+    __hash__ = None
+
+
+EntryDiagnostic = collections.namedtuple(
+    'EntryDiagnostic', ['entry_index', 'field_name', 'line', 'message'])
+""" A problem found in a Change Log entry.
+
+    The `entry_index` is the (0-based) position of the entry. The
+    `field_name` is one of `ChangeLogEntry.field_names`, or ``None`` for a
+    problem with the entry as a whole. The `line` is the (1-based) line
+    number in the document, or ``None`` if not known.
+    """
+
+
+canonical_date_regex = re.compile(
+    r"(?P<year>[0-9]{4})-(?P<month>[0-9]{2})-(?P<day>[0-9]{2})")
+""" Regular Expression pattern to match a date in canonical form. """
+
+
+@functools.lru_cache(maxsize=VersionParseCache.default_max_size)
+def get_parsed_value_problem(parse, value):
+    """ Get the problem, if any, from parsing `value` with `parse`.
+
+        :param parse: The function to parse the value, which raises
+            `ValueError` if the value is invalid.
+        :param value: The value (text) to parse.
+        :return: The text of the error message, or ``None`` if the value
+            is valid.
+
+        The result is cached, so each distinct invalid value raises an
+        exception only the first time it is parsed.
+        """
+    try:
+        __ = parse(value)
+    except ValueError as exc:
+        result = str(exc)
+    else:
+        result = None
+    return result
+
+
+def get_release_date_problem(value):
+    """ Get the problem, if any, with the `release_date` value.
+
+        :param value: The prospective `release_date` value.
+        :return: Text describing the problem, or ``None`` if the value is
+            valid.
+
+        A date in the canonical form is checked without parsing it.
+        """
+    if not isinstance(value, str):
+        return "not a text string: {!r}".format(value)
+    if value in special_release_date_values:
+        return None
+    result = "not a valid date: {!r}".format(value)
+    date_match = canonical_date_regex.fullmatch(value)
+    if date_match is not None:
+        (year, month, day) = map(
+            int, date_match.group('year', 'month', 'day'))
+        try:
+            datetime.date(year, month, day)
+        except ValueError:
+            pass
+        else:
+            result = None
+    elif get_parsed_value_problem(
+            ChangeLogEntry.parse_release_date, value) is None:
+        result = None
+    return result
+
+
+def get_version_problem(value):
+    """ Get the problem, if any, with the `version` value.
+
+        :param value: The prospective `version` value.
+        :return: Text describing the problem, or ``None`` if the value is
+            valid.
+        """
+    if not isinstance(value, str):
+        return "not a text string: {!r}".format(value)
+    result = None
+    if get_parsed_value_problem(ChangeLogEntry.parse_version, value):
+        result = "not a valid version: {!r}".format(value)
+    return result
+
+
+def get_maintainer_problem(value):
+    """ Get the problem, if any, with the `maintainer` value.
+
+        :param value: The prospective `maintainer` value.
+        :return: Text describing the problem, or ``None`` if the value is
+            valid.
+        """
+    result = None
+    if value is None:
+        pass
+    elif not isinstance(value, str):
+        result = "not a text string: {!r}".format(value)
+    elif not rfc822_person_regex.search(value):
+        result = "not a valid person specification {!r}".format(value)
+    return result
+
+
+field_problem_getters = {
+    'release_date': get_release_date_problem,
+    'version': get_version_problem,
+    'maintainer': get_maintainer_problem,
+}
+""" Mapping from entry field name, to function that gets a value's problem.
+    """
+
+
+def generate_entry_diagnostics(entry_index, fields, *, field_lines=None):
+    """ Generate the diagnostics for the `fields` of one entry.
+
+        :param entry_index: The (0-based) position of the entry.
+        :param fields: Mapping of field name to value, for the fields of
+            the entry.
+        :param field_lines: Mapping of field name to (1-based) line number
+            in the document, or ``None`` if not known.
+        :return: Generator of `EntryDiagnostic` instances, for each field
+            value in `fields` that is not valid.
+        """
+    if field_lines is None:
+        field_lines = {}
+    for (field_name, get_problem) in field_problem_getters.items():
+        if field_name not in fields:
+            continue
+        message = get_problem(fields[field_name])
+        if message is not None:
+            yield EntryDiagnostic(
+                entry_index, field_name, field_lines.get(field_name),
+                message)
+
+
+def validate_entries(entries):
+    """ Get the diagnostics for all the invalid field values in `entries`.
+
+        :param entries: Iterable of mappings of field name to value, one for
+            each entry, as from `ChangeLogEntry.as_version_info_entry`.
+        :return: A sequence of `EntryDiagnostic` instances, in entry order.
+
+        Unlike making a `ChangeLogEntry`, this does not stop at the first
+        invalid value; and it does not raise an exception for each one.
+        """
+    diagnostics = [
+        diagnostic
+        for (entry_index, fields) in enumerate(entries)
+        for diagnostic in generate_entry_diagnostics(entry_index, fields)]
+    return diagnostics
+
+
+def get_field_sort_key(value, parse):
+    """ Get a sort key for the field `value`, parsed by `parse`.
+
+        :param value: The field value (text), or ``None``.
+        :param parse: The function to parse `value`; it returns a parsed
+            value or `SpecialValue`, or raises `ValueError`.
+        :return: A tuple which sorts in order of the parsed values: first
+            ``None`` or a `SpecialValue` of negative rank; then the parsed
+            values; then any text that is not valid for the field; then a
+            `SpecialValue` of positive rank.
+        """
+    if value is None:
+        parsed_value = unknown_value
+    else:
+        try:
+            parsed_value = parse(value)
+        except ValueError:
+            parsed_value = None
+
+    if parsed_value is None:
+        result = (2, value)
+    elif isinstance(parsed_value, SpecialValue):
+        result = ((0 if parsed_value.rank < 0 else 3), 0)
+    else:
+        result = (1, parsed_value)
+    return result
+
+
+def get_version_sort_key(fields):
+    """ Get the sort key for the changelog entry `fields`.
+
+        :param fields: A mapping of fields for a changelog entry.
+        :return: A tuple which sorts in order of release date, then in
+            order of Semantic Version precedence.
+
+        Each field is sorted as described for `get_field_sort_key`.
+        """
+    result = (
+        get_field_sort_key(
+            fields['release_date'], ChangeLogEntry.parse_release_date),
+        get_field_sort_key(
+            fields['version'], ChangeLogEntry.parse_version),
+    )
+    return result
+
+
 def get_latest_version(versions):
     """ Get the latest version from a collection of changelog entries.
 
-        :param versions: A collection of mappings for changelog entries.
+        :param versions: An iterable of mappings for changelog entries.
         :return: An ordered mapping of fields for the latest version,
             if `versions` is non-empty; otherwise, an empty mapping.
+
+        The latest version is the one with the latest release date; of
+        versions with the same release date, the one with the highest
+        Semantic Version precedence; of versions that are otherwise equal,
+        the first one in `versions`.
         """
     version_info = collections.OrderedDict()
 
-    versions_by_release_date = {
-        item['release_date']: item
-        for item in versions}
-    if versions_by_release_date:
-        latest_release_date = max(versions_by_release_date.keys())
-        version_info = ChangeLogEntry.make_ordered_dict(
-            versions_by_release_date[latest_release_date])
+    latest_version = max(versions, key=get_version_sort_key, default=None)
+    if latest_version is not None:
+        version_info = ChangeLogEntry.make_ordered_dict(latest_version)
 
     return version_info
 
+
+def get_latest_versions(versions, count):
+    """ Get the `count` latest versions from changelog entries.
+
+        :param versions: An iterable of mappings for changelog entries.
+        :param count: The maximum number (integer) of versions to get.
+        :return: A list of ordered mappings of fields for the latest
+            versions, in order from the latest.
+
+        Versions are ordered as for `get_latest_version`. This keeps only
+        `count` versions at once, in a heap.
+        """
+    latest_versions = heapq.nlargest(
+        count, versions, key=get_version_sort_key)
+    result = [
+        ChangeLogEntry.make_ordered_dict(version)
+        for version in latest_versions]
+    return result
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
@@ -5,7 +5,14 @@
 # certain conditions; see the end of this file for copyright
 # information, grant of license, and disclaimer of warranty.
 
-""" Parsers for various input formats of Change Log document. """
+""" Parsers for various input formats of Change Log document.
+
+    The names from `batch` and `incremental` are imported only when first
+    used, since those modules import the `rest` parser and, with it,
+    Docutils.
+    """
+
+import importlib
 
 from .core import (
     InvalidFormatError,
@@ -13,14 +20,52 @@ from .core import (
     get_changelog_document_text,
     parse_person_field,
 )
+from .instrumentation import (
+    SummaryObserver,
+    observing,
+)
 
 __all__ = [
+    'DocumentParseError',
+    'DocumentParseResult',
+    'IncrementalChangeLogParser',
     'InvalidFormatError',
+    'SummaryObserver',
     'entry_title_regex',
     'get_changelog_document_text',
+    'iter_parse_many',
+    'observing',
+    'parse_many',
     'parse_person_field',
 ]
 
+lazy_module_name_by_name = {
+    'DocumentParseError': '.batch',
+    'DocumentParseResult': '.batch',
+    'IncrementalChangeLogParser': '.incremental',
+    'iter_parse_many': '.batch',
+    'parse_many': '.batch',
+}
+""" Mapping of public name, to the module to import it from when used. """
+
+
+def __getattr__(name):
+    """ Get the attribute `name` of this package, importing it if needed.
+
+        :param name: The name of the attribute.
+        :return: The object named `name` in its module.
+        :raises AttributeError: If `name` is not an attribute of this
+            package.
+        """
+    if name not in lazy_module_name_by_name:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    module = importlib.import_module(
+        lazy_module_name_by_name[name], package=__name__)
+    result = getattr(module, name)
+    globals()[name] = result
+    return result
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
@@ -0,0 +1,208 @@
+# src/chug/parsers/batch.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Parsing of many Change Log documents, in parallel worker processes.
+
+    Documents are parsed in chunks, each chunk by one worker process. Each
+    document gets a `DocumentParseResult`, with either the entries parsed
+    from the document or the error that prevented parsing it; so one bad
+    document does not stop the parsing of the others.
+    """
+
+import collections
+import concurrent.futures
+import math
+import os
+
+from . import rest
+from .. import model
+
+
+class DocumentParseError(ValueError):
+    """ Raised when a document in a batch could not be parsed.
+
+        This records the type and message of the original error as text, so
+        it can be passed from a worker process even when the original error
+        cannot.
+        """
+
+    def __init__(self, infile_path, error_type_name, message):
+        super().__init__(infile_path, error_type_name, message)
+        self.infile_path = infile_path
+        self.error_type_name = error_type_name
+        self.message = message
+
+    def __str__(self):
+        text = "{path}: {type_name}: {message}".format(
+            path=self.infile_path, type_name=self.error_type_name,
+            message=self.message)
+        return text
+
+
+DocumentParseResult = collections.namedtuple(
+    'DocumentParseResult', ['infile_path', 'entries', 'error'])
+""" The result of parsing one document in a batch.
+
+    The `entries` are a sequence of `model.CompactChangeLogEntry` instances,
+    or ``None`` if the document could not be parsed; in which case `error`
+    is the `DocumentParseError`, otherwise ``None``.
+    """
+
+
+tasks_per_worker = 4
+""" Number of chunks of documents to submit, by default, for each worker. """
+
+
+def parse_document(infile_path):
+    """ Parse the document at `infile_path`, capturing any error.
+
+        :param infile_path: Filesystem path of the document to read.
+        :return: The `DocumentParseResult` for the document.
+
+        The entries are made as `model.CompactChangeLogEntry` instances,
+        which are small to pass between processes; they do not refer to
+        the document text, so their `body_source` is ``None``.
+        """
+    try:
+        entries = [
+            model.CompactChangeLogEntry(*entry.field_values())
+            for entry in rest.make_change_log_entries_from_file(infile_path)]
+    except Exception as exc:
+        error = DocumentParseError(
+            infile_path, type(exc).__name__, str(exc))
+        result = DocumentParseResult(infile_path, None, error)
+    else:
+        result = DocumentParseResult(infile_path, entries, None)
+    return result
+
+
+def parse_documents(infile_paths):
+    """ Parse each of the documents at `infile_paths`.
+
+        :param infile_paths: Sequence of filesystem paths of documents.
+        :return: A sequence of `DocumentParseResult`, one for each path in
+            the same order.
+        """
+    results = [parse_document(infile_path) for infile_path in infile_paths]
+    return results
+
+
+def get_path_chunks(infile_paths, *, workers, chunk_size=None):
+    """ Get the chunks of `infile_paths` to submit as tasks.
+
+        :param infile_paths: Sequence of filesystem paths of documents.
+        :param workers: The number of worker processes.
+        :param chunk_size: The number (integer) of documents in each chunk.
+            If ``None``, make `tasks_per_worker` chunks for each worker.
+        :return: A sequence of the chunks of `infile_paths`, in order.
+        :raises ValueError: If `chunk_size` is less than 1.
+        """
+    if chunk_size is None:
+        chunk_size = max(
+            1, math.ceil(len(infile_paths) / (workers * tasks_per_worker)))
+    if chunk_size < 1:
+        raise ValueError(
+            "chunk size must be at least 1: {!r}".format(chunk_size))
+    chunks = [
+        infile_paths[index:(index + chunk_size)]
+        for index in range(0, len(infile_paths), chunk_size)]
+    return chunks
+
+
+def get_worker_count(workers):
+    """ Get the number of worker processes to use for `workers`.
+
+        :param workers: The number (integer) of worker processes requested,
+            or ``None`` for the number of processors.
+        :return: The number (integer) of worker processes.
+        :raises ValueError: If `workers` is less than 1.
+        """
+    result = workers if workers is not None else (os.cpu_count() or 1)
+    if result < 1:
+        raise ValueError(
+            "number of workers must be at least 1: {!r}".format(result))
+    return result
+
+
+def iter_parse_many(infile_paths, workers=None, *, chunk_size=None):
+    """ Generate the results of parsing `infile_paths`, as they complete.
+
+        :param infile_paths: Iterable of filesystem paths of documents.
+        :param workers: The number (integer) of worker processes, or
+            ``None`` for the number of processors. If 1, the documents are
+            parsed in this process.
+        :param chunk_size: The number (integer) of documents for each task
+            submitted to a worker, or ``None`` to make `tasks_per_worker`
+            tasks for each worker.
+        :return: Generator of `DocumentParseResult` instances, one for each
+            document, in the order the chunks of documents are completed.
+        :raises ValueError: If `workers` or `chunk_size` is less than 1.
+        """
+    workers = get_worker_count(workers)
+    chunks = get_path_chunks(
+        list(infile_paths), workers=workers, chunk_size=chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield from parse_documents(chunk)
+        return
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(parse_documents, chunk) for chunk in chunks]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def parse_many(infile_paths, workers=None, *, chunk_size=None):
+    """ Parse the documents at `infile_paths`, in worker processes.
+
+        :param infile_paths: Iterable of filesystem paths of documents.
+        :param workers: The number (integer) of worker processes, or
+            ``None`` for the number of processors. If 1, the documents are
+            parsed in this process.
+        :param chunk_size: The number (integer) of documents for each task
+            submitted to a worker, or ``None`` to make `tasks_per_worker`
+            tasks for each worker.
+        :return: A sequence of `DocumentParseResult` instances, one for each
+            document, in the same order as `infile_paths`.
+        :raises ValueError: If `workers` or `chunk_size` is less than 1.
+
+        An error parsing any document is captured in its result; see
+        `iter_parse_many` to get each result as soon as it is complete.
+        """
+    workers = get_worker_count(workers)
+    chunks = get_path_chunks(
+        list(infile_paths), workers=workers, chunk_size=chunk_size)
+    if workers == 1:
+        results = [
+            result for chunk in chunks for result in parse_documents(chunk)]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(parse_documents, chunk) for chunk in chunks]
+            results = [
+                result
+                for future in futures
+                for result in future.result()]
+    return results
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
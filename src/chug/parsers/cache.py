@@ -0,0 +1,224 @@
+# src/chug/parsers/cache.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" On-disk cache of Change Log entries parsed from documents.
+
+    Each cached item is the list of entries parsed from one document, keyed
+    by a hash of the document text and of the library version. A document
+    that has not changed since it was last parsed, by the same version of
+    this library, can then be read from the cache instead of parsed again.
+    """
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import pathlib
+import tempfile
+
+from . import rest
+from .. import model
+
+
+distribution_name = "changelog-chug"
+""" Name of the distribution, to query its installed version. """
+
+cache_format_version = 2
+""" Version of the format of cached items; change it to invalidate them. """
+
+
+def get_library_version():
+    """ Get the version of this library, for use in cache keys.
+
+        :return: The installed version (text) of the distribution, or
+            ``"UNKNOWN"`` if it is not installed.
+        """
+    try:
+        version = importlib.metadata.version(distribution_name)
+    except importlib.metadata.PackageNotFoundError:
+        version = "UNKNOWN"
+    return version
+
+
+def get_default_cache_directory_path():
+    """ Get the default path of the cache directory.
+
+        :return: The `pathlib.Path` of the ‘changelog-chug’ directory, in
+            the directory named by the ‘XDG_CACHE_HOME’ environment variable
+            or, if that is not set, in ‘~/.cache’.
+        """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser("~"), ".cache")
+    path = pathlib.Path(cache_home, distribution_name)
+    return path
+
+
+class ChangeLogEntryCache:
+    """ Cache of Change Log entries, stored in a filesystem directory.
+
+        Each item is stored in a separate file, named for its key. When the
+        total size of the items is more than `max_size`, the items least
+        recently used are removed.
+
+        Any error reading or writing the cache is treated as a cache miss;
+        the cache never causes parsing to fail.
+        """
+
+    default_max_size = 16 * 1024 * 1024
+    item_file_suffix = ".json"
+
+    def __init__(self, directory_path=None, *, max_size=default_max_size):
+        """ Set up a new instance.
+
+            :param directory_path: Filesystem path of the cache directory.
+                If ``None``, use the `get_default_cache_directory_path`.
+            :param max_size: Maximum total size (integer, in bytes) of the
+                cached items.
+            """
+        self.directory_path = pathlib.Path(
+            get_default_cache_directory_path() if directory_path is None
+            else directory_path)
+        self.max_size = max_size
+        self.library_version = get_library_version()
+
+    def get_key(self, document_text):
+        """ Get the cache key for `document_text`.
+
+            :param document_text: Text of the document.
+            :return: The key (text) for the document and library version.
+            """
+        key_hash = hashlib.sha256()
+        for item in [
+                str(cache_format_version), self.library_version,
+                document_text]:
+            key_hash.update(item.encode('utf-8'))
+            key_hash.update(b"\0")
+        key = key_hash.hexdigest()
+        return key
+
+    def get_item_path(self, key):
+        """ Get the filesystem path of the item for `key`. """
+        path = self.directory_path.joinpath(key + self.item_file_suffix)
+        return path
+
+    def get(self, document_text):
+        """ Get the cached entries for `document_text`, if any.
+
+            :param document_text: Text of the document.
+            :return: A sequence of `model.ChangeLogEntry` instances, or
+                ``None`` if there is no valid cached item.
+            """
+        item_path = self.get_item_path(self.get_key(document_text))
+        try:
+            with item_path.open(encoding='utf-8') as infile:
+                entries_fields = json.load(infile)
+            entries = [
+                model.ChangeLogEntry(
+                    **fields, body_source=(
+                        None if body_source_offsets is None
+                        else model.TextSpan(
+                            document_text, *body_source_offsets)))
+                for (fields, body_source_offsets) in entries_fields]
+            # Mark the item as recently used.
+            os.utime(item_path)
+        except (OSError, ValueError, TypeError):
+            entries = None
+        return entries
+
+    def put(self, document_text, entries):
+        """ Store the `entries` for `document_text` in the cache.
+
+            :param document_text: Text of the document.
+            :param entries: Sequence of `model.ChangeLogEntry` instances.
+            :return: ``None``.
+
+            The item is written to a temporary file, which is then renamed
+            to the item path; so another process never reads a partly
+            written item.
+            """
+        content = json.dumps([
+            (
+                entry.as_version_info_entry(),
+                (None if entry.body_source is None else [
+                    entry.body_source.start, entry.body_source.end]))
+            for entry in entries])
+        item_path = self.get_item_path(self.get_key(document_text))
+        try:
+            self.directory_path.mkdir(parents=True, exist_ok=True)
+            (outfile_fd, temp_path) = tempfile.mkstemp(
+                dir=self.directory_path, prefix=".tmp-")
+            try:
+                with os.fdopen(outfile_fd, 'w', encoding='utf-8') as outfile:
+                    outfile.write(content)
+                os.replace(temp_path, item_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+            self.evict()
+        except OSError:
+            # Failing to store the item is not fatal.
+            pass
+
+    def evict(self):
+        """ Remove the least recently used items, to fit `max_size`.
+
+            :return: ``None``.
+            """
+        items = []
+        for item_path in self.directory_path.glob(
+                "*" + self.item_file_suffix):
+            try:
+                item_stat = item_path.stat()
+            except OSError:
+                # The item is already gone.
+                continue
+            items.append((item_stat.st_mtime, item_stat.st_size, item_path))
+        total_size = sum(size for (__, size, __) in items)
+        for (__, size, item_path) in sorted(items):
+            if total_size <= self.max_size:
+                break
+            try:
+                item_path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+
+    def make_change_log_entries_from_text(self, document_text):
+        """ Make sequence of `ChangeLogEntry`, using the cache.
+
+            :param document_text: Text of the document in reStructuredText
+                format.
+            :return: A sequence of `models.ChangeLogEntry` instances,
+                representing the Change Log entries from the document.
+            :raises TypeError: If `document_text` is not a text string.
+
+            If the entries for `document_text` are not in the cache, parse
+            the document with `rest.make_change_log_entries_from_text`, and
+            store the result in the cache.
+            """
+        if not isinstance(document_text, str):
+            raise TypeError("not a text string: {!r}".format(document_text))
+        entries = self.get(document_text)
+        if entries is None:
+            entries = rest.make_change_log_entries_from_text(document_text)
+            self.put(document_text, entries)
+        return entries
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -8,11 +8,18 @@
 """ Core functionality for document parsers. """
 
 import collections
+import itertools
+import mmap
+import os
 import re
+import stat
 
-import semver
-
-from ..model import rfc822_person_regex
+from . import instrumentation
+from ..model import (
+    TextSpan,
+    rfc822_person_regex,
+    version_parse_cache,
+)
 
 
 class InvalidFormatError(ValueError):
@@ -76,12 +83,217 @@ def get_changelog_document_text(infile_path):
 
         :param infile_path: Filesystem path of the document to read.
         :return: Text content from the file.
+
+        To read only part of a large document, use `ChangeLogDocumentFile`.
         """
-    with open(infile_path, encoding='utf-8') as infile:
-        text = infile.read()
+    with instrumentation.stage('read_file') as stage:
+        with open(infile_path, encoding='utf-8') as infile:
+            text = infile.read()
+        stage.add_counts(characters=len(text))
     return text
 
 
+special_whitespace_regex = re.compile(r"[\v\f]")
+""" Regular Expression pattern to match whitespace Docutils converts. """
+
+
+field_marker_regex = re.compile(
+    r"^:(?![: ])(?:[^:\\]|\\.|:(?!(?:[ `]|$)))*(?<! ):(?: +|$)")
+""" Regular Expression pattern to match a field marker, as Docutils does. """
+
+
+line_break_characters = "\r\n\x1c\x1d\x1e\x85\u2028\u2029"
+""" Characters that end a line, as Docutils reads the document text. """
+
+
+class DocumentSource:
+    """ The source text of a document, indexed by line.
+
+        Lines are counted as Docutils counts them: vertical tab and form
+        feed characters are whitespace, not line breaks. The text is
+        searched for line breaks only as far as the lines requested so far.
+        """
+
+    minimum_chunk_size = 64 * 1024
+
+    def __init__(self, text):
+        """ Set up a new instance.
+
+            :param text: The text of the document.
+            """
+        self.text = text
+        self.line_offsets = [0]
+        self.is_complete = False
+        self.chunk_size = self.minimum_chunk_size
+
+    def find_line_offsets(self, line_count):
+        """ Find the offsets of the first `line_count` lines, if not found.
+
+            :param line_count: The number (integer) of lines to find.
+            :return: ``None``.
+
+            After this, `line_offsets` has the offset of the start of each
+            line found, followed by the offset of the end of the last line.
+            """
+        while len(self.line_offsets) <= line_count and not self.is_complete:
+            # Split twice as much text each time, so finding all lines, a
+            # few at a time, takes linear time.
+            start = self.line_offsets[-1]
+            end = start + self.chunk_size
+            self.chunk_size *= 2
+            lines = special_whitespace_regex.sub(
+                " ", self.text[start:end]).splitlines(keepends=True)
+            if end < len(self.text):
+                # The last line might continue past the end of the chunk.
+                del lines[-1:]
+            else:
+                self.is_complete = True
+            self.line_offsets.extend(itertools.islice(
+                itertools.accumulate(map(len, lines), initial=start),
+                1, None))
+
+    def __len__(self):
+        self.find_line_offsets(len(self.text) + 1)
+        return (len(self.line_offsets) - 1)
+
+    def get_line(self, index):
+        """ Get the line of text at `index`, without its line ending.
+
+            :param index: The index (integer, 0-based) of the line.
+            :return: The text of the line.
+            :raises IndexError: If there is no line at `index`.
+            """
+        self.find_line_offsets(index + 1)
+        (start, end) = self.line_offsets[index:(index + 2)]
+        result = self.text[start:end].rstrip(line_break_characters)
+        return result
+
+    def get_field_list_end(self, index):
+        """ Get the index of the line following the field list at `index`.
+
+            :param index: The index (integer, 0-based) of the first line of
+                the field list.
+            :return: The index of the first line, after `index`, that is
+                not blank, not indented, and not a field marker; or the
+                number of lines if there is none.
+
+            As Docutils does, this treats blank lines between fields, and
+            indented lines following a field, as part of the field list.
+            """
+        while True:
+            self.find_line_offsets(index + 1)
+            if index >= (len(self.line_offsets) - 1):
+                break
+            line = self.get_line(index)
+            if (
+                    line.strip()
+                    and not line[0].isspace()
+                    and not field_marker_regex.match(line)):
+                break
+            index += 1
+        return index
+
+    def get_lines_span(self, start, end):
+        """ Get the span of text of the lines from `start` to `end`.
+
+            :param start: The index (integer, 0-based) of the first line.
+            :param end: The index (integer, 0-based) of the line following
+                the span.
+            :return: The `TextSpan` of the lines, with their line endings,
+                omitting any blank lines at the end.
+            """
+        self.find_line_offsets(end)
+        end = max(start, min(end, len(self.line_offsets) - 1))
+        while end > start and not self.get_line(end - 1).strip():
+            end -= 1
+        span = TextSpan(
+            self.text, self.line_offsets[start], self.line_offsets[end])
+        return span
+
+
+class ChangeLogDocumentFile:
+    """ A Change Log document file, mapped into memory where possible.
+
+        A regular file is memory-mapped, so its content is read only as
+        parts of it are used, and only the byte ranges that are decoded
+        become text. Any other file, such as a pipe, is read completely.
+
+        Instances are context managers, which close the file on exit.
+        """
+
+    encoding = 'utf-8'
+
+    def __init__(self, infile_path):
+        """ Set up a new instance.
+
+            :param infile_path: Filesystem path of the document to read.
+            """
+        self.infile_path = infile_path
+        self.content = None
+        with instrumentation.stage('read_file') as stage, open(
+                infile_path, 'rb') as infile:
+            infile_stat = os.fstat(infile.fileno())
+            if (
+                    stat.S_ISREG(infile_stat.st_mode)
+                    and infile_stat.st_size > 0):
+                try:
+                    self.content = mmap.mmap(
+                        infile.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # The file cannot be mapped; read it instead.
+                    pass
+            if self.content is None:
+                self.content = infile.read()
+            stage.add_counts(bytes=len(self.content))
+
+    @property
+    def is_mapped(self):
+        """ True iff the content of the file is memory-mapped. """
+        return isinstance(self.content, mmap.mmap)
+
+    def __len__(self):
+        return len(self.content)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """ Release the memory map of the file, if any. """
+        if self.is_mapped:
+            self.content.close()
+
+    def get_line_end(self, offset):
+        """ Get the offset of the end of the line containing `offset`.
+
+            :param offset: A byte offset (integer) in the file.
+            :return: The offset following the first line feed at or after
+                `offset`, or the size of the file if there is none.
+            """
+        index = self.content.find(b"\n", offset)
+        result = len(self) if (index < 0) else (index + 1)
+        return result
+
+    def decode(self, start=0, end=None):
+        """ Decode the text of the file content from `start` to `end`.
+
+            :param start: The byte offset (integer) of the start of the
+                range to decode.
+            :param end: The byte offset (integer) of the end of the range to
+                decode, or ``None`` for the end of the file.
+            :return: The text decoded from the byte range.
+            :raises UnicodeDecodeError: If the bytes are not valid in the
+                file `encoding`.
+            """
+        if end is None:
+            end = len(self)
+        with instrumentation.stage('decode', bytes=(end - start)):
+            text = self.content[start:end].decode(self.encoding)
+        return text
+
+
 entry_title_regex = re.compile(
     r"^version (?P<version>[\w.-]+)$",
     re.IGNORECASE)
@@ -147,8 +359,7 @@ def get_version_from_version_text(version_text):
             a Semantic Version value.
         """
     try:
-        version = semver.Version.parse(
-            version_text, optional_minor_and_patch=True)
+        version = version_parse_cache.parse(version_text)
     except ValueError as exc:
         raise VersionFormatInvalidError(version_text) from exc
     return version
@@ -0,0 +1,389 @@
+# src/chug/parsers/incremental.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Incremental parsing of a Change Log document that is edited.
+
+    A document being edited is parsed again after each change, though
+    usually only one entry (often the latest) has changed. The
+    `IncrementalChangeLogParser` splits the document at its entry titles,
+    and makes entries again only for those sections of the document whose
+    text has changed since the previous parse; the entries for the other
+    sections are reused.
+    """
+
+import bisect
+import collections
+import hashlib
+import itertools
+import re
+
+from . import (
+    core,
+    instrumentation,
+    rest,
+    scanner,
+)
+from .. import model
+
+
+EntrySection = collections.namedtuple(
+    'EntrySection', ['start', 'end', 'text', 'title', 'version'])
+""" The section of a document for one entry.
+
+    The section is from the start of the entry title (or of its overline)
+    to the start of the next entry title, or the end of the document. It
+    has the offsets of its `start` and `end` in the document, its `text`,
+    its entry `title`, and the `version` text from that title.
+    """
+
+
+entry_title_lines_regex = re.compile(
+    r"^(?P<title>version [^\n]*)\n(?P<underline>([!-/:-@\[-`{-~])\3*)$",
+    re.IGNORECASE | re.MULTILINE)
+""" Regular Expression pattern to match a possible entry title and underline.
+
+    This matches in the document lines joined by line feed characters. Each
+    match is then verified as an entry title.
+    """
+
+
+def split_entry_sections(document_text):
+    """ Split `document_text` into its preamble and its entry sections.
+
+        :param document_text: Text of the document in reStructuredText format.
+        :return: A 3-tuple (`preamble`, `style`, `sections`): the text
+            preceding the first entry title; the adornment style of the
+            entry titles, as for `scanner.Heading`; and the sequence of
+            `EntrySection` for the entries, in document order.
+        :raises TypeError: If `document_text` is not a text string.
+        :raises scanner.UnsupportedConstructError: If the document has no
+            entry titles, or if the entry titles do not all have the same
+            adornment style.
+
+        An entry title is a line matching `core.entry_title_regex`,
+        followed by an adornment line at least as long, and preceded by a
+        blank line or the start of the document.
+        """
+    lines = scanner.get_document_lines(document_text)
+    lines_text = "\n".join(lines)
+    line_starts = [0, *itertools.accumulate(
+        map((1).__add__, map(len, lines)))]
+    starts = []
+    titles = []
+    versions = []
+    styles = set()
+    for title_match in entry_title_lines_regex.finditer(lines_text):
+        (title, underline) = title_match.group('title', 'underline')
+        version_match = core.entry_title_regex.match(title)
+        if version_match is None or len(underline) < len(title):
+            continue
+        index = bisect.bisect(line_starts, title_match.start()) - 1
+        has_overline = (index > 0 and lines[index - 1] == underline)
+        start = (index - 1) if has_overline else index
+        if start > 0 and lines[start - 1]:
+            continue
+        starts.append(start)
+        titles.append(title)
+        versions.append(version_match.group('version'))
+        styles.add((underline[0], has_overline))
+    if len(styles) != 1:
+        raise scanner.UnsupportedConstructError(
+            None, "no consistent entry title style")
+    document_source = core.DocumentSource(document_text)
+    document_source.find_line_offsets(len(lines))
+    line_offsets = document_source.line_offsets
+    ends = starts[1:] + [len(lines)]
+    sections = [
+        EntrySection(
+            start=line_offsets[start], end=line_offsets[end],
+            text=document_text[line_offsets[start]:line_offsets[end]],
+            title=title, version=version)
+        for (start, end, title, version)
+        in zip(starts, ends, titles, versions)]
+    preamble = document_text[:sections[0].start]
+    (style,) = styles
+    return (preamble, style, sections)
+
+
+def get_section_hash(section_text):
+    """ Get the hash of `section_text`, to identify an unchanged section.
+
+        :param section_text: The text of the section.
+        :return: The digest (bytes) of the text.
+        """
+    section_hash = hashlib.blake2b(
+        section_text.encode('utf-8', errors='surrogatepass'),
+        digest_size=16)
+    result = section_hash.digest()
+    return result
+
+
+def get_reference_names(items):
+    """ Get the reference names defined by the document `items`.
+
+        :param items: Iterable of document items, as generated by
+            `scanner.generate_document_items`.
+        :return: The set of normalised reference names (text) of each
+            section title and hyperlink target in `items`.
+        """
+    result = {
+        scanner.normalise_reference_name(
+            item.title if isinstance(item, scanner.Heading) else item.name)
+        for item in items
+        if isinstance(item, (scanner.Heading, scanner.Target))}
+    return result
+
+
+def scan_entry_section(section_text):
+    """ Make the `ChangeLogEntry` by scanning the entry `section_text`.
+
+        :param section_text: The text of the section of the document for
+            one entry.
+        :return: The `models.ChangeLogEntry` instance representing the
+            entry. Its `body_source` refers to `section_text`.
+        :raises scanner.UnsupportedConstructError: If the section contains
+            any construct the scanner does not handle, any section title
+            other than the entry title, or any hyperlink target.
+        """
+    lines = scanner.get_document_lines(section_text)
+    items = list(scanner.generate_document_items(lines))
+    if sum(isinstance(item, scanner.Heading) for item in items) != 1:
+        raise scanner.UnsupportedConstructError(
+            None, "section title within entry")
+    if any(isinstance(item, scanner.Target) for item in items):
+        raise scanner.UnsupportedConstructError(
+            None, "hyperlink target within entry")
+    document = scanner.make_scanned_document(items)
+    (entry,) = scanner.make_change_log_entries_from_nodes(
+        scanner.get_changelog_entry_nodes_from_document(document),
+        core.DocumentSource(section_text))
+    return entry
+
+
+def copy_entry(entry):
+    """ Make a shallow copy of `entry`, without validating it again.
+
+        :param entry: The `models.ChangeLogEntry` to copy.
+        :return: A new `models.ChangeLogEntry` with the same attributes.
+        """
+    result = object.__new__(type(entry))
+    result.__dict__.update(entry.__dict__)
+    return result
+
+
+def make_entry_in_document(entry, document_text, offset):
+    """ Make a copy of `entry`, with its `body_source` in `document_text`.
+
+        :param entry: The `models.ChangeLogEntry` to copy. Its `body_source`
+            is ``None``, or a `TextSpan` with offsets from the start of its
+            section.
+        :param document_text: The text of the whole document.
+        :param offset: The offset (integer) of the start of the section in
+            `document_text`.
+        :return: A new `models.ChangeLogEntry` with the same field values,
+            and its `body_source` (if any) referring to `document_text`.
+        """
+    result = copy_entry(entry)
+    if entry.body_source is not None:
+        result.body_source = model.TextSpan(
+            document_text,
+            offset + entry.body_source.start,
+            offset + entry.body_source.end)
+    return result
+
+
+def make_entry_in_section(entry, section):
+    """ Make a copy of `entry`, with its `body_source` in `section`.
+
+        :param entry: The `models.ChangeLogEntry` to copy. Its `body_source`
+            is ``None``, or a `TextSpan` with offsets in the document.
+        :param section: The `EntrySection` of the document for `entry`.
+        :return: A new `models.ChangeLogEntry` with the same field values,
+            and its `body_source` (if any) referring to the section text;
+            or ``None`` if the `body_source` is not within `section`.
+        """
+    result = copy_entry(entry)
+    if entry.body_source is not None:
+        if not (
+                section.start <= entry.body_source.start
+                and entry.body_source.end <= section.end):
+            return None
+        result.body_source = model.TextSpan(
+            section.text,
+            entry.body_source.start - section.start,
+            entry.body_source.end - section.start)
+    return result
+
+
+class IncrementalChangeLogParser:
+    """ Parser of a Change Log document, reusing entries from its last parse.
+
+        Each parse keeps the entry made from each section of the document,
+        keyed by a hash of the section text. The next parse makes entries
+        only for the sections whose text has changed, reusing the kept
+        entries for the rest.
+
+        The whole document is parsed, as by
+        `rest.make_change_log_entries_from_text`, on the first parse; when
+        the text preceding the first entry, or the style of entry titles,
+        has changed; when the document has fewer than two entries; and
+        when a changed section has any construct the `scanner` does not
+        handle, or an entry title that repeats a reference name. If the
+        document needs Docutils to parse it, no entries are kept, since a
+        construct in one section can then change the entries of another.
+        """
+
+    def __init__(self):
+        """ Set up a new instance. """
+        self.reset()
+
+    def reset(self):
+        """ Discard the entries kept from the last parse.
+
+            :return: ``None``.
+            """
+        self.preamble = None
+        self.style = None
+        self.reference_names = set()
+        self.entries_by_section_hash = {}
+
+    def parse_document(self, document_text, sections):
+        """ Make the entries by parsing the whole of `document_text`.
+
+            :param document_text: Text of the document in reStructuredText
+                format.
+            :param sections: Sequence of the `EntrySection` of the document;
+                empty if the document could not be split.
+            :return: A sequence of `models.ChangeLogEntry` instances,
+                representing the Change Log entries from the document.
+            :raises TypeError: If `document_text` is not a text string.
+
+            The entry from each section is kept, if the document has more
+            than one entry and the entries made from the document match its
+            `sections`. The reference names in the
+            document, other than the entry titles, are also kept.
+            """
+        self.entries_by_section_hash = {}
+        try:
+            with instrumentation.stage('scan') as stage:
+                lines = scanner.get_document_lines(document_text)
+                stage.add_counts(characters=len(document_text))
+                items = list(scanner.generate_document_items(lines))
+                document = scanner.make_scanned_document(items)
+                entry_nodes = scanner.get_changelog_entry_nodes_from_document(
+                    document)
+            entries = scanner.make_change_log_entries_from_nodes(
+                entry_nodes, core.DocumentSource(document_text))
+        except scanner.UnsupportedConstructError:
+            document = rest.parse_rest_document_from_text(document_text)
+            entries = rest.make_change_log_entries_from_document(
+                document, document_source=core.DocumentSource(document_text))
+            return entries
+        if len(sections) < 2 or len(sections) != len(entries):
+            # With only one entry, its section can become the document
+            # title, taking in the preamble; so its entry is not kept.
+            return entries
+        entries_by_section_hash = {}
+        for (section, entry) in zip(sections, entries):
+            section_entry = make_entry_in_section(entry, section)
+            if section_entry is None or section.version != entry.version:
+                return entries
+            entries_by_section_hash[get_section_hash(section.text)] = (
+                section_entry)
+        self.reference_names = get_reference_names(items) - {
+            scanner.normalise_reference_name(section.title)
+            for section in sections}
+        self.entries_by_section_hash = entries_by_section_hash
+        return entries
+
+    def parse_sections(self, document_text, sections):
+        """ Make the entries from `sections`, reusing unchanged entries.
+
+            :param document_text: Text of the document in reStructuredText
+                format.
+            :param sections: Sequence of the `EntrySection` of the document.
+            :return: A 2-tuple (`entries`, `parsed_count`) of the sequence
+                of `models.ChangeLogEntry` instances representing the Change
+                Log entries from the document, and the number (integer) of
+                sections that were scanned.
+            :raises scanner.UnsupportedConstructError: If an entry title
+                repeats a reference name in the document, or if a changed
+                section has any construct the scanner does not handle.
+            """
+        titles = {
+            scanner.normalise_reference_name(section.title)
+            for section in sections}
+        if (
+                len(titles) != len(sections)
+                or not titles.isdisjoint(self.reference_names)):
+            # Docutils reports a repeated reference name in the entry.
+            raise scanner.UnsupportedConstructError(
+                None, "duplicate reference name")
+        entries_by_section_hash = {}
+        entries = []
+        parsed_count = 0
+        for section in sections:
+            section_hash = get_section_hash(section.text)
+            section_entry = self.entries_by_section_hash.get(section_hash)
+            if section_entry is None:
+                section_entry = scan_entry_section(section.text)
+                parsed_count += 1
+            entries_by_section_hash[section_hash] = section_entry
+            entries.append(make_entry_in_document(
+                section_entry, document_text, section.start))
+        self.entries_by_section_hash = entries_by_section_hash
+        return (entries, parsed_count)
+
+    def parse(self, document_text):
+        """ Make the entries from `document_text`, reusing unchanged entries.
+
+            :param document_text: Text of the document in reStructuredText
+                format.
+            :return: A sequence of `models.ChangeLogEntry` instances,
+                representing the Change Log entries from the document.
+            :raises TypeError: If `document_text` is not a text string.
+            """
+        with instrumentation.stage('incremental_parse') as stage:
+            try:
+                (preamble, style, sections) = split_entry_sections(
+                    document_text)
+            except scanner.UnsupportedConstructError:
+                (preamble, style, sections) = (None, None, [])
+            entries = None
+            if (
+                    self.entries_by_section_hash
+                    and len(sections) > 1
+                    and (preamble, style) == (self.preamble, self.style)):
+                # With only one entry, its section can become the document
+                # title or subtitle, so the whole document is parsed.
+                try:
+                    (entries, parsed_count) = self.parse_sections(
+                        document_text, sections)
+                except scanner.UnsupportedConstructError:
+                    entries = None
+            if entries is None:
+                (self.preamble, self.style) = (preamble, style)
+                entries = self.parse_document(document_text, sections)
+                parsed_count = len(sections)
+            stage.add_counts(
+                sections=len(sections), sections_parsed=parsed_count)
+        return entries
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -0,0 +1,150 @@
+# src/chug/parsers/instrumentation.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Opt-in instrumentation of the stages of parsing a document.
+
+    An observer is any callable that accepts ``(name, duration, counts)``:
+    the name (text) of a stage, its duration (float, in seconds), and a
+    mapping of count name (such as ‘entries’, ‘fields’, or ‘bytes’) to
+    integer. While an observer is active, as set by `observing`, it is
+    called at the end of each stage.
+
+    With no observer active, each stage costs only a check for an observer;
+    nothing is timed or counted.
+    """
+
+import contextlib
+import contextvars
+import time
+
+
+current_observer = contextvars.ContextVar('current_observer', default=None)
+""" The observer of stages in the current context, or ``None``. """
+
+
+class Stage:
+    """ A stage of processing, reported to an observer when it ends. """
+
+    __slots__ = ['observer', 'name', 'counts', 'start']
+
+    def __init__(self, observer, name, counts):
+        """ Set up a new instance.
+
+            :param observer: The observer to call at the end of the stage.
+            :param name: The name (text) of the stage.
+            :param counts: Mapping of count name to integer, for counts
+                known at the start of the stage.
+            """
+        self.observer = observer
+        self.name = name
+        self.counts = counts
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = time.perf_counter() - self.start
+        self.observer(self.name, duration, self.counts)
+
+    def add_counts(self, **counts):
+        """ Add `counts` to the counts to report for this stage.
+
+            :param counts: Mapping of count name to integer.
+            :return: ``None``.
+            """
+        self.counts.update(counts)
+
+
+class NullStage:
+    """ A stage of processing that is not observed. """
+
+    __slots__ = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def add_counts(self, **counts):
+        """ Ignore the `counts`. """
+
+
+null_stage = NullStage()
+""" The `NullStage` used for every stage when no observer is active. """
+
+
+def stage(name, **counts):
+    """ Get the context manager for the stage named `name`.
+
+        :param name: The name (text) of the stage.
+        :param counts: Mapping of count name to integer, for counts known at
+            the start of the stage.
+        :return: A `Stage` for the current observer, or `null_stage` if no
+            observer is active.
+        """
+    observer = current_observer.get()
+    result = null_stage if observer is None else Stage(observer, name, counts)
+    return result
+
+
+@contextlib.contextmanager
+def observing(observer):
+    """ Make a context in which `observer` observes the stages of parsing.
+
+        :param observer: The callable to call at the end of each stage,
+            with the stage name, duration, and counts.
+        :return: A context manager, whose value is `observer`.
+
+        The observer is active only in the current thread, or `asyncio`
+        task, and only until the end of the context.
+        """
+    token = current_observer.set(observer)
+    try:
+        yield observer
+    finally:
+        current_observer.reset(token)
+
+
+class SummaryObserver:
+    """ Observer that aggregates the stages observed into a summary.
+
+        The `summary` is a mapping of stage name, to a mapping of:
+        ‘calls’, the number of times the stage ended; ‘seconds’, the total
+        duration of the stage; and the total of each count reported for the
+        stage.
+        """
+
+    def __init__(self):
+        """ Set up a new instance. """
+        self.summary = {}
+
+    def __call__(self, name, duration, counts):
+        stage_summary = self.summary.setdefault(
+            name, {'calls': 0, 'seconds': 0.0})
+        stage_summary['calls'] += 1
+        stage_summary['seconds'] += duration
+        for (count_name, count) in counts.items():
+            stage_summary[count_name] = (
+                stage_summary.get(count_name, 0) + count)
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -7,10 +7,14 @@
 
 """ Parser features for reStructuredText documents. """
 
-import docutils.core
-import docutils.nodes
-
-from . import core
+import functools
+import itertools
+
+from . import (
+    core,
+    instrumentation,
+    scanner,
+)
 from .. import model
 
 
@@ -23,20 +27,100 @@ def parse_rest_document_from_text(document_text):
         """
     if not isinstance(document_text, str):
         raise TypeError("not a text string: {!r}".format(document_text))
-    document = docutils.core.publish_doctree(document_text)
+    # The Docutils publisher is imported only when a document is parsed with
+    # it, since most documents are read by the `scanner` instead.
+    import docutils.core
+    with instrumentation.stage(
+            'docutils_publish', characters=len(document_text)):
+        document = docutils.core.publish_doctree(document_text)
     return document
 
 
-def verify_is_docutils_node(node, *, node_type=docutils.nodes.Node):
-    """ Verify that `node` is a Docutils node of type `node_type`.
+class ChangeLogRestParser:
+    """ Reusable parser of reStructuredText Change Log documents.
 
-        :param node: The object to inspect.
-        :param node_type: The Docutils node type, or a `tuple of types, for
-            which to test.
-        :return: ``None``.
-        :raises TypeError: If `node` is not an instance of
-            `docutils.nodes.Node`.
+        The Docutils settings and parser are made once, when the instance is
+        created, and re-used for each document parsed by `parse`. This avoids
+        the cost of `docutils.core.publish_doctree`, which makes all of them
+        anew for every document.
+
+        The Docutils parser modules are imported only when the first
+        instance is created.
         """
+
+    source_path = "<string>"
+
+    def __init__(self, *, settings_overrides=None):
+        """ Set up a new instance.
+
+            :param settings_overrides: Mapping of Docutils setting name to
+                value, to override the default settings.
+            """
+        import docutils.frontend
+        import docutils.parsers.rst
+        import docutils.readers.standalone
+        import docutils.transforms.frontmatter
+        import docutils.transforms.misc
+        import docutils.transforms.references
+        import docutils.utils
+
+        # The Docutils transforms to apply to each parsed document. These
+        # are the transforms, of those that `publish_doctree` applies, that
+        # can change the document title, the field lists, or the text of the
+        # Change Log entries. The other transforms only set identifiers, or
+        # do nothing with the default settings.
+        self.transforms = [
+            docutils.transforms.references.Substitutions,
+            docutils.transforms.frontmatter.DocTitle,
+            docutils.transforms.frontmatter.DocInfo,
+            docutils.transforms.references.AnonymousHyperlinks,
+            docutils.transforms.references.IndirectHyperlinks,
+            docutils.transforms.references.Footnotes,
+            docutils.transforms.references.ExternalTargets,
+            docutils.transforms.references.InternalTargets,
+            docutils.transforms.references.DanglingReferences,
+            docutils.transforms.misc.Transitions,
+        ]
+        self.settings = docutils.frontend.get_default_settings(
+            docutils.parsers.rst.Parser,
+            docutils.readers.standalone.Reader)
+        if settings_overrides is not None:
+            for (name, value) in settings_overrides.items():
+                setattr(self.settings, name, value)
+        self.parser = docutils.parsers.rst.Parser()
+
+    def parse(self, document_text):
+        """ Get the document structure, parsed from `document_text`.
+
+            :param document_text: Text of the document in reStructuredText
+                format.
+            :return: The Docutils document root node.
+            :raises TypeError: If `document_text` is not a text string.
+            """
+        import docutils.utils
+
+        if not isinstance(document_text, str):
+            raise TypeError("not a text string: {!r}".format(document_text))
+        with instrumentation.stage(
+                'docutils_publish', characters=len(document_text)):
+            document = docutils.utils.new_document(
+                self.source_path, self.settings)
+            self.parser.parse(document_text, document)
+            document.transformer.add_transforms(self.transforms)
+            document.transformer.apply_transforms()
+        return document
+
+
+def make_node_type_error_message(node, node_type):
+    """ Make the message for an error that `node` is not of `node_type`.
+
+        :param node: The object that is not of the expected type.
+        :param node_type: The Docutils node type, or a `tuple` of types,
+            that was expected.
+        :return: The message text.
+        """
+    import docutils.nodes
+
     node_type_text = (
         "({})".format(", ".join(
             "‘{}’".format(item.__name__) for item in node_type))
@@ -48,19 +132,44 @@ def verify_is_docutils_node(node, *, node_type=docutils.nodes.Node):
         # Name the node type specified by the caller.
         else "not a Docutils node of type {type_text}: {node!r}"
     ).format(node=node, type_text=node_type_text)
+    return message
+
+
+def verify_is_docutils_node(node, *, node_type=None):
+    """ Verify that `node` is a Docutils node of type `node_type`.
+
+        :param node: The object to inspect.
+        :param node_type: The Docutils node type, or a `tuple of types, for
+            which to test; or ``None`` to test for `docutils.nodes.Node`.
+        :return: ``None``.
+        :raises TypeError: If `node` is not an instance of
+            `docutils.nodes.Node`.
+
+        The error message, which can include the representation of a large
+        node, is made only if the verification fails.
+        """
+    if node_type is None:
+        import docutils.nodes
+
+        node_type = docutils.nodes.Node
     if not isinstance(node, node_type):
-        raise TypeError(message)
+        raise TypeError(make_node_type_error_message(node, node_type))
 
-
-def get_node_text(node):
+
+def get_node_text(node, *, trusted=False):
     """ Get the child text of the `node`.
 
         :param node: The `docutils.nodes.Node` instance to query.
+        :param trusted: If true, `node` is trusted to be a Docutils node,
+            and is not verified.
         :return: The child text of `node`.
         :raises TypeError: If the `node` is not a `docutils.nodes.Node`.
         :raises ValueError: If the `node` has no `Text` child node.
         """
-    verify_is_docutils_node(node)
+    import docutils.nodes
+
+    if not trusted:
+        verify_is_docutils_node(node)
     node_text_children = [
         child_node for child_node in node.children
         if isinstance(child_node, docutils.nodes.Text)]
@@ -71,16 +180,21 @@ def get_node_text(node):
     return result
 
 
-def get_node_title_text(node):
+def get_node_title_text(node, *, trusted=False):
     """ Get the `node`'s `title` node child text.
 
         :param rest_document: Document root, as a `docutils.nodes.document`
             instance.
+        :param trusted: If true, `node` is trusted to be a Docutils node,
+            and is not verified.
         :return: The text of the `title` node.
         :raises TypeError: If the `node` is not a `docutils.nodes.Node`.
         :raises ValueError: If the `node` has no `title` child node.
         """
-    verify_is_docutils_node(node)
+    import docutils.nodes
+
+    if not trusted:
+        verify_is_docutils_node(node)
     title_nodes = [
         child_node for child_node in node.children
         if isinstance(child_node, docutils.nodes.title)]
@@ -88,7 +202,7 @@ def get_node_title_text(node):
         raise ValueError(
             "node has no ‘title’ children: {!r}".format(node))
     title = next(iter(title_nodes))
-    result = get_node_text(title)
+    result = get_node_text(title, trusted=True)
     return result
 
 
@@ -102,6 +216,8 @@ def get_document_title_text(rest_document):
             `docutils.nodes.document`.
         :raises ValueError: If the `rest_document` has no `title` child node.
         """
+    import docutils.nodes
+
     verify_is_docutils_node(rest_document, node_type=docutils.nodes.document)
     result = get_node_title_text(rest_document)
     return result
@@ -117,6 +233,8 @@ def get_document_subtitle_text(rest_document):
         :raises TypeError: If the `rest_document` is not a
             `docutils.nodes.document`.
         """
+    import docutils.nodes
+
     verify_is_docutils_node(rest_document, node_type=docutils.nodes.document)
     subtitle_nodes = [
         child_node for child_node in rest_document.children
@@ -138,6 +256,8 @@ def get_top_level_sections(rest_document):
         :raises TypeError: If the `rest_document` is not a
             `docutils.nodes.document`.
         """
+    import docutils.nodes
+
     verify_is_docutils_node(rest_document, node_type=docutils.nodes.document)
     sections = (
         node for node in rest_document.children
@@ -145,23 +265,28 @@ def get_top_level_sections(rest_document):
     return sections
 
 
-def get_version_text_from_changelog_entry(entry_node):
+def get_version_text_from_changelog_entry(entry_node, *, trusted=False):
     """ Get the version text from changelog entry node `entry_node`.
 
         :param entry_node: The `docutils.nodes.Node` representing the change
             log entry.
+        :param trusted: If true, `entry_node` is trusted to be a Docutils
+            node, and is not verified.
         :return: The version text parsed from the `entry_node` title.
         """
-    title_text = get_changelog_entry_title_from_node(entry_node)
+    title_text = get_changelog_entry_title_from_node(
+        entry_node, trusted=trusted)
     version_text = core.get_version_text_from_entry_title(title_text)
     return version_text
 
 
-def get_changelog_entry_title_from_node(entry_node):
+def get_changelog_entry_title_from_node(entry_node, *, trusted=False):
     """ Get the title of the change log entry, from `entry_node`.
 
         :param entry_node: The `docutils.nodes.Node` representing the change
             log entry.
+        :param trusted: If true, `entry_node` is trusted to be a Docutils
+            node, and is not verified.
         :return: The title (text) that is the change log entry title.
         :raises ValueError: If the `node` has no `Text` child node.
 
@@ -172,10 +297,12 @@ def get_changelog_entry_title_from_node(entry_node):
         If the change log entry happens to be the whole document, the title
         might be in the `title` child or the `subtitle` child.
         """
+    import docutils.nodes
+
     entry_title = None
     entry_title_match = False
     try:
-        entry_title = get_node_title_text(entry_node)
+        entry_title = get_node_title_text(entry_node, trusted=trusted)
         core.verify_is_change_log_entry_title(entry_title)
         entry_title_match = True
     except (ValueError, core.ChangeLogEntryTitleFormatInvalidError):
@@ -213,35 +340,49 @@ def get_changelog_entry_nodes_from_document(rest_document):
     for entry_node in entry_nodes:
         # Verify that the title is a valid change log entry title.
         # If this fails an exception will raise.
-        __ = get_changelog_entry_title_from_node(entry_node)
+        __ = get_changelog_entry_title_from_node(entry_node, trusted=True)
     result = entry_nodes
     return result
 
 
-field_list_type_by_entry_node_type = {
-    docutils.nodes.document: docutils.nodes.docinfo,
-    docutils.nodes.section: docutils.nodes.field_list,
-}
-""" Mapping from Change Log entry node type, to field list node type.
+@functools.lru_cache(maxsize=None)
+def get_field_list_type_by_entry_node_type():
+    """ Get the mapping from Change Log entry node type, to field list type.
 
-    Each different node type that can be a Change Log entry, has different
-    child node type for its corresponding field list where we find metadata
-    about the Change Log entry. This mapping allows specifying exactly the
-    child node type we need based on the given Change Log entry. """
+        :return: The mapping of Docutils node type, to node type.
 
+        Each different node type that can be a Change Log entry, has different
+        child node type for its corresponding field list where we find metadata
+        about the Change Log entry. This mapping allows specifying exactly the
+        child node type we need based on the given Change Log entry.
 
-def get_field_list_from_entry_node(entry_node):
+        The mapping is made when it is first needed, since it needs the
+        Docutils node types.
+        """
+    import docutils.nodes
+
+    result = {
+        docutils.nodes.document: docutils.nodes.docinfo,
+        docutils.nodes.section: docutils.nodes.field_list,
+    }
+    return result
+
+
+def get_field_list_from_entry_node(entry_node, *, trusted=False):
     """ Get the field list of metadata for the Change Log `entry_node`.
 
         :param entry_node: The `docutils.nodes.Node` representing the Change
             Log entry.
+        :param trusted: If true, `entry_node` is trusted to be a Docutils
+            node of an entry type, and is not verified.
         :return: The ‘docutils.nodes.Node’ representing the field list.
         :raises ValueError: If no field list node was found as a child of
             `entry_node`.
         """
-    verify_is_docutils_node(entry_node, node_type=tuple(
-        field_list_type_by_entry_node_type.keys()))
-    field_list_node_type = field_list_type_by_entry_node_type[
+    if not trusted:
+        verify_is_docutils_node(entry_node, node_type=tuple(
+            get_field_list_type_by_entry_node_type().keys()))
+    field_list_node_type = get_field_list_type_by_entry_node_type()[
         type(entry_node)]
     field_list_nodes = [
         node for node in entry_node.children
@@ -253,6 +394,36 @@ def get_field_list_from_entry_node(entry_node):
     return next(iter(field_list_nodes))
 
 
+def get_field_bodies_by_name(field_list_node, *, trusted=False):
+    """ Get the field bodies in `field_list_node`, by field name.
+
+        :param field_list_node: The `docutils.nodes.Node` representing the
+            field list.
+        :param trusted: If true, `field_list_node` is trusted to be a
+            Docutils field list node, and is not verified.
+        :return: A mapping of case-folded field name (text) to the
+            ‘docutils.nodes.Node’ representing the field body.
+
+        The field list is walked once, so the result can be used to look up
+        any number of fields, including fields with no special meaning for
+        a Change Log entry. Where several fields have the same name, the
+        mapping has the body of the first such field.
+        """
+    import docutils.nodes
+
+    if not trusted:
+        verify_is_docutils_node(field_list_node, node_type=tuple(
+            get_field_list_type_by_entry_node_type().values()))
+    field_bodies = {}
+    for field_node in field_list_node.children:
+        if not isinstance(field_node, docutils.nodes.field):
+            continue
+        (field_name_node, field_body_node) = field_node.children
+        field_bodies.setdefault(
+            field_name_node.astext().casefold(), field_body_node)
+    return field_bodies
+
+
 def get_field_body_for_name(field_list_node, field_name):
     """ Get the body of field matching `field_name` in `field_list_node`.
 
@@ -262,98 +433,384 @@ def get_field_body_for_name(field_list_node, field_name):
         :return: The ‘docutils.nodes.Node’ representing the field body.
         :raises KeyError: If no field was found with name matching
             `field_name`.
+
+        To look up several fields in the same field list, use
+        `get_field_bodies_by_name` instead.
         """
-    verify_is_docutils_node(field_list_node, node_type=tuple(
-        field_list_type_by_entry_node_type.values()))
-    matching_field_nodes = [
-        field_node
-        for (field_node, (field_name_node, field_body_node)) in (
-                (child_node, child_node.children)
-                for child_node in field_list_node.children)
-        if (
-                isinstance(field_node, docutils.nodes.field)
-                and (
-                    field_name_node.astext().lower()
-                    == field_name.lower()))
-    ]
-    if not matching_field_nodes:
+    field_bodies = get_field_bodies_by_name(field_list_node)
+    try:
+        field_body_node = field_bodies[field_name.casefold()]
+    except KeyError as exc:
         raise KeyError(
             "no ‘field’ with name {name!r} in {field_list!r}".format(
                 field_list=field_list_node,
-                name=field_name))
-    field_node = next(iter(matching_field_nodes))
-    (__, field_body_node) = field_node.children
+                name=field_name)) from exc
     return field_body_node
 
 
-def get_body_text_from_entry_node(entry_node):
+def get_field_texts_from_entry_node(entry_node):
+    """ Get the text of each metadata field of the Change Log `entry_node`.
+
+        :param entry_node: The `docutils.nodes.Node` representing the Change
+            Log entry.
+        :return: A mapping of case-folded field name (text) to the text of
+            the field body, for every field (e.g. ‘Released’, ‘Maintainer’,
+            ‘Tags’) in the entry's field list.
+        :raises ValueError: If no field list node was found as a child of
+            `entry_node`.
+        """
+    field_list_node = get_field_list_from_entry_node(entry_node)
+    field_texts = {
+        name: field_body_node.astext()
+        for (name, field_body_node) in get_field_bodies_by_name(
+            field_list_node, trusted=True).items()}
+    return field_texts
+
+
+def get_body_text_from_entry_node(entry_node, *, trusted=False):
     """ Get the body text of the Change Log `entry_node`.
 
         :param entry_node: The `docutils.nodes.Node` representing the Change
             Log entry.
+        :param trusted: If true, `entry_node` is trusted to be a Docutils
+            node of an entry type, and is not verified.
         :return: The text of the body of the Change Log entry.
 
         The Change Log entry body is all content in the entry that follows the
         title, subtitle, and metadata field list.
         """
-    verify_is_docutils_node(entry_node, node_type=tuple(
-        field_list_type_by_entry_node_type.keys()))
-    entry_body = docutils.nodes.section()
-    entry_body.children = [
-        child_node for child_node in entry_node.children
-        if (
-                not isinstance(child_node, (
-                    docutils.nodes.title,
-                    docutils.nodes.subtitle,
-                    *field_list_type_by_entry_node_type.values()))
-        )]
-    entry_body_text = entry_body.astext()
+    import docutils.nodes
+
+    if not trusted:
+        verify_is_docutils_node(entry_node, node_type=tuple(
+            get_field_list_type_by_entry_node_type().keys()))
+    with instrumentation.stage('body_flattening') as stage:
+        entry_body = docutils.nodes.section()
+        entry_body.children = [
+            child_node for child_node in entry_node.children
+            if (
+                    not isinstance(child_node, (
+                        docutils.nodes.title,
+                        docutils.nodes.subtitle,
+                        *get_field_list_type_by_entry_node_type().values()))
+            )]
+        entry_body_text = entry_body.astext()
+        stage.add_counts(characters=len(entry_body_text))
     return entry_body_text
 
 
-def make_change_log_entry_from_node(entry_node):
+def get_section_title_start_line(section_node, document_source):
+    """ Get the index of the first line of the title of `section_node`.
+
+        :param section_node: The `docutils.nodes.section` to query.
+        :param document_source: The `core.DocumentSource` of the document.
+        :return: The index (integer, 0-based) of the title overline, if
+            any; otherwise, of the title text.
+
+        Docutils records, as the line of a section, the (1-based) line of
+        the title underline.
+        """
+    underline_index = section_node.line - 1
+    start = underline_index - 1
+    if start > 0 and (
+            document_source.get_line(start - 1).rstrip()
+            == document_source.get_line(underline_index).rstrip()):
+        start -= 1
+    return start
+
+
+def get_body_source_span_from_entry_node(entry_node, document_source):
+    """ Get the span of the source text of the body of `entry_node`.
+
+        :param entry_node: The `docutils.nodes.Node` representing the Change
+            Log entry.
+        :param document_source: The `core.DocumentSource` of the document.
+        :return: The `model.TextSpan` of the body source text, from the
+            line following the entry's field list, to the end of the entry;
+            or ``None`` if the lines of the entry are not known.
+
+        Docutils does not record the line of every node (and records the
+        last line of some), so the body is found from the field list.
+        """
+    import docutils.nodes
+
+    field_list_lines = [
+        node.line
+        for node in get_field_list_from_entry_node(entry_node).findall()
+        if node.line is not None]
+    next_section_node = entry_node.next_node(
+        docutils.nodes.section, descend=False, siblings=True, ascend=True)
+    if not field_list_lines or (
+            next_section_node is not None and next_section_node.line is None):
+        return None
+    end = (
+        len(document_source) if next_section_node is None
+        else get_section_title_start_line(
+            next_section_node, document_source))
+    start = min(
+        end, document_source.get_field_list_end(min(field_list_lines) - 1))
+    span = document_source.get_lines_span(start, end)
+    return span
+
+
+def make_change_log_entry_from_node(
+        entry_node, *, document_source=None, trusted=False):
     """ Make a `ChangeLogEntry` from `entry_node`.
 
         :param entry_node: The `docutils.nodes.Node` representing the change
             log entry.
+        :param document_source: The `core.DocumentSource` of the document
+            parsed to `entry_node`, or ``None`` if not known.
+        :param trusted: If true, `entry_node` is trusted to be a Docutils
+            node of an entry type, such as from
+            `get_changelog_entry_nodes_from_document`, and is not verified.
         :return: A new `models.ChangeLogEntry` representing the Change Log
-            entry.
+            entry. Its `body_source` is ``None`` if `document_source` is not
+            specified.
+
+        The body text of the entry is computed from `entry_node` only when
+        the `body` of the result is first accessed; until then, the result
+        keeps a reference to `entry_node`.
         """
-    verify_is_docutils_node(entry_node, node_type=tuple(
-        field_list_type_by_entry_node_type.keys()))
-    version_text = get_version_text_from_changelog_entry(entry_node)
-    field_list_node = get_field_list_from_entry_node(entry_node)
-    release_date_field_body = get_field_body_for_name(
-        field_list_node, 'released')
-    release_date_text = release_date_field_body.astext()
-    maintainer_field_body = get_field_body_for_name(
-        field_list_node, 'maintainer')
-    maintainer_text = maintainer_field_body.astext()
-    body_text = get_body_text_from_entry_node(entry_node)
-    result = model.ChangeLogEntry(
-        release_date=release_date_text,
-        version=version_text,
-        maintainer=maintainer_text,
-        body=body_text,
-    )
+    if not trusted:
+        verify_is_docutils_node(entry_node, node_type=tuple(
+            get_field_list_type_by_entry_node_type().keys()))
+    with instrumentation.stage('title_verification'):
+        version_text = get_version_text_from_changelog_entry(
+            entry_node, trusted=True)
+    with instrumentation.stage('field_lookup') as stage:
+        field_list_node = get_field_list_from_entry_node(
+            entry_node, trusted=True)
+        field_bodies = get_field_bodies_by_name(field_list_node, trusted=True)
+        release_date_text = field_bodies['released'].astext()
+        maintainer_text = field_bodies['maintainer'].astext()
+        stage.add_counts(fields=len(field_bodies))
+    body = model.DeferredValue(
+        functools.partial(
+            get_body_text_from_entry_node, entry_node, trusted=True))
+    body_source = (
+        None if document_source is None
+        else get_body_source_span_from_entry_node(
+            entry_node, document_source))
+    with instrumentation.stage('model_validation', entries=1):
+        result = model.ChangeLogEntry(
+            release_date=release_date_text,
+            version=version_text,
+            maintainer=maintainer_text,
+            body=body,
+            body_source=body_source,
+        )
     return result
 
 
-def make_change_log_entries_from_document(rest_document):
+def make_change_log_entries_from_document(
+        rest_document, *, document_source=None):
     """ Make sequence of `ChangeLogEntry` for entries from `rest_document`.
 
         :param rest_document: Document root, as a `docutils.nodes.document`
             instance.
+        :param document_source: The `core.DocumentSource` of the document
+            parsed to `rest_document`, or ``None`` if not known.
         :return: A sequence of `models.ChangeLogEntry` instances, representing
             the Change Log entries from `rest_document`.
         """
     entry_nodes = get_changelog_entry_nodes_from_document(rest_document)
     entries = [
-        make_change_log_entry_from_node(entry_node)
+        make_change_log_entry_from_node(
+            entry_node, document_source=document_source, trusted=True)
         for entry_node in entry_nodes
     ]
     return entries
 
+
+def iter_change_log_entries_from_document(
+        rest_document, *, document_source=None):
+    """ Generate `ChangeLogEntry` for entries from `rest_document`, lazily.
+
+        :param rest_document: Document root, as a `docutils.nodes.document`
+            instance.
+        :param document_source: The `core.DocumentSource` of the document
+            parsed to `rest_document`, or ``None`` if not known.
+        :return: A generator of `models.ChangeLogEntry` instances, each
+            representing a Change Log entry from `rest_document`.
+        :raises TypeError: If the `rest_document` is not a
+            `docutils.nodes.document`.
+        :raises ValueError: If an entry is not a valid Change Log entry.
+
+        Each entry node is validated and made into a `ChangeLogEntry` only
+        when the caller requests the next item, so a caller that consumes
+        only some entries does not pay for the rest. Errors are raised only
+        when the invalid entry is reached.
+        """
+    entry_nodes = get_top_level_sections(rest_document)
+    first_entry_node = next(entry_nodes, rest_document)
+    for entry_node in itertools.chain([first_entry_node], entry_nodes):
+        yield make_change_log_entry_from_node(
+            entry_node, document_source=document_source, trusted=True)
+
+
+def make_change_log_entries_from_text(document_text):
+    """ Make sequence of `ChangeLogEntry` for entries from `document_text`.
+
+        :param document_text: Text of the document in reStructuredText format.
+        :return: A sequence of `models.ChangeLogEntry` instances, representing
+            the Change Log entries from the document.
+        :raises TypeError: If `document_text` is not a text string.
+
+        The document is first read by the fast line-oriented `scanner`. Only
+        if the document has some construct the scanner does not handle, is
+        the document parsed by Docutils instead.
+        """
+    try:
+        entries = scanner.scan_change_log_entries_from_text(document_text)
+    except scanner.UnsupportedConstructError:
+        document = parse_rest_document_from_text(document_text)
+        entries = make_change_log_entries_from_document(
+            document, document_source=core.DocumentSource(document_text))
+    return entries
+
+
+def get_latest_change_log_entry(document_text):
+    """ Get the latest `ChangeLogEntry` from `document_text`.
+
+        :param document_text: Text of the document in reStructuredText format.
+        :return: The `models.ChangeLogEntry` instance representing the first
+            (latest) Change Log entry in the document.
+        :raises TypeError: If `document_text` is not a text string.
+
+        The document is scanned only as far as the end of the first entry,
+        and only that entry is made into a `ChangeLogEntry`. Only if that
+        part of the document has some construct the `scanner` does not
+        handle, is the whole document parsed by Docutils instead; even
+        then, later entries are not validated.
+        """
+    try:
+        entry = scanner.scan_latest_change_log_entry_from_text(document_text)
+    except scanner.UnsupportedConstructError:
+        document = parse_rest_document_from_text(document_text)
+        entry = next(iter_change_log_entries_from_document(
+            document, document_source=core.DocumentSource(document_text)))
+    return entry
+
+
+field_name_by_field_list_name = {
+    'released': 'release_date',
+    'maintainer': 'maintainer',
+}
+""" Mapping from case-folded field list name, to Change Log entry field name.
+    """
+
+
+def generate_entry_node_diagnostics(entry_index, entry_node):
+    """ Generate the diagnostics for the Change Log `entry_node`.
+
+        :param entry_index: The (0-based) position of the entry.
+        :param entry_node: The `docutils.nodes.Node` representing the Change
+            Log entry.
+        :return: Generator of `model.EntryDiagnostic` instances, for each
+            problem that would prevent making a `ChangeLogEntry` from
+            `entry_node`.
+        """
+    import docutils.nodes
+
+    entry_line = (
+        (entry_node.line - 1) if (
+            isinstance(entry_node, docutils.nodes.section)
+            and entry_node.line is not None)
+        else None)
+    try:
+        title_text = get_changelog_entry_title_from_node(
+            entry_node, trusted=True)
+    except ValueError:
+        yield model.EntryDiagnostic(
+            entry_index, None, entry_line, "no change log entry title found")
+        return
+    fields = {'version': core.get_version_text_from_entry_title(title_text)}
+    field_lines = {'version': entry_line}
+    field_list_nodes = [
+        node for node in entry_node.children
+        if isinstance(node, get_field_list_type_by_entry_node_type()[
+            type(entry_node)])]
+    if not field_list_nodes:
+        yield model.EntryDiagnostic(
+            entry_index, None, entry_line, "no field list for entry")
+    else:
+        field_list_node = field_list_nodes[0]
+        field_bodies = get_field_bodies_by_name(
+            field_list_node, trusted=True)
+        for (field_list_name, field_name) in (
+                field_name_by_field_list_name.items()):
+            if field_list_name not in field_bodies:
+                yield model.EntryDiagnostic(
+                    entry_index, field_name, field_list_node.line,
+                    "no ‘{}’ field".format(field_list_name.title()))
+                continue
+            field_body_node = field_bodies[field_list_name]
+            fields[field_name] = field_body_node.astext()
+            field_lines[field_name] = field_body_node.parent.line
+    yield from model.generate_entry_diagnostics(
+        entry_index, fields, field_lines=field_lines)
+
+
+def lint_document(document_text):
+    """ Get the diagnostics for all the problems in the Change Log entries.
+
+        :param document_text: Text of the document in reStructuredText format.
+        :return: A sequence of `model.EntryDiagnostic` instances, in entry
+            order, with the document line number of each problem where that
+            is known.
+        :raises TypeError: If `document_text` is not a text string.
+
+        Unlike `make_change_log_entries_from_text`, this does not stop at
+        the first entry that is not valid, and does not make any entries.
+        """
+    document = parse_rest_document_from_text(document_text)
+    entry_nodes = list(get_top_level_sections(document)) or [document]
+    diagnostics = [
+        diagnostic
+        for (entry_index, entry_node) in enumerate(entry_nodes)
+        for diagnostic in generate_entry_node_diagnostics(
+            entry_index, entry_node)]
+    return diagnostics
+
+
+def make_change_log_entries_from_file(infile_path):
+    """ Make sequence of `ChangeLogEntry` for entries from `infile_path`.
+
+        :param infile_path: Filesystem path of the document to read.
+        :return: A sequence of `models.ChangeLogEntry` instances, representing
+            the Change Log entries from the document.
+
+        The file is read as a `core.ChangeLogDocumentFile`, then parsed as
+        for `make_change_log_entries_from_text`.
+        """
+    with core.ChangeLogDocumentFile(infile_path) as document_file:
+        document_text = document_file.decode()
+    entries = make_change_log_entries_from_text(document_text)
+    return entries
+
+
+def get_latest_change_log_entry_from_file(infile_path):
+    """ Get the latest `ChangeLogEntry` from the document at `infile_path`.
+
+        :param infile_path: Filesystem path of the document to read.
+        :return: The `models.ChangeLogEntry` instance representing the first
+            (latest) Change Log entry in the document.
+
+        The file is read as a `core.ChangeLogDocumentFile`, and only as much
+        of it is decoded as the `scanner` needs to find the end of the
+        first entry. Only if that part of the document has some construct
+        the `scanner` does not handle, is the whole document decoded and
+        parsed as for `get_latest_change_log_entry`.
+        """
+    with core.ChangeLogDocumentFile(infile_path) as document_file:
+        try:
+            entry = scanner.scan_latest_change_log_entry_from_file(
+                document_file)
+        except scanner.UnsupportedConstructError:
+            entry = get_latest_change_log_entry(document_file.decode())
+    return entry
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
@@ -0,0 +1,895 @@
+# src/chug/parsers/scanner.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Fast line-oriented scanner for reStructuredText Change Log documents.
+
+    A well-formed Change Log document uses only a small subset of
+    reStructuredText: section titles, a field list of metadata for each entry,
+    and simple paragraphs, bullet lists, and comments in each entry body.
+
+    This module recognises that subset directly from the document lines,
+    without the Docutils processing pipeline, and makes the same Change Log
+    entries as the Docutils parser would make from the same document.
+
+    Any construct outside that subset causes `UnsupportedConstructError`; the
+    caller should then fall back to the full Docutils parser.
+    """
+
+import collections
+import itertools
+import re
+
+from . import (
+    core,
+    instrumentation,
+)
+from .. import model
+
+
+class UnsupportedConstructError(ValueError):
+    """ Raised when the document has a construct the scanner does not handle.
+        """
+
+    def __init__(self, line, message=None):
+        self.line = line
+        self.message = message
+
+    def __str__(self):
+        text = "{message}: line {line}".format(
+            message=(
+                self.message if self.message is not None
+                else "(no message)"),
+            line=(
+                "{:d}".format(self.line) if self.line is not None
+                else "(unknown)"),
+        )
+        return text
+
+
+Heading = collections.namedtuple('Heading', ['title', 'style', 'line'])
+""" A section title, with its adornment style and (1-based) line number. """
+
+Paragraph = collections.namedtuple('Paragraph', ['text', 'line'])
+""" A paragraph of body text, at any list nesting depth.
+
+    The `text` is ``None`` if the paragraph might contain inline markup.
+    """
+
+Comment = collections.namedtuple('Comment', ['text', 'line'])
+""" A reStructuredText comment, with its (literal) text. """
+
+Target = collections.namedtuple('Target', ['name', 'line'])
+""" A hyperlink target, with its reference name; it has no text content. """
+
+Field = collections.namedtuple('Field', ['name', 'body', 'line'])
+""" A single field of a field list: the field name and body text.
+
+    The `body` is ``None`` if the field body is not a plain text paragraph.
+    """
+
+FieldList = collections.namedtuple('FieldList', ['fields', 'line'])
+""" A field list, as a sequence of `Field` items. """
+
+Section = collections.namedtuple('Section', ['title', 'line', 'children'])
+""" A section: the title text, and the sequence of child items. """
+
+ScannedDocument = collections.namedtuple(
+    'ScannedDocument', ['title', 'subtitle', 'docinfo', 'children'])
+""" A document root, after promotion of title, subtitle, and docinfo.
+
+    This mirrors the Docutils ‘DocTitle’ and ‘DocInfo’ transforms: `title`
+    and `subtitle` are the promoted title text (or ``None``); `docinfo` is
+    the promoted `FieldList` (or ``None``); `children` are the remaining
+    top-level items.
+    """
+
+
+adornment_regex = re.compile(r"^([!-/:-@\[-`{-~])\1*$")
+""" Regular Expression pattern to match a section title adornment line. """
+
+explicit_markup_regex = re.compile(r"^\.\.(?: +|$)")
+""" Regular Expression pattern to match the start of explicit markup. """
+
+bullet_item_regex = re.compile(r"^[-*+•‣⁃] +(?=\S)")
+""" Regular Expression pattern to match the start of a bullet list item. """
+
+field_marker_regex = re.compile(
+    r"^:(?P<name>[^:\s][^:]*?)(?<!\s):(?: +(?P<body>.*))?$")
+""" Regular Expression pattern to match a single-line field list item. """
+
+enumerator_regex = re.compile(
+    r"^\(?(?:[0-9]+|[A-Za-z]|[IVXLCDMivxlcdm]+|#)[.)](?:\s|$)")
+""" Regular Expression pattern to match an enumerated list item start. """
+
+inline_markup_regex = re.compile(r"[*`|\\]|_(?![^\W_])")
+""" Regular Expression pattern to match text that may be inline markup.
+
+    Docutils would transform the text of inline markup; the scanner instead
+    declines to handle any text that might contain it.
+    """
+
+unsafe_text_start_characters = frozenset(
+    "-+*•‣⁃>|:.[\\_=/")
+""" Characters that can start some construct other than plain text. """
+
+bibliographic_field_names = frozenset([
+    'author', 'authors', 'organization', 'address', 'contact',
+    'version', 'revision', 'status', 'date', 'copyright',
+    'dedication', 'abstract',
+])
+""" Field names that the Docutils ‘DocInfo’ transform treats specially. """
+
+
+def get_document_lines(document_text):
+    """ Get the lines of `document_text`, normalised as Docutils does.
+
+        :param document_text: Text of the document in reStructuredText format.
+        :return: Sequence of lines (text), without line endings, with tabs
+            expanded and trailing whitespace removed.
+        :raises TypeError: If `document_text` is not a text string.
+        :raises UnsupportedConstructError: If `document_text` contains a
+            byte order mark.
+        """
+    if not isinstance(document_text, str):
+        raise TypeError("not a text string: {!r}".format(document_text))
+    if "\ufeff" in document_text:
+        raise UnsupportedConstructError(None, "byte order mark in document")
+    document_text = core.special_whitespace_regex.sub(" ", document_text)
+    lines = document_text.splitlines()
+    if "\t" in document_text:
+        lines = [line.expandtabs(8) for line in lines]
+    lines = list(map(str.rstrip, lines))
+    return lines
+
+
+def is_plain_text(text):
+    """ Return ``True`` iff `text` is plain text, without any inline markup.
+        """
+    result = (inline_markup_regex.search(text) is None)
+    return result
+
+
+def verify_is_plain_text_start(text, *, line):
+    """ Verify that `text` does not start some non-paragraph construct.
+
+        :param text: The text to inspect.
+        :param line: The line number (1-based) of `text` in the document.
+        :return: ``None``.
+        :raises UnsupportedConstructError: If `text` might start a construct
+            other than a plain paragraph.
+        """
+    if (
+            text[0] in unsafe_text_start_characters
+            or enumerator_regex.match(text)):
+        raise UnsupportedConstructError(line, "unsupported block construct")
+
+
+def get_indented_block_end(lines, index, *, until_blank=False):
+    """ Get the index of the line following the indented block at `index`.
+
+        :param lines: Sequence of document lines.
+        :param index: The index of the line that introduces the block.
+        :param until_blank: If true, the block also ends at a blank line.
+        :return: A 2-tuple (`end`, `blank_finish`): the index of the first
+            line after the block, and whether the block ended with a blank
+            line or at the end of the document.
+        """
+    end = index + 1
+    line_count = len(lines)
+    while end < line_count:
+        line = lines[end]
+        if not line:
+            if until_blank:
+                return (end, True)
+        elif line[0] != " ":
+            return (end, not lines[end - 1])
+        end += 1
+    return (end, True)
+
+
+def get_heading(lines, index):
+    """ Get the section title starting at `lines[index]`, if any.
+
+        :param lines: Sequence of document lines.
+        :param index: The index of the line to inspect.
+        :return: A 2-tuple (`heading`, `end`) of the `Heading` and the index
+            of the line following it; or ``None`` if there is no section
+            title at `index`.
+        :raises UnsupportedConstructError: If the lines are adornment that
+            does not make a well-formed section title.
+        """
+    line = lines[index]
+    line_count = len(lines)
+    if adornment_regex.match(line):
+        if not (
+                index + 2 < line_count
+                and lines[index + 1]
+                and lines[index + 2] == line):
+            raise UnsupportedConstructError(
+                index + 1, "transition or malformed section title")
+        title = lines[index + 1].strip()
+        style = (line[0], True)
+        end = index + 3
+    elif index + 1 < line_count and adornment_regex.match(lines[index + 1]):
+        verify_is_plain_text_start(line, line=(index + 1))
+        title = line
+        style = (lines[index + 1][0], False)
+        end = index + 2
+        line = lines[index + 1]
+    else:
+        return None
+    if not title.isascii() or len(line) < len(title):
+        raise UnsupportedConstructError(
+            index + 1, "section title adornment width is uncertain")
+    heading = Heading(title=title, style=style, line=(index + 1))
+    return (heading, end)
+
+
+def scan_explicit_markup(lines, index):
+    """ Scan the explicit markup construct starting at `lines[index]`.
+
+        :param lines: Sequence of document lines.
+        :param index: The index of the line that starts the explicit markup.
+        :return: A 2-tuple (`item`, `end`) of the `Comment` or `Target`, and
+            the index of the line following it.
+        :raises UnsupportedConstructError: If the explicit markup is not a
+            comment or hyperlink target.
+        """
+    line = lines[index]
+    first_text = line[explicit_markup_regex.match(line).end():]
+    if first_text.startswith("_"):
+        (end, blank_finish) = get_indented_block_end(
+            lines, index, until_blank=True)
+        name = first_text[1:].partition(":")[0].strip("`")
+        if not name or "\\" in name or "`" in name:
+            raise UnsupportedConstructError(index + 1, "complex target name")
+        item = Target(name=name, line=(index + 1))
+    elif first_text.startswith(("[", "|")) or "::" in first_text:
+        raise UnsupportedConstructError(
+            index + 1, "footnote, citation, substitution, or directive")
+    elif not first_text and (index + 1 == len(lines) or not lines[index + 1]):
+        # An empty comment does not consume any following indented block.
+        (end, blank_finish) = (index + 1, True)
+        item = Comment(text="", line=(index + 1))
+    else:
+        (end, blank_finish) = get_indented_block_end(lines, index)
+        following_lines = lines[index + 1:end]
+        indent = min(
+            (len(text) - len(text.lstrip(" "))
+             for text in following_lines if text),
+            default=0)
+        comment_lines = [first_text] + [
+            text[indent:] for text in following_lines]
+        text = "\n".join(comment_lines).strip("\n")
+        item = Comment(text=text, line=(index + 1))
+    if not (blank_finish or explicit_markup_regex.match(lines[end])):
+        # Only another explicit markup construct may follow immediately.
+        raise UnsupportedConstructError(
+            end + 1, "explicit markup ends without a blank line")
+    return (item, end)
+
+
+def scan_field(lines, index):
+    """ Scan the single-line field list item at `lines[index]`.
+
+        :param lines: Sequence of document lines.
+        :param index: The index of the line of the field.
+        :return: A 2-tuple (`field`, `end`) of the `Field` and the index of
+            the line following it.
+        :raises UnsupportedConstructError: If the field is not a plain name
+            with a single-line body.
+        """
+    line = lines[index]
+    match = field_marker_regex.match(line)
+    (name, body) = (match.group('name'), match.group('body'))
+    if not body:
+        raise UnsupportedConstructError(index + 1, "empty field body")
+    end = index + 1
+    if end < len(lines):
+        following_line = lines[end]
+        if following_line and not field_marker_regex.match(following_line):
+            raise UnsupportedConstructError(
+                end + 1, "field list continues or ends without a blank line")
+    if not is_plain_text(name):
+        raise UnsupportedConstructError(index + 1, "possible inline markup")
+    if (
+            body[0] in unsafe_text_start_characters
+            or enumerator_regex.match(body)
+            or not is_plain_text(body)):
+        body = None
+    field = Field(name=name, body=body, line=(index + 1))
+    return (field, end)
+
+
+def scan_bullet_item(lines, index):
+    """ Scan the bullet list item starting at `lines[index]`.
+
+        :param lines: Sequence of document lines.
+        :param index: The index of the line that starts the list item.
+        :return: A 2-tuple (`items`, `end`) of the sequence of `Paragraph`
+            items in the list item, and the index of the line following it.
+        :raises UnsupportedConstructError: If the list item contains any
+            unsupported construct.
+        """
+    line = lines[index]
+    indent = bullet_item_regex.match(line).end()
+    end = index + 1
+    line_count = len(lines)
+    while end < line_count:
+        following_line = lines[end]
+        if following_line and following_line[:indent].strip():
+            break
+        end += 1
+    blank_finish = (end == line_count) or not lines[end - 1]
+    if not blank_finish and not (
+            bullet_item_regex.match(lines[end])
+            and lines[end][0] == line[0]):
+        raise UnsupportedConstructError(
+            end + 1, "bullet list ends without a blank line")
+    item_lines = [line[indent:]] + [
+        text[indent:] for text in lines[index + 1:end]]
+    items = list(generate_document_items(
+        item_lines, line_offset=index, nested=True))
+    return (items, end)
+
+
+def scan_paragraph(lines, index):
+    """ Scan the paragraph starting at `lines[index]`.
+
+        :param lines: Sequence of document lines.
+        :param index: The index of the first line of the paragraph.
+        :return: A 2-tuple (`paragraph`, `end`) of the `Paragraph` and the
+            index of the line following it.
+        :raises UnsupportedConstructError: If the paragraph introduces some
+            other construct.
+        """
+    end = index
+    line_count = len(lines)
+    while end < line_count and lines[end]:
+        line = lines[end]
+        if line[0] == " " or (end > index and adornment_regex.match(line)):
+            raise UnsupportedConstructError(
+                end + 1, "unexpected indentation or section title")
+        end += 1
+    text = "\n".join(lines[index:end])
+    if text.endswith("::"):
+        raise UnsupportedConstructError(end, "literal block")
+    if not is_plain_text(text):
+        text = None
+    paragraph = Paragraph(text=text, line=(index + 1))
+    return (paragraph, end)
+
+
+def generate_document_items(lines, *, line_offset=0, nested=False):
+    """ Generate the document items scanned from `lines`.
+
+        :param lines: Sequence of document lines.
+        :param line_offset: Number of document lines preceding `lines`.
+        :param nested: If true, `lines` are the content of a list item, and
+            only paragraphs and bullet lists are allowed.
+        :return: Generator of items: `Heading`, `Paragraph`, `Comment`,
+            `Target`, and `Field` instances, in document order.
+        :raises UnsupportedConstructError: If the document contains any
+            construct the scanner does not handle.
+        """
+    index = 0
+    line_count = len(lines)
+    try:
+        while index < line_count:
+            line = lines[index]
+            if not line:
+                index += 1
+                continue
+            if line[0] == " ":
+                raise UnsupportedConstructError(index + 1, "unexpected indent")
+            if bullet_item_regex.match(line):
+                (items, index) = scan_bullet_item(lines, index)
+            elif nested:
+                if adornment_regex.match(line):
+                    raise UnsupportedConstructError(
+                        index + 1, "section title in list item")
+                verify_is_plain_text_start(line, line=(index + 1))
+                (item, index) = scan_paragraph(lines, index)
+                items = [item]
+            elif explicit_markup_regex.match(line):
+                (item, index) = scan_explicit_markup(lines, index)
+                items = [item]
+            elif field_marker_regex.match(line):
+                (item, index) = scan_field(lines, index)
+                items = [item]
+            else:
+                heading_result = get_heading(lines, index)
+                if heading_result is not None:
+                    (item, index) = heading_result
+                else:
+                    verify_is_plain_text_start(line, line=(index + 1))
+                    (item, index) = scan_paragraph(lines, index)
+                items = [item]
+            for item in items:
+                yield item._replace(line=(item.line + line_offset))
+    except UnsupportedConstructError as exc:
+        if exc.line is not None:
+            exc.line += line_offset
+        raise
+
+
+def has_adornment_line(lines, index, characters):
+    """ Return ``True`` iff any of `lines` from `index` could be adornment.
+
+        :param lines: Sequence of document lines.
+        :param index: The index of the first line to inspect.
+        :param characters: The adornment characters (text) to match.
+        :return: ``True`` if any line from `index` consists only of
+            `characters`; otherwise ``False``.
+        """
+    adornment_match = re.compile(
+        "[{}]+".format(re.escape(characters))).fullmatch
+    result = any(map(adornment_match, itertools.islice(lines, index, None)))
+    return result
+
+
+def generate_items_to_first_entry(
+        items, lines, *, has_adornment_line=has_adornment_line):
+    """ Generate the document `items` up to the end of the first entry.
+
+        :param items: Iterable of document items, as generated by
+            `generate_document_items` from `lines`.
+        :param lines: Sequence of document lines.
+        :param has_adornment_line: The function to query whether any line
+            from an index could be adornment, with the same signature as
+            the default `has_adornment_line`.
+        :return: Generator of the items from `items`, stopping after the
+            section title that follows the first section without
+            subsections.
+
+        The section title where generation stops is itself generated, so
+        the section tree still shows the first entry is not the last
+        section at its level.
+
+        Whether the first entry is a top-level section, or is below a
+        document title, depends on whether any later section title has a
+        style of a higher level. So generation stops early only if no later
+        line could be adornment in one of those styles; otherwise all the
+        `items` are generated.
+        """
+    items = iter(items)
+    title_styles = []
+    previous_level = 0
+    for item in items:
+        yield item
+        if not isinstance(item, Heading):
+            continue
+        if item.style not in title_styles:
+            title_styles.append(item.style)
+        level = title_styles.index(item.style) + 1
+        if previous_level and level <= previous_level:
+            higher_level_characters = "".join(sorted({
+                character
+                for (character, __) in title_styles[:(previous_level - 1)]}))
+            if higher_level_characters and has_adornment_line(
+                    lines, (item.line - 1), higher_level_characters):
+                yield from items
+            return
+        previous_level = level
+
+
+def normalise_reference_name(name):
+    """ Normalise reference `name` as Docutils does, for comparison. """
+    result = " ".join(name.lower().split())
+    return result
+
+
+def make_section_tree(items):
+    """ Make the tree of sections from the sequence of document `items`.
+
+        :param items: Iterable of document items, as generated by
+            `generate_document_items`.
+        :return: The sequence of top-level child items of the document.
+        :raises UnsupportedConstructError: If the section titles do not
+            make a consistent hierarchy, or if a reference name is repeated
+            (Docutils reports that in the document itself).
+
+        Each `Heading` starts a `Section` that contains the following items,
+        up to the next section title of the same or higher level. Adjacent
+        `Field` items are collected into a `FieldList`.
+        """
+    document_children = []
+    children_stack = [document_children]
+    title_styles = []
+    reference_names = set()
+    for item in items:
+        if isinstance(item, (Heading, Target)):
+            name = normalise_reference_name(
+                item.title if isinstance(item, Heading) else item.name)
+            if name in reference_names:
+                raise UnsupportedConstructError(
+                    item.line, "duplicate reference name")
+            reference_names.add(name)
+        if isinstance(item, Heading):
+            depth = len(children_stack) - 1
+            if item.style in title_styles:
+                level = title_styles.index(item.style) + 1
+                if level > depth + 1:
+                    raise UnsupportedConstructError(
+                        item.line, "section title level inconsistent")
+            elif len(title_styles) == depth:
+                title_styles.append(item.style)
+                level = depth + 1
+            else:
+                raise UnsupportedConstructError(
+                    item.line, "section title level inconsistent")
+            del children_stack[level:]
+            section = Section(title=item.title, line=item.line, children=[])
+            children_stack[-1].append(section)
+            children_stack.append(section.children)
+            continue
+        children = children_stack[-1]
+        if isinstance(item, Field):
+            if children and isinstance(children[-1], FieldList):
+                children[-1].fields.append(item)
+            else:
+                children.append(FieldList(fields=[item], line=item.line))
+        else:
+            children.append(item)
+    return document_children
+
+
+def is_prebibliographic(item):
+    """ Return ``True`` iff Docutils would ignore `item` for promotion. """
+    result = isinstance(item, (Comment, Target))
+    return result
+
+
+def get_promotion_candidate_index(children):
+    """ Get the index of the section to promote from `children`, if any.
+
+        :param children: Sequence of child items of the document.
+        :return: The index of the lone `Section` to promote, or ``None``.
+
+        This follows the Docutils ‘TitlePromoter’ transform: the candidate
+        is the first item that is not pre-bibliographic, only if it is a
+        `Section` and is the last item.
+        """
+    index = next(
+        (index for (index, item) in enumerate(children)
+         if not is_prebibliographic(item)),
+        None)
+    if (
+            index is None
+            or len(children) > (index + 1)
+            or not isinstance(children[index], Section)):
+        index = None
+    return index
+
+
+def make_scanned_document(items):
+    """ Make the `ScannedDocument` from the sequence of document `items`.
+
+        :param items: Iterable of document items, as generated by
+            `generate_document_items`.
+        :return: A new `ScannedDocument` for the document.
+        """
+    children = make_section_tree(items)
+    (title, subtitle, docinfo) = (None, None, None)
+    index = get_promotion_candidate_index(children)
+    if index is not None:
+        title = children[index].title
+        children = children[:index] + children[index].children
+        index = get_promotion_candidate_index(children)
+        if index is not None:
+            subtitle = children[index].title
+            children = children[:index] + children[index].children
+    index = next(
+        (index for (index, item) in enumerate(children)
+         if not is_prebibliographic(item)),
+        None)
+    if index is not None and isinstance(children[index], FieldList):
+        docinfo = children[index]
+        children = children[:index] + children[index + 1:]
+    document = ScannedDocument(
+        title=title, subtitle=subtitle, docinfo=docinfo, children=children)
+    return document
+
+
+def get_changelog_entry_nodes_from_document(document):
+    """ Get the items from `document` that represent change log entries.
+
+        :param document: The `ScannedDocument` to query.
+        :return: Sequence of `Section` instances, each representing a change
+            log entry; or a sequence of just the `document` if it has no
+            top-level sections.
+        """
+    entry_nodes = [
+        item for item in document.children if isinstance(item, Section)]
+    if not entry_nodes:
+        entry_nodes = [document]
+    return entry_nodes
+
+
+def get_changelog_entry_title(entry_node):
+    """ Get the Change Log entry title of `entry_node`.
+
+        :param entry_node: The `Section` or `ScannedDocument` to query.
+        :return: The title (text) that is the change log entry title.
+        :raises UnsupportedConstructError: If no title matches the expected
+            Change Log entry title pattern.
+        """
+    candidate_titles = (
+        [entry_node.title, entry_node.subtitle]
+        if isinstance(entry_node, ScannedDocument)
+        else [entry_node.title])
+    for title in candidate_titles:
+        if (
+                title is not None
+                and is_plain_text(title)
+                and core.entry_title_regex.match(title)):
+            return title
+    raise UnsupportedConstructError(
+        getattr(entry_node, 'line', None), "no change log entry title found")
+
+
+def get_changelog_entry_fields(entry_node):
+    """ Get the field values for a `ChangeLogEntry` from `entry_node`.
+
+        :param entry_node: The `Section` or `ScannedDocument` representing
+            the change log entry.
+        :return: A mapping of `ChangeLogEntry` field name to text value.
+        :raises UnsupportedConstructError: If the entry does not have the
+            structure of a well-formed Change Log entry.
+        """
+    line = getattr(entry_node, 'line', None)
+    title = get_changelog_entry_title(entry_node)
+    if isinstance(entry_node, ScannedDocument):
+        field_list = entry_node.docinfo
+        if field_list is not None and any(
+                field.name.lower() in bibliographic_field_names
+                or "$" in field.body
+                for field in field_list.fields):
+            raise UnsupportedConstructError(
+                line, "bibliographic field in document info")
+    else:
+        field_list = next(
+            (item for item in entry_node.children
+             if isinstance(item, FieldList)),
+            None)
+    if field_list is None:
+        raise UnsupportedConstructError(line, "no field list for entry")
+    body_items = [
+        item for item in entry_node.children
+        if not isinstance(item, FieldList)]
+    if any(
+            isinstance(item, (Section, Target)) or not item.text
+            for item in body_items):
+        raise UnsupportedConstructError(line, "unsupported entry content")
+    field_bodies = {}
+    for field in field_list.fields:
+        field_bodies.setdefault(field.name.lower(), field.body)
+    (release_date_text, maintainer_text) = (
+        field_bodies.get('released'), field_bodies.get('maintainer'))
+    if release_date_text is None or maintainer_text is None:
+        raise UnsupportedConstructError(line, "no plain text metadata field")
+    fields = {
+        'release_date': release_date_text,
+        'version': core.get_version_text_from_entry_title(title),
+        'maintainer': maintainer_text,
+        'body': "\n\n".join(item.text for item in body_items),
+    }
+    return fields
+
+
+def get_body_source_span(entry_node, next_entry_node, document_source):
+    """ Get the span of the source text of the body of `entry_node`.
+
+        :param entry_node: The `Section` or `ScannedDocument` representing
+            the change log entry.
+        :param next_entry_node: The `Section` representing the following
+            change log entry, or ``None`` if there is none.
+        :param document_source: The `core.DocumentSource` of the document.
+        :return: The `model.TextSpan` of the body source text, from the
+            line following the entry's field list, to the end of the entry.
+        """
+    field_list = (
+        entry_node.docinfo if isinstance(entry_node, ScannedDocument)
+        else next(
+            item for item in entry_node.children
+            if isinstance(item, FieldList)))
+    end = (
+        len(document_source) if next_entry_node is None
+        else (next_entry_node.line - 1))
+    field_list_end_line = field_list.fields[-1].line
+    start = next(
+        (item.line - 1 for item in entry_node.children
+         if item.line > field_list_end_line),
+        end)
+    span = document_source.get_lines_span(start, end)
+    return span
+
+
+def make_change_log_entries_from_nodes(entry_nodes, document_source):
+    """ Make a `ChangeLogEntry` from each of `entry_nodes`.
+
+        :param entry_nodes: Sequence of the `Section` or `ScannedDocument`
+            items representing the change log entries, in document order.
+        :param document_source: The `core.DocumentSource` of the document.
+        :return: A sequence of `models.ChangeLogEntry` instances.
+        :raises UnsupportedConstructError: If any entry does not have the
+            structure of a well-formed Change Log entry.
+
+        The entries are validated only after all entries are scanned, so
+        that a document with some construct the scanner does not handle
+        always raises `UnsupportedConstructError`.
+        """
+    with instrumentation.stage('field_lookup') as stage:
+        entries_fields = [
+            get_changelog_entry_fields(entry_node)
+            for entry_node in entry_nodes]
+        stage.add_counts(fields=sum(
+            len(fields) for fields in entries_fields))
+    body_sources = [
+        get_body_source_span(entry_node, next_entry_node, document_source)
+        for (entry_node, next_entry_node) in zip(
+            entry_nodes, itertools.chain(entry_nodes[1:], [None]))]
+    with instrumentation.stage('model_validation', entries=len(entry_nodes)):
+        entries = [
+            model.ChangeLogEntry(**fields, body_source=body_source)
+            for (fields, body_source) in zip(entries_fields, body_sources)]
+    return entries
+
+
+def scan_change_log_entries_from_text(document_text):
+    """ Make sequence of `ChangeLogEntry` by scanning `document_text`.
+
+        :param document_text: Text of the document in reStructuredText format.
+        :return: A sequence of `models.ChangeLogEntry` instances, representing
+            the Change Log entries from the document.
+        :raises TypeError: If `document_text` is not a text string.
+        :raises UnsupportedConstructError: If the document contains any
+            construct the scanner does not handle.
+
+        The entries are validated only after all entries are scanned, so
+        that a document with some construct the scanner does not handle
+        always raises `UnsupportedConstructError`.
+        """
+    with instrumentation.stage('scan') as stage:
+        lines = get_document_lines(document_text)
+        stage.add_counts(characters=len(document_text))
+        document = make_scanned_document(generate_document_items(lines))
+        entry_nodes = get_changelog_entry_nodes_from_document(document)
+    entries = make_change_log_entries_from_nodes(
+        entry_nodes, core.DocumentSource(document_text))
+    return entries
+
+
+def scan_latest_change_log_entry_from_text(document_text):
+    """ Make the latest `ChangeLogEntry` by scanning `document_text`.
+
+        :param document_text: Text of the document in reStructuredText format.
+        :return: The `models.ChangeLogEntry` instance representing the first
+            (latest) Change Log entry in the document.
+        :raises TypeError: If `document_text` is not a text string.
+        :raises UnsupportedConstructError: If the document, up to the end of
+            the first entry, contains any construct the scanner does not
+            handle.
+
+        Scanning stops at the section title following the first entry, so
+        the cost does not grow with the number of older entries. Content
+        after that point is not examined, other than to look for section
+        titles that would change the document structure.
+        """
+    lines = get_document_lines(document_text)
+    document = make_scanned_document(
+        generate_items_to_first_entry(generate_document_items(lines), lines))
+    entry = make_latest_change_log_entry(document, document_text)
+    return entry
+
+
+def make_latest_change_log_entry(document, document_text):
+    """ Make the latest `ChangeLogEntry` from the scanned `document`.
+
+        :param document: The `ScannedDocument`, scanned at least as far as
+            the end of the first entry.
+        :param document_text: Text of the document, from its start to at
+            least the end of the first entry.
+        :return: The `models.ChangeLogEntry` instance representing the first
+            (latest) Change Log entry in the document.
+        :raises UnsupportedConstructError: If the first entry does not have
+            the structure of a well-formed Change Log entry.
+        """
+    (entry_node, *following_entry_nodes) = (
+        get_changelog_entry_nodes_from_document(document))
+    fields = get_changelog_entry_fields(entry_node)
+    body_source = get_body_source_span(
+        entry_node, next(iter(following_entry_nodes), None),
+        core.DocumentSource(document_text))
+    entry = model.ChangeLogEntry(**fields, body_source=body_source)
+    return entry
+
+
+def scan_latest_change_log_entry_from_file(
+        document_file, *, initial_size=(64 * 1024)):
+    """ Make the latest `ChangeLogEntry` by scanning `document_file`.
+
+        :param document_file: The `core.ChangeLogDocumentFile` to scan.
+        :param initial_size: The size (integer, in bytes) of the first part
+            of the file to decode and scan.
+        :return: The `models.ChangeLogEntry` instance representing the first
+            (latest) Change Log entry in the document.
+        :raises UnsupportedConstructError: If the document, up to the end of
+            the first entry, contains any construct the scanner does not
+            handle.
+        :raises UnicodeDecodeError: If the part of the document decoded is
+            not valid text.
+
+        Only the start of the file is decoded, and scanned as for
+        `scan_latest_change_log_entry_from_text`. If that part does not
+        include the end of the first entry, twice as much is decoded and
+        scanned, until the end of the file; likewise if that part ends
+        with a construct the scanner does not handle, since the construct
+        might be complete in a larger part. The rest of the file is only
+        searched, without decoding, for adornment lines that would change
+        the document structure.
+        """
+    file_size = len(document_file)
+    size = initial_size
+    while True:
+        end = document_file.get_line_end(min(size, file_size))
+        is_complete = (end >= file_size)
+        document_text = document_file.decode(0, end)
+        adornment_found = []
+
+        def has_adornment_line_in_file(lines, index, characters):
+            """ Return ``True`` iff any line in the file could be adornment.
+                """
+            result = has_adornment_line(lines, index, characters)
+            if not (result or is_complete):
+                adornment_regex = re.compile(
+                    rb"^[" + re.escape(characters.encode('ascii'))
+                    + rb"]+[ \t\v\f\r]*$",
+                    re.MULTILINE)
+                result = bool(adornment_regex.search(
+                    document_file.content, end))
+            adornment_found.append(result)
+            return result
+
+        lines = get_document_lines(document_text)
+        try:
+            document = make_scanned_document(generate_items_to_first_entry(
+                generate_document_items(lines), lines,
+                has_adornment_line=has_adornment_line_in_file))
+        except UnsupportedConstructError:
+            if is_complete:
+                raise
+            # The construct might only be cut short by the end of the part.
+            size *= 2
+            continue
+        if is_complete:
+            break
+        if any(adornment_found):
+            # The structure of the whole document is needed.
+            size = file_size
+            continue
+        if len(get_changelog_entry_nodes_from_document(document)) > 1:
+            # The first entry ends before the end of the part scanned.
+            break
+        size *= 2
+    entry = make_latest_change_log_entry(document, document_text)
+    return entry
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
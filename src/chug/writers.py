@@ -7,7 +7,13 @@
 
 """ Version information writers for various output formats. """
 
+import collections.abc
+import datetime
 import json
+import re
+import struct
+
+from . import model
 
 
 def serialise_version_info_from_mapping_to_json(version_info):
@@ -20,6 +26,460 @@ def serialise_version_info_from_mapping_to_json(version_info):
 
     return content
 
+
+ndjson_chunk_size = 64 * 1024
+""" Size (number of bytes) above which buffered NDJSON output is written. """
+
+
+def write_all_to_file(outfile, content):
+    """ Write all of `content` to the binary `outfile`.
+
+        :param outfile: The binary file object to write to.
+        :param content: The bytes to write.
+        :return: ``None``.
+
+        A raw file object may write only some of the bytes; the rest are
+        written by calling `outfile.write` again.
+        """
+    view = memoryview(content)
+    while view:
+        count = outfile.write(view)
+        if count is None:
+            # The file object does not report a count; assume all written.
+            break
+        view = view[count:]
+
+
+def write_entries_to_ndjson(
+        entries, outfile, *, chunk_size=ndjson_chunk_size):
+    """ Write the `entries` to `outfile` as newline-delimited JSON.
+
+        :param entries: Iterable of `ChangeLogEntry` instances, or of
+            mappings of version info items.
+        :param outfile: The binary file object to write to.
+        :param chunk_size: Number of bytes of output to collect before
+            writing it to `outfile`.
+        :return: The number (integer) of bytes written.
+
+        Each entry is serialised as one line of JSON in UTF-8, with compact
+        separators, as from `ChangeLogEntry.as_version_info_entry`. The
+        `entries` are consumed lazily, and the output is written in chunks
+        of about `chunk_size` bytes, so the whole output is never held in
+        memory.
+        """
+    encode = json.JSONEncoder(
+        ensure_ascii=False, separators=(",", ":")).encode
+    chunk_lines = []
+    chunk_length = 0
+    total_length = 0
+    for entry in entries:
+        version_info = (
+            entry if isinstance(entry, collections.abc.Mapping)
+            else entry.as_version_info_entry())
+        line = (encode(version_info) + "\n").encode('utf-8')
+        chunk_lines.append(line)
+        chunk_length += len(line)
+        if chunk_length >= chunk_size:
+            write_all_to_file(outfile, b"".join(chunk_lines))
+            total_length += chunk_length
+            chunk_lines.clear()
+            chunk_length = 0
+    if chunk_lines:
+        write_all_to_file(outfile, b"".join(chunk_lines))
+        total_length += chunk_length
+    return total_length
+
+
+class BinaryFormatError(ValueError):
+    """ Raised when data is not valid in the compact binary format. """
+
+
+binary_format_magic = b"CHUG"
+""" The bytes at the start of data in the compact binary format. """
+
+binary_format_version = 1
+""" Version of the compact binary format; change it when the layout does. """
+
+binary_header_struct = struct.Struct("<4sHxxII")
+""" Layout of the header of the compact binary format.
+
+    The fields are: the `binary_format_magic` bytes; the format version;
+    the number of entries; and the number of strings in the string table.
+    """
+
+binary_entry_struct = struct.Struct("<iqII")
+""" Layout of each entry record in the compact binary format.
+
+    The fields are the codes of the release date, the version, the
+    maintainer, and the body; see `serialise_entries_to_binary`.
+    """
+
+binary_string_offset_struct = struct.Struct("<I")
+""" Layout of each offset of a string in the string table. """
+
+binary_string_span_struct = struct.Struct("<II")
+""" Layout of the offsets of the start and end of a string in the table. """
+
+binary_version_regex = re.compile(
+    r"^(0|[1-9][0-9]{0,5})\.(0|[1-9][0-9]{0,5})\.(0|[1-9][0-9]{0,5})$")
+""" Regular Expression pattern to match a version that can be packed.
+
+    Each of the three components fits in 21 bits, so the version packs
+    into a non-negative signed 64-bit integer.
+    """
+
+binary_version_component_bits = 21
+""" Number of bits for each version component in a packed version. """
+
+
+def get_binary_string_code(text, index_by_string):
+    """ Get the code of `text` in the string table `index_by_string`.
+
+        :param text: The text to add to the string table, or ``None``.
+        :param index_by_string: Mapping of text to its index in the string
+            table, in order of index. `text` is added if not present.
+        :return: The code (integer) of `text`: zero for ``None``, or one
+            more than the index of `text` in the string table.
+        """
+    if text is None:
+        return 0
+    result = index_by_string.setdefault(text, len(index_by_string)) + 1
+    return result
+
+
+def pack_binary_release_date(text, index_by_string):
+    """ Pack the release date `text` as an integer code.
+
+        :param text: The `release_date` text of an entry.
+        :param index_by_string: Mapping of text to its index in the string
+            table, as for `get_binary_string_code`.
+        :return: The code (integer) of the release date: the positive
+            proleptic Gregorian ordinal of the date; or, if `text` is not
+            a date in ISO 8601 format, the negative string code of `text`.
+        """
+    try:
+        date = datetime.date.fromisoformat(text)
+    except (TypeError, ValueError):
+        date = None
+    if date is not None and date.isoformat() == text:
+        result = date.toordinal()
+    else:
+        result = -get_binary_string_code(text, index_by_string)
+    return result
+
+
+def pack_binary_version(text, index_by_string):
+    """ Pack the version `text` as an integer code.
+
+        :param text: The `version` text of an entry.
+        :param index_by_string: Mapping of text to its index in the string
+            table, as for `get_binary_string_code`.
+        :return: The code (integer) of the version: the non-negative packed
+            ‘major.minor.patch’ components; or, if `text` does not match
+            `binary_version_regex`, the negative string code of `text`.
+        """
+    version_match = binary_version_regex.match(text)
+    if version_match is not None:
+        (major, minor, patch) = map(int, version_match.groups())
+        result = (
+            ((major << binary_version_component_bits) | minor)
+            << binary_version_component_bits) | patch
+    else:
+        result = -get_binary_string_code(text, index_by_string)
+    return result
+
+
+def unpack_binary_version(code):
+    """ Unpack the version components from the packed version `code`.
+
+        :param code: The non-negative packed version (integer).
+        :return: The 3-tuple (`major`, `minor`, `patch`) of the version
+            components (integer).
+        """
+    mask = (1 << binary_version_component_bits) - 1
+    result = (
+        code >> (2 * binary_version_component_bits),
+        (code >> binary_version_component_bits) & mask,
+        code & mask)
+    return result
+
+
+def serialise_entries_to_binary(entries):
+    """ Serialise the `entries` to the compact binary format.
+
+        :param entries: Iterable of `ChangeLogEntry` instances.
+        :return: The serialised data (bytes).
+
+        The data is a header (`binary_header_struct`); a fixed-size record
+        for each entry (`binary_entry_struct`); the offsets of each string
+        in the string table, and of its end; and the string table, of UTF-8
+        encoded text. Each distinct text, such as a maintainer, is stored
+        once in the string table. Release dates and versions are packed as
+        integers where possible, as by `pack_binary_release_date` and
+        `pack_binary_version`.
+
+        The `body_source` of an entry is not serialised.
+        """
+    index_by_string = {}
+    records = bytearray()
+    entry_count = 0
+    for entry in entries:
+        (release_date, version, maintainer, body) = entry.field_values()
+        records += binary_entry_struct.pack(
+            pack_binary_release_date(release_date, index_by_string),
+            pack_binary_version(version, index_by_string),
+            get_binary_string_code(maintainer, index_by_string),
+            get_binary_string_code(body, index_by_string))
+        entry_count += 1
+    encoded_strings = [text.encode('utf-8') for text in index_by_string]
+    string_offsets = [0]
+    for encoded_string in encoded_strings:
+        string_offsets.append(string_offsets[-1] + len(encoded_string))
+    result = b"".join([
+        binary_header_struct.pack(
+            binary_format_magic, binary_format_version,
+            entry_count, len(encoded_strings)),
+        records,
+        struct.pack(
+            "<{count}I".format(count=len(string_offsets)), *string_offsets),
+        *encoded_strings,
+    ])
+    return result
+
+
+class BinaryEntryReader(collections.abc.Sequence):
+    """ Sequence of entries, read from data in the compact binary format.
+
+        Each entry is decoded only when it is accessed, so the Nth entry
+        can be read without decoding any other entry. The data, which may
+        be any bytes-like object such as a memory-mapped file, is not
+        copied.
+        """
+
+    def __init__(self, data):
+        """ Set up a new instance.
+
+            :param data: The bytes-like object of serialised data, as from
+                `serialise_entries_to_binary`.
+            :raises BinaryFormatError: If the header of `data` is not valid,
+                or `data` is too short for its entries and string table.
+            """
+        self.data = memoryview(data).cast('B')
+        try:
+            (magic, format_version, entry_count, string_count) = (
+                binary_header_struct.unpack_from(self.data))
+        except struct.error as exc:
+            raise BinaryFormatError("data too short for header") from exc
+        if magic != binary_format_magic:
+            raise BinaryFormatError(
+                "not the compact binary format: {magic!r}".format(
+                    magic=bytes(magic)))
+        if format_version != binary_format_version:
+            raise BinaryFormatError(
+                "unsupported format version: {version}".format(
+                    version=format_version))
+        self.entry_count = entry_count
+        self.string_count = string_count
+        self.records_offset = binary_header_struct.size
+        self.string_offsets_offset = (
+            self.records_offset + (entry_count * binary_entry_struct.size))
+        self.strings_offset = (
+            self.string_offsets_offset
+            + ((string_count + 1) * binary_string_offset_struct.size))
+        if len(self.data) < self.strings_offset:
+            raise BinaryFormatError("data too short for entries")
+        (strings_size,) = binary_string_offset_struct.unpack_from(
+            self.data, self.strings_offset - binary_string_offset_struct.size)
+        if len(self.data) < self.strings_offset + strings_size:
+            raise BinaryFormatError("data too short for string table")
+
+    def __len__(self):
+        return self.entry_count
+
+    def get_string(self, code):
+        """ Get the text for string `code` from the string table.
+
+            :param code: The string code (integer), as from
+                `get_binary_string_code`.
+            :return: The text, or ``None`` if `code` is zero.
+            :raises BinaryFormatError: If `code` is not in the string table.
+            """
+        if code == 0:
+            return None
+        if not (0 < code <= self.string_count):
+            raise BinaryFormatError(
+                "string code not in table: {code}".format(code=code))
+        (start, end) = binary_string_span_struct.unpack_from(
+            self.data,
+            self.string_offsets_offset
+            + ((code - 1) * binary_string_offset_struct.size))
+        try:
+            result = str(
+                self.data[
+                    self.strings_offset + start:self.strings_offset + end],
+                'utf-8')
+        except UnicodeDecodeError as exc:
+            raise BinaryFormatError(
+                "string not valid UTF-8: {code}".format(code=code)) from exc
+        return result
+
+    def get_strings(self):
+        """ Get all the texts in the string table.
+
+            :return: A list of the texts, indexed by string code; the text
+                at index zero is ``None``.
+            :raises BinaryFormatError: If a string is not valid UTF-8.
+            """
+        string_offsets = struct.unpack_from(
+            "<{count}I".format(count=(self.string_count + 1)),
+            self.data, self.string_offsets_offset)
+        strings_data = self.data[self.strings_offset:]
+        try:
+            result = [None, *(
+                str(strings_data[start:end], 'utf-8')
+                for (start, end) in zip(string_offsets, string_offsets[1:]))]
+        except UnicodeDecodeError as exc:
+            raise BinaryFormatError("string not valid UTF-8") from exc
+        return result
+
+    @staticmethod
+    def unpack_entry(codes, get_string):
+        """ Make the entry from its record `codes`.
+
+            :param codes: The tuple of codes unpacked from the entry record,
+                as for `binary_entry_struct`.
+            :param get_string: Callable to get the text (or ``None``) for
+                a string code.
+            :return: A new `model.ChangeLogEntry` for the entry.
+            :raises BinaryFormatError: If the release date, version, or
+                maintainer is not valid.
+
+            A packed release date or version is made into its parsed value
+            directly, without parsing its text again.
+            """
+        # Import ‘semver’ only when an entry is first read, so that
+        # importing this module does not pay for it.
+        import semver
+
+        (release_date_code, version_code, maintainer_code, body_code) = codes
+        if release_date_code > 0:
+            try:
+                release_date_value = datetime.date.fromordinal(
+                    release_date_code)
+            except ValueError as exc:
+                raise BinaryFormatError(
+                    "release date not valid: {code}".format(
+                        code=release_date_code)) from exc
+            release_date = release_date_value.isoformat()
+        else:
+            release_date = get_string(-release_date_code)
+            if release_date is None:
+                raise BinaryFormatError("release date missing")
+            try:
+                release_date_value = model.ChangeLogEntry.parse_release_date(
+                    release_date)
+            except model.DateInvalidError as exc:
+                raise BinaryFormatError(
+                    "release date not valid: {text!r}".format(
+                        text=release_date)) from exc
+        if version_code >= 0:
+            (major, minor, patch) = unpack_binary_version(version_code)
+            version = "{major}.{minor}.{patch}".format(
+                major=major, minor=minor, patch=patch)
+            version_info = semver.Version(major, minor, patch)
+        else:
+            version = get_string(-version_code)
+            try:
+                version_info = model.ChangeLogEntry.parse_version(version)
+            except model.VersionInvalidError as exc:
+                raise BinaryFormatError(
+                    "version not valid: {text!r}".format(
+                        text=version)) from exc
+        maintainer = get_string(maintainer_code)
+        try:
+            entry = model.ChangeLogEntry.from_parsed_values(
+                release_date, version, maintainer, get_string(body_code),
+                release_date_value=release_date_value,
+                version_info=version_info)
+        except model.PersonDetailsInvalidError as exc:
+            raise BinaryFormatError(
+                "maintainer not valid: {text!r}".format(
+                    text=maintainer)) from exc
+        return entry
+
+    def get_entry(self, index):
+        """ Get the entry at `index`.
+
+            :param index: The index (non-negative integer) of the entry.
+            :return: A new `model.ChangeLogEntry` for the entry.
+            :raises IndexError: If `index` is not in the range of entries.
+            :raises BinaryFormatError: If the entry record is not valid.
+
+            Only the strings of this entry are decoded.
+            """
+        if not (0 <= index < self.entry_count):
+            raise IndexError(
+                "entry index out of range: {index}".format(index=index))
+        try:
+            codes = binary_entry_struct.unpack_from(
+                self.data,
+                self.records_offset + (index * binary_entry_struct.size))
+        except struct.error as exc:
+            raise BinaryFormatError(
+                "data too short for entry: {index}".format(
+                    index=index)) from exc
+        result = self.unpack_entry(codes, self.get_string)
+        return result
+
+    def __getitem__(self, index):
+        """ Get the entry at `index`, or the entries in a slice.
+
+            :param index: The index (integer) of the entry, where negative
+                values count from the end; or a `slice` of the entries.
+            :return: A new `model.ChangeLogEntry` for the entry; or, for a
+                slice, a list of new `model.ChangeLogEntry` instances.
+            :raises IndexError: If `index` is out of range.
+            :raises BinaryFormatError: If an entry record is not valid.
+            """
+        entry_indices = range(len(self))[index]
+        if isinstance(index, slice):
+            result = [
+                self.get_entry(entry_index) for entry_index in entry_indices]
+        else:
+            result = self.get_entry(entry_indices)
+        return result
+
+    def __iter__(self):
+        """ Generate each entry, in order.
+
+            :return: A generator of new `model.ChangeLogEntry` instances.
+            :raises BinaryFormatError: If an entry record is not valid.
+
+            The string table is decoded once, for all the entries.
+            """
+        get_string = self.get_strings().__getitem__
+        records = self.data[self.records_offset:self.string_offsets_offset]
+        for codes in binary_entry_struct.iter_unpack(records):
+            try:
+                entry = self.unpack_entry(codes, get_string)
+            except IndexError as exc:
+                raise BinaryFormatError(
+                    "string code not in table: {codes}".format(
+                        codes=codes)) from exc
+            yield entry
+
+
+def read_entries_from_binary(data):
+    """ Read all the entries from `data` in the compact binary format.
+
+        :param data: The bytes-like object of serialised data, as from
+            `serialise_entries_to_binary`.
+        :return: A list of `model.ChangeLogEntry` instances.
+        :raises BinaryFormatError: If `data` is not valid.
+        """
+    result = list(BinaryEntryReader(data))
+    return result
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
@@ -8,6 +8,8 @@
 """ Test suite for this code base. """
 
 import contextlib
+import os
+import tempfile
 
 import testtools
 
@@ -49,6 +51,20 @@ def make_expected_error_context(
         )
     return context
 
+
+def make_temporary_file_path(testcase, content):
+    """ Make a temporary file of `content` for the duration of `testcase`.
+
+        :param testcase: The `TestCase` instance for binding to the cleanup.
+        :param content: The content (bytes) to write to the file.
+        :return: The filesystem path (text) of the new file.
+        """
+    (outfile_fd, path) = tempfile.mkstemp()
+    testcase.addCleanup(os.unlink, path)
+    with os.fdopen(outfile_fd, 'wb') as outfile:
+        outfile.write(content)
+    return path
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
@@ -0,0 +1,229 @@
+# test/test_aio.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Test cases for ‘chug.aio’ module. """
+
+import asyncio
+import concurrent.futures
+
+import testscenarios
+import testtools
+
+import chug.aio
+import chug.parsers.batch
+
+from .test_parsers_batch import make_test_infile_paths
+
+
+def get_versions_from_results(results):
+    """ Get the versions of the entries in each of `results`.
+
+        :param results: Sequence of `DocumentParseResult` instances.
+        :return: A sequence of the sequence of entry version texts from
+            each result, or ``None`` for a result with an error.
+        """
+    versions = [
+        (None if result.error is not None else [
+            entry.version for entry in result.entries])
+        for result in results]
+    return versions
+
+
+async def collect_async_iterator(async_iterator):
+    """ Get a list of the items from `async_iterator`. """
+    result = [item async for item in async_iterator]
+    return result
+
+
+class load_entries_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘load_entries’ function. """
+
+    function_to_test = staticmethod(chug.aio.load_entries)
+
+    scenarios = [
+        ('executor-default', {
+            'test_executor_class': None,
+        }),
+        ('executor-thread-pool', {
+            'test_executor_class': concurrent.futures.ThreadPoolExecutor,
+        }),
+        ('executor-process-pool', {
+            'test_executor_class': concurrent.futures.ProcessPoolExecutor,
+        }),
+    ]
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_executor = None
+        if self.test_executor_class is not None:
+            self.test_executor = self.test_executor_class(1)
+            self.addCleanup(self.test_executor.shutdown)
+
+    def test_returns_entries_from_document(self):
+        """ Should return the entries from the document. """
+        (infile_path,) = make_test_infile_paths(self, ["1.0"])
+        result = asyncio.run(self.function_to_test(
+            infile_path, executor=self.test_executor))
+        self.assertEqual(["1.0"], [entry.version for entry in result])
+
+    def test_raises_error_for_invalid_document(self):
+        """ Should raise DocumentParseError for an invalid document. """
+        (infile_path,) = make_test_infile_paths(self, [None])
+        with testtools.ExpectedException(
+                chug.parsers.batch.DocumentParseError):
+            __ = asyncio.run(self.function_to_test(
+                infile_path, executor=self.test_executor))
+
+
+class iter_entries_TestCase(testtools.TestCase):
+    """ Test cases for ‘iter_entries’ function. """
+
+    function_to_test = staticmethod(chug.aio.iter_entries)
+
+    def test_generates_entries_from_document(self):
+        """ Should generate the entries from the document. """
+        (infile_path,) = make_test_infile_paths(self, ["1.0"])
+        result = asyncio.run(collect_async_iterator(
+            self.function_to_test(infile_path)))
+        self.assertEqual(["1.0"], [entry.version for entry in result])
+
+
+class load_many_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘load_many’ function. """
+
+    function_to_test = staticmethod(chug.aio.load_many)
+
+    scenarios = [
+        ('concurrency-default', {
+            'test_kwargs': {},
+        }),
+        ('concurrency-one', {
+            'test_kwargs': {'concurrency': 1},
+        }),
+        ('concurrency-two', {
+            'test_kwargs': {'concurrency': 2},
+        }),
+    ]
+
+    test_versions = ["1.0", None, "1.2", "1.3", None, "1.5"]
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_infile_paths = make_test_infile_paths(
+            self, self.test_versions)
+
+    def test_returns_results_in_input_order(self):
+        """ Should return the result for each document, in input order. """
+        result = asyncio.run(self.function_to_test(
+            self.test_infile_paths, **self.test_kwargs))
+        self.assertEqual(
+            self.test_infile_paths,
+            [item.infile_path for item in result])
+        self.assertEqual(
+            [
+                (None if version is None else [version])
+                for version in self.test_versions],
+            get_versions_from_results(result))
+
+    def test_loads_at_most_concurrency_documents_at_once(self):
+        """ Should load no more than `concurrency` documents at once. """
+        concurrency = self.test_kwargs.get(
+            'concurrency', chug.aio.default_concurrency)
+        active_counts = []
+        active_count = 0
+        load_result = chug.aio.load_result
+
+        async def fake_load_result(infile_path, *, executor=None):
+            nonlocal active_count
+            active_count += 1
+            active_counts.append(active_count)
+            await asyncio.sleep(0)
+            result = await load_result(infile_path, executor=executor)
+            active_count -= 1
+            return result
+
+        self.patch(chug.aio, 'load_result', fake_load_result)
+        __ = asyncio.run(self.function_to_test(
+            self.test_infile_paths, **self.test_kwargs))
+        self.assertEqual(
+            min(concurrency, len(self.test_infile_paths)),
+            max(active_counts))
+
+    def test_raises_error_for_concurrency_zero(self):
+        """ Should raise ValueError if `concurrency` is zero. """
+        with testtools.ExpectedException(ValueError):
+            __ = asyncio.run(self.function_to_test(
+                self.test_infile_paths, concurrency=0))
+
+
+class iter_load_many_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘iter_load_many’ function. """
+
+    function_to_test = staticmethod(chug.aio.iter_load_many)
+
+    scenarios = load_many_TestCase.scenarios
+
+    test_versions = load_many_TestCase.test_versions
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_infile_paths = make_test_infile_paths(
+            self, self.test_versions)
+
+    def test_generates_result_for_each_document(self):
+        """ Should generate the result for each document. """
+        result = asyncio.run(collect_async_iterator(self.function_to_test(
+            self.test_infile_paths, **self.test_kwargs)))
+        self.assertEqual(
+            sorted(self.test_infile_paths),
+            sorted(item.infile_path for item in result))
+
+    def test_cancels_remaining_loads_when_closed(self):
+        """ Should cancel loading remaining documents when closed. """
+        loaded_paths = []
+        load_result = chug.aio.load_result
+
+        async def fake_load_result(infile_path, *, executor=None):
+            result = await load_result(infile_path, executor=executor)
+            loaded_paths.append(infile_path)
+            return result
+
+        async def get_first_result():
+            results = self.function_to_test(
+                self.test_infile_paths, concurrency=1)
+            result = await results.__anext__()
+            await results.aclose()
+            await asyncio.sleep(0.1)
+            return result
+
+        self.patch(chug.aio, 'load_result', fake_load_result)
+        result = asyncio.run(get_first_result())
+        self.assertEqual([result.infile_path], loaded_paths)
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -0,0 +1,114 @@
+# test/test_import_time.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Regression test cases for the time to import the ‘chug’ modules. """
+
+import os
+import pathlib
+import subprocess
+import sys
+
+import testscenarios
+import testtools
+
+import chug
+
+
+chug_import_path = str(pathlib.Path(chug.__file__).parent.parent)
+""" Filesystem path of the directory from which ‘chug’ is imported. """
+
+
+def get_import_times(module_name):
+    """ Get the import times reported for importing `module_name`.
+
+        :param module_name: The full name (text) of the module to import.
+        :return: Mapping of module name, to cumulative time (integer, in
+            microseconds) to import that module, for each module imported.
+
+        The module is imported in a new Python interpreter, with the
+        ‘-X importtime’ option.
+        """
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [chug_import_path]
+        + ([environment['PYTHONPATH']] if 'PYTHONPATH' in environment else []))
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+    process = subprocess.run(
+        [
+            sys.executable, "-X", "importtime",
+            "-c", "import {}".format(module_name)],
+        env=environment, capture_output=True, text=True, check=True)
+    result = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        (__, cumulative_text, name) = line.split("|")
+        if not cumulative_text.strip().isdigit():
+            # This is the heading line.
+            continue
+        result[name.strip()] = int(cumulative_text)
+    return result
+
+
+class import_time_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for the time to import each ‘chug’ module. """
+
+    scenarios = [
+        ('chug', {
+            'module_name': "chug",
+            'budget_milliseconds': 25,
+        }),
+        ('chug.model', {
+            'module_name': "chug.model",
+            'budget_milliseconds': 75,
+        }),
+        ('chug.parsers', {
+            'module_name': "chug.parsers",
+            'budget_milliseconds': 100,
+        }),
+        ('chug.parsers.rest', {
+            'module_name': "chug.parsers.rest",
+            'budget_milliseconds': 100,
+        }),
+    ]
+
+    deferred_module_names = ["docutils", "semver"]
+    """ Names of modules that should not be imported by these modules. """
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+        # Import once first, so that any cached byte code is written and
+        # the measured import does not include compiling the modules.
+        get_import_times(self.module_name)
+        self.import_times = get_import_times(self.module_name)
+
+    def test_does_not_import_deferred_modules(self):
+        """ Should not import the modules needed only by some code paths. """
+        for name in self.deferred_module_names:
+            self.assertNotIn(name, self.import_times)
+
+    def test_import_time_within_budget(self):
+        """ Should import within the budget of time. """
+        import_milliseconds = self.import_times[self.module_name] / 1000
+        self.assertLessEqual(import_milliseconds, self.budget_milliseconds)
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -9,15 +9,114 @@
 
 import collections
 import contextlib
+import copy
+import datetime
 import functools
+import pickle
 import textwrap
+import types
+import unittest.mock
 
+import semver
 import testscenarios
 import testtools
 
 import chug.model
 
 
+class SpecialValue_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘SpecialValue’ class. """
+
+    scenarios = [
+        ('unknown', {
+            'test_value': chug.model.unknown_value,
+            'expected_text': "UNKNOWN",
+            'expected_sorted_values': [
+                chug.model.unknown_value,
+                datetime.date(2001, 1, 1),
+                semver.Version(1, 0, 0),
+            ],
+        }),
+        ('next', {
+            'test_value': chug.model.next_value,
+            'expected_text': "NEXT",
+            'expected_sorted_values': [
+                datetime.date(2001, 1, 1),
+                semver.Version(1, 0, 0),
+                chug.model.next_value,
+            ],
+        }),
+        ('future', {
+            'test_value': chug.model.future_value,
+            'expected_text': "FUTURE",
+            'expected_sorted_values': [
+                datetime.date(2001, 1, 1),
+                semver.Version(1, 0, 0),
+                chug.model.future_value,
+            ],
+        }),
+    ]
+
+    def test_has_expected_text(self):
+        """ Should have the expected text representation. """
+        self.assertEqual(self.expected_text, str(self.test_value))
+
+    def test_equal_only_to_itself(self):
+        """ Should compare equal only to itself. """
+        self.assertEqual(self.test_value, self.test_value)
+        self.assertNotEqual(self.test_value, self.expected_text)
+        self.assertNotEqual(
+            self.test_value, chug.model.SpecialValue(
+                self.expected_text, rank=self.test_value.rank))
+
+    def test_pickles_to_same_value(self):
+        """ Should unpickle to the same value. """
+        result = pickle.loads(pickle.dumps(self.test_value))
+        self.assertIs(self.test_value, result)
+
+    def test_copies_to_same_value(self):
+        """ Should copy, shallow or deep, to the same value. """
+        self.assertIs(self.test_value, copy.copy(self.test_value))
+        self.assertIs(self.test_value, copy.deepcopy(self.test_value))
+
+    def test_entry_copies_have_same_value(self):
+        """ Should be the same value in a copy of an entry that has it. """
+        entry = chug.model.ChangeLogEntry(
+            release_date=(
+                self.expected_text if self.expected_text != "NEXT"
+                else chug.model.ChangeLogEntry.default_release_date),
+            version=(
+                self.expected_text if self.expected_text != "FUTURE"
+                else chug.model.ChangeLogEntry.default_version))
+        for entry_copy in [
+                pickle.loads(pickle.dumps(entry)), copy.deepcopy(entry)]:
+            self.assertIn(
+                self.test_value,
+                [entry_copy.release_date_value, entry_copy.version_info])
+            table = chug.model.ChangeLogEntryTable()
+            table.append(entry_copy)
+            self.assertEqual([entry], [row.to_entry() for row in table])
+
+    def test_sorts_as_expected_with_dates_and_versions(self):
+        """ Should sort in the expected position among values. """
+        (expected_date_values, expected_version_values) = [
+            [
+                value for value in self.expected_sorted_values
+                if not isinstance(value, excluded_type)]
+            for excluded_type in [semver.Version, datetime.date]]
+        for expected_values in [
+                expected_date_values, expected_version_values]:
+            result = sorted(reversed(expected_values))
+            self.assertEqual(expected_values, result)
+
+    def test_sorts_unknown_before_next_and_future(self):
+        """ Should sort unknown value before next and future values. """
+        self.assertLess(chug.model.unknown_value, chug.model.next_value)
+        self.assertLess(chug.model.unknown_value, chug.model.future_value)
+        self.assertGreater(chug.model.future_value, chug.model.unknown_value)
+
+
 class ChangeLogEntry_BaseTestCase(
         testscenarios.WithScenarios, testtools.TestCase):
     """ Base class for ‘ChangeLogEntry’ test case classes. """
@@ -50,6 +149,54 @@ class ChangeLogEntry_TestCase(ChangeLogEntry_BaseTestCase):
         self.assertIsNot(instance, None)
 
 
+class ChangeLogEntry_from_parsed_values_TestCase(testtools.TestCase):
+    """ Test cases for ‘ChangeLogEntry.from_parsed_values’ method. """
+
+    function_to_test = staticmethod(
+        chug.model.ChangeLogEntry.from_parsed_values)
+
+    def setUp(self):
+        """ Set up test fixtures. """
+        super().setUp()
+        self.test_entry = chug.model.ChangeLogEntry(
+            release_date="2009-01-01", version="1.0.0",
+            maintainer="Foo Bar <foo.bar@example.org>",
+            body="Lorem ipsum dolor sit amet.")
+        self.test_kwargs = {
+            'release_date_value': self.test_entry.release_date_value,
+            'version_info': self.test_entry.version_info,
+        }
+
+    def test_returns_equal_entry(self):
+        """ Should return an entry equal to one made from the fields. """
+        result = self.function_to_test(
+            *self.test_entry.field_values(), **self.test_kwargs)
+        self.assertIsInstance(result, chug.model.ChangeLogEntry)
+        self.assertEqual(self.test_entry, result)
+        self.assertIs(
+            self.test_entry.release_date_value, result.release_date_value)
+        self.assertIs(self.test_entry.version_info, result.version_info)
+        self.assertIsNone(result.body_source)
+
+    def test_does_not_parse_values_again(self):
+        """ Should not parse the release date or version text. """
+        with unittest.mock.patch.object(
+                chug.model.ChangeLogEntry, 'parse_release_date',
+                side_effect=AssertionError
+        ), unittest.mock.patch.object(
+                chug.model.ChangeLogEntry, 'parse_version',
+                side_effect=AssertionError):
+            self.function_to_test(
+                *self.test_entry.field_values(), **self.test_kwargs)
+
+    def test_raises_error_for_invalid_maintainer(self):
+        """ Should raise PersonDetailsInvalidError for invalid maintainer. """
+        with testtools.ExpectedException(
+                chug.model.PersonDetailsInvalidError):
+            self.function_to_test(
+                "2009-01-01", "1.0.0", "Foo Bar", **self.test_kwargs)
+
+
 class ChangeLogEntry_release_date_TestCase(ChangeLogEntry_BaseTestCase):
     """ Test cases for ‘ChangeLogEntry.release_date’ attribute. """
 
@@ -85,6 +232,31 @@ class ChangeLogEntry_release_date_TestCase(ChangeLogEntry_BaseTestCase):
             self.assertEqual(self.expected_release_date, instance.release_date)
 
 
+class ChangeLogEntry_release_date_value_TestCase(ChangeLogEntry_BaseTestCase):
+    """ Test cases for ‘ChangeLogEntry.release_date_value’ attribute. """
+
+    scenarios = [
+        ('default', {
+            'test_args': {},
+            'expected_release_date_value': chug.model.unknown_value,
+        }),
+        ('future token', {
+            'test_args': {'release_date': "FUTURE"},
+            'expected_release_date_value': chug.model.future_value,
+        }),
+        ('2001-01-01', {
+            'test_args': {'release_date': "2001-01-01"},
+            'expected_release_date_value': datetime.date(2001, 1, 1),
+        }),
+    ]
+
+    def test_has_expected_release_date_value(self):
+        """ Should have expected `release_date_value` attribute. """
+        instance = chug.model.ChangeLogEntry(**self.test_args)
+        self.assertEqual(
+            self.expected_release_date_value, instance.release_date_value)
+
+
 class ChangeLogEntry_version_TestCase(ChangeLogEntry_BaseTestCase):
     """ Test cases for ‘ChangeLogEntry.version’ attribute. """
 
@@ -148,6 +320,34 @@ class ChangeLogEntry_version_TestCase(ChangeLogEntry_BaseTestCase):
             self.assertEqual(self.expected_version, instance.version)
 
 
+class ChangeLogEntry_version_info_TestCase(ChangeLogEntry_BaseTestCase):
+    """ Test cases for ‘ChangeLogEntry.version_info’ attribute. """
+
+    scenarios = [
+        ('default', {
+            'test_args': {},
+            'expected_version_info': chug.model.unknown_value,
+        }),
+        ('next token', {
+            'test_args': {'version': "NEXT"},
+            'expected_version_info': chug.model.next_value,
+        }),
+        ('1.2', {
+            'test_args': {'version': "1.2"},
+            'expected_version_info': semver.Version(1, 2, 0),
+        }),
+        ('1.23.456-alpha5', {
+            'test_args': {'version': "1.23.456-alpha5"},
+            'expected_version_info': semver.Version(1, 23, 456, "alpha5"),
+        }),
+    ]
+
+    def test_has_expected_version_info(self):
+        """ Should have expected `version_info` attribute. """
+        instance = chug.model.ChangeLogEntry(**self.test_args)
+        self.assertEqual(self.expected_version_info, instance.version_info)
+
+
 class ChangeLogEntry_maintainer_TestCase(ChangeLogEntry_BaseTestCase):
     """ Test cases for ‘ChangeLogEntry.maintainer’ attribute. """
 
@@ -194,6 +394,164 @@ class ChangeLogEntry_body_TestCase(ChangeLogEntry_BaseTestCase):
         self.assertEqual(self.expected_body, instance.body)
 
 
+class ChangeLogEntry_deferred_body_TestCase(ChangeLogEntry_BaseTestCase):
+    """ Test cases for ‘ChangeLogEntry.body’ from a ‘DeferredValue’. """
+
+    scenarios = [
+        ('change log entry', {
+            'entry_class': chug.model.ChangeLogEntry,
+        }),
+        ('compact change log entry', {
+            'entry_class': chug.model.CompactChangeLogEntry,
+        }),
+    ]
+
+    def setUp(self):
+        """ Set up test fixtures. """
+        super().setUp()
+
+        self.test_body_getter_calls = []
+        self.test_body = "Foo bar baz."
+        self.test_instance = self.entry_class(
+            version="1.0",
+            body=chug.model.DeferredValue(self.fake_get_body))
+
+    def fake_get_body(self):
+        """ Fake body getter, recording each call. """
+        self.test_body_getter_calls.append(self.test_body)
+        return self.test_body
+
+    def test_does_not_get_body_on_init(self):
+        """ Should not get the body text when the entry is made. """
+        self.assertEqual([], self.test_body_getter_calls)
+
+    def test_gets_body_once_when_accessed(self):
+        """ Should get the body text only once, when first accessed. """
+        self.assertEqual(self.test_body, self.test_instance.body)
+        self.assertEqual(self.test_body, self.test_instance.body)
+        self.assertEqual([self.test_body], self.test_body_getter_calls)
+
+    def test_equal_to_entry_with_body_text(self):
+        """ Should compare equal to an entry with the body text. """
+        other_instance = self.entry_class(version="1.0", body=self.test_body)
+        self.assertEqual(other_instance, self.test_instance)
+
+
+class DeferredValue_TestCase(testtools.TestCase):
+    """ Test cases for ‘DeferredValue’ class. """
+
+    def setUp(self):
+        """ Set up test fixtures. """
+        super().setUp()
+
+        self.test_values = iter(["Lorem", "ipsum"])
+        self.test_instance = chug.model.DeferredValue(
+            functools.partial(next, self.test_values))
+
+    def test_get_returns_value(self):
+        """ Should return the value from the getter. """
+        self.assertEqual("Lorem", self.test_instance.get())
+
+    def test_get_returns_same_value_each_time(self):
+        """ Should compute the value only once. """
+        __ = self.test_instance.get()
+        self.assertEqual("Lorem", self.test_instance.get())
+        self.assertIsNone(self.test_instance.get_value)
+
+    def test_repr_shows_whether_resolved(self):
+        """ Should show in the representation whether it is resolved. """
+        self.assertIn("unresolved", repr(self.test_instance))
+        __ = self.test_instance.get()
+        self.assertIn("'Lorem'", repr(self.test_instance))
+
+    def test_resolve_returns_value_of_deferred_value(self):
+        """ Should return the value of a `DeferredValue`. """
+        result = chug.model.DeferredValue.resolve(self.test_instance)
+        self.assertEqual("Lorem", result)
+
+    def test_resolve_returns_other_value_unchanged(self):
+        """ Should return any other value unchanged. """
+        test_value = object()
+        result = chug.model.DeferredValue.resolve(test_value)
+        self.assertIs(test_value, result)
+
+
+class TextSpan_TestCase(testtools.TestCase):
+    """ Test cases for ‘TextSpan’ class. """
+
+    test_text = "Lorem ipsum dolor sit amet."
+
+    def setUp(self):
+        """ Set up test fixtures. """
+        super().setUp()
+
+        self.test_instance = chug.model.TextSpan(self.test_text, 6, 11)
+
+    def test_str_returns_text_of_span(self):
+        """ Should return the text of the span. """
+        self.assertEqual("ipsum", str(self.test_instance))
+
+    def test_has_length_of_span(self):
+        """ Should have the length of the span. """
+        self.assertEqual(5, len(self.test_instance))
+
+    def test_refers_to_text(self):
+        """ Should refer to the whole text. """
+        self.assertIs(self.test_text, self.test_instance.text)
+
+    def test_equal_to_span_with_same_text(self):
+        """ Should compare equal to a span of the same text. """
+        other_instance = chug.model.TextSpan("Ipsum ipsum", 6, 11)
+        self.assertEqual(other_instance, self.test_instance)
+        self.assertEqual(hash(other_instance), hash(self.test_instance))
+
+    def test_not_equal_to_span_with_different_text(self):
+        """ Should not compare equal to a span of different text. """
+        other_instance = chug.model.TextSpan(self.test_text, 0, 5)
+        self.assertNotEqual(other_instance, self.test_instance)
+
+    def test_repr_shows_offsets(self):
+        """ Should show the offsets in the representation. """
+        self.assertIn("[6:11]", repr(self.test_instance))
+
+
+class ChangeLogEntry_body_source_TestCase(ChangeLogEntry_BaseTestCase):
+    """ Test cases for ‘ChangeLogEntry.body_source’ attribute. """
+
+    scenarios = [
+        ('change log entry', {
+            'entry_class': chug.model.ChangeLogEntry,
+        }),
+        ('compact change log entry', {
+            'entry_class': chug.model.CompactChangeLogEntry,
+        }),
+    ]
+
+    test_body_source = chug.model.TextSpan("Lorem ipsum.", 0, 5)
+
+    def test_has_default_body_source_none(self):
+        """ Should have default `body_source` of ``None``. """
+        instance = self.entry_class()
+        self.assertIs(None, instance.body_source)
+
+    def test_has_specified_body_source(self):
+        """ Should have the specified `body_source`. """
+        instance = self.entry_class(body_source=self.test_body_source)
+        self.assertIs(self.test_body_source, instance.body_source)
+
+    def test_body_source_not_in_version_info_entry(self):
+        """ Should not include `body_source` in the version info entry. """
+        instance = self.entry_class(body_source=self.test_body_source)
+        self.assertNotIn('body_source', instance.as_version_info_entry())
+
+    def test_table_row_has_body_source(self):
+        """ Should keep `body_source` in a ‘ChangeLogEntryTable’ row. """
+        instance = self.entry_class(body_source=self.test_body_source)
+        table = chug.model.ChangeLogEntryTable.from_entries([instance])
+        self.assertIs(self.test_body_source, table[0].body_source)
+        self.assertIs(self.test_body_source, table[0].to_entry().body_source)
+
+
 class ChangeLogEntry_repr_TestCase(
         ChangeLogEntry_BaseTestCase):
     """ Test cases for ‘ChangeLogEntry.__repr__’ method. """
@@ -331,6 +689,428 @@ class ChangeLogEntry_as_version_info_entry_TestCase(
         result = self.test_instance.as_version_info_entry()
         self.assertEqual(self.expected_result, result)
 
+
+class CompactChangeLogEntry_TestCase(ChangeLogEntry_BaseTestCase):
+    """ Test cases for ‘CompactChangeLogEntry’ class. """
+
+    scenarios = [
+        ('default', {
+            'test_args': {},
+        }),
+        ('all fields', {
+            'test_args': {
+                'release_date': "2004-01-01",
+                'version': "0.8",
+                'maintainer': "Foo Bar <foo.bar@example.org>",
+                'body': "* Donec venenatis nisl aliquam ipsum.\n",
+            },
+        }),
+        ('special values', {
+            'test_args': {
+                'release_date': "FUTURE",
+                'version': "NEXT",
+            },
+        }),
+    ]
+
+    def setUp(self):
+        """ Set up test fixtures. """
+        super().setUp()
+
+        self.test_instance = chug.model.CompactChangeLogEntry(
+            **self.test_args)
+        self.test_entry = chug.model.ChangeLogEntry(**self.test_args)
+
+    def test_has_same_attributes_as_change_log_entry(self):
+        """ Should have the same attribute values as a `ChangeLogEntry`. """
+        for name in [
+                'release_date', 'version', 'maintainer', 'body',
+                'release_date_value', 'version_info']:
+            self.assertEqual(
+                getattr(self.test_entry, name),
+                getattr(self.test_instance, name))
+
+    def test_has_no_instance_dict(self):
+        """ Should not have an instance dict. """
+        self.assertFalse(hasattr(self.test_instance, '__dict__'))
+
+    def test_has_same_public_api_as_change_log_entry(self):
+        """ Should have the public attributes of a `ChangeLogEntry`. """
+        # Making an instance from parsed values is particular to the class
+        # with an instance dict.
+        excluded_names = {'from_parsed_values'}
+        for name in dir(chug.model.ChangeLogEntry):
+            if name.startswith('_') or name in excluded_names:
+                continue
+            self.assertTrue(
+                hasattr(chug.model.CompactChangeLogEntry, name),
+                "no attribute {!r}".format(name))
+
+    def test_parses_fields_same_as_change_log_entry(self):
+        """ Should parse field values the same as a `ChangeLogEntry`. """
+        compact_class = chug.model.CompactChangeLogEntry
+        self.assertEqual(
+            self.test_entry.release_date_value,
+            compact_class.parse_release_date(self.test_entry.release_date))
+        self.assertEqual(
+            self.test_entry.version_info,
+            compact_class.parse_version(self.test_entry.version))
+        self.assertIsNone(
+            compact_class.validate_release_date(self.test_entry.release_date))
+        self.assertIsNone(
+            compact_class.validate_version(self.test_entry.version))
+        self.assertIsNone(
+            compact_class.validate_maintainer(self.test_entry.maintainer))
+
+    def test_as_version_info_entry_same_as_change_log_entry(self):
+        """ Should return the same version info as a `ChangeLogEntry`. """
+        self.assertEqual(
+            self.test_entry.as_version_info_entry(),
+            self.test_instance.as_version_info_entry())
+
+    def test_from_entry_makes_equal_instance(self):
+        """ Should make an equal instance from a `ChangeLogEntry`. """
+        result = chug.model.CompactChangeLogEntry.from_entry(self.test_entry)
+        self.assertEqual(self.test_instance, result)
+
+    def test_equal_instances_have_equal_hash(self):
+        """ Should have equal hash for equal instances. """
+        other_instance = chug.model.CompactChangeLogEntry(**self.test_args)
+        self.assertEqual(self.test_instance, other_instance)
+        self.assertEqual(hash(self.test_instance), hash(other_instance))
+
+    def test_not_equal_to_change_log_entry(self):
+        """ Should not compare equal to a different type of entry. """
+        self.assertNotEqual(self.test_instance, self.test_entry)
+
+    def test_refuses_to_set_attribute(self):
+        """ Should raise AttributeError when setting an attribute. """
+        with testtools.ExpectedException(AttributeError):
+            self.test_instance.version = "1.0"
+        with testtools.ExpectedException(AttributeError):
+            del self.test_instance.body
+
+    def test_pickles_to_equal_instance(self):
+        """ Should unpickle to an equal instance. """
+        result = pickle.loads(pickle.dumps(self.test_instance))
+        self.assertEqual(self.test_instance, result)
+
+    def test_copies_keep_body_source(self):
+        """ Should keep the `body_source` when pickled or copied. """
+        test_text = "Lorem ipsum dolor sit amet."
+        instance = chug.model.CompactChangeLogEntry(
+            **self.test_args,
+            body_source=chug.model.TextSpan(test_text, 6, 11))
+        for result in [
+                pickle.loads(pickle.dumps(instance)),
+                copy.copy(instance),
+                copy.deepcopy(instance)]:
+            self.assertEqual(instance, result)
+            self.assertEqual("ipsum", str(result.body_source))
+            self.assertEqual(
+                (6, 11), (result.body_source.start, result.body_source.end))
+
+
+class CompactChangeLogEntry_ErrorTestCase(ChangeLogEntry_BaseTestCase):
+    """ Error test cases for ‘CompactChangeLogEntry’ class. """
+
+    scenarios = [
+        ('release-date-bogus', {
+            'test_args': {'release_date': "b0gUs"},
+            'expected_error': chug.model.DateInvalidError,
+        }),
+        ('version-bogus', {
+            'test_args': {'version': "b0gUs"},
+            'expected_error': chug.model.VersionInvalidError,
+        }),
+        ('maintainer-bogus', {
+            'test_args': {'maintainer': "b0gUs"},
+            'expected_error': chug.model.PersonDetailsInvalidError,
+        }),
+    ]
+
+    def test_raises_expected_error(self):
+        """ Should raise expected error. """
+        with self.expected_error_context():
+            __ = chug.model.CompactChangeLogEntry(**self.test_args)
+
+
+class ChangeLogEntryTable_BaseTestCase(testtools.TestCase):
+    """ Base for test cases for ‘ChangeLogEntryTable’ class. """
+
+    def setUp(self):
+        """ Set up test fixtures. """
+        super().setUp()
+
+        self.test_entries = [
+            chug.model.ChangeLogEntry(
+                release_date="FUTURE", version="NEXT",
+                maintainer="Foo Bar <foo.bar@example.org>"),
+            chug.model.ChangeLogEntry(
+                release_date="2009-01-03", version="1.0.0-rc.10",
+                maintainer="Foo Bar <foo.bar@example.org>",
+                body="* Donec venenatis nisl aliquam ipsum.\n"),
+            chug.model.ChangeLogEntry(
+                release_date="2009-01-02", version="1.0.0-rc.2",
+                maintainer="Cathy Morris <cathy.morris@example.com>",
+                body="* Donec venenatis nisl aliquam ipsum.\n"),
+            chug.model.ChangeLogEntry(
+                release_date="2009-1-1", version="1.0.0-rc.1",
+                maintainer="Foo Bar <foo.bar@example.org>"),
+            chug.model.ChangeLogEntry(
+                release_date="2009-01-04", version="1.0",
+                maintainer="Cathy Morris <cathy.morris@example.com>"),
+            chug.model.ChangeLogEntry(),
+        ]
+        self.test_instance = chug.model.ChangeLogEntryTable.from_entries(
+            self.test_entries)
+
+
+class ChangeLogEntryTable_TestCase(ChangeLogEntryTable_BaseTestCase):
+    """ Test cases for ‘ChangeLogEntryTable’ class. """
+
+    def test_has_length_of_entries(self):
+        """ Should have length equal to the number of entries. """
+        self.assertEqual(len(self.test_entries), len(self.test_instance))
+
+    def test_rows_have_same_fields_as_entries(self):
+        """ Should have rows with the same fields as the entries. """
+        for (entry, row) in zip(self.test_entries, self.test_instance):
+            self.assertEqual(
+                entry.as_version_info_entry(), row.as_version_info_entry())
+            self.assertEqual(entry, row.to_entry())
+
+    def test_rows_have_same_parsed_values_as_entries(self):
+        """ Should have rows with the same parsed values as the entries. """
+        for (entry, row) in zip(self.test_entries, self.test_instance):
+            self.assertEqual(entry.release_date_value, row.release_date_value)
+            self.assertEqual(entry.version_info, row.version_info)
+
+    def test_append_uses_parsed_values_of_entry(self):
+        """ Should use the parsed values of the entry, not parse again. """
+        table = chug.model.ChangeLogEntryTable()
+        with unittest.mock.patch.object(
+                chug.model.ChangeLogEntry, 'parse_release_date',
+                side_effect=AssertionError
+        ), unittest.mock.patch.object(
+                chug.model.ChangeLogEntry, 'parse_version',
+                side_effect=AssertionError):
+            table.extend(self.test_entries)
+        self.assertEqual(
+            self.test_entries, [row.to_entry() for row in table])
+
+    def test_append_parses_values_for_object_without_them(self):
+        """ Should parse the values of an object that lacks them. """
+        table = chug.model.ChangeLogEntryTable()
+        for entry in self.test_entries:
+            table.append(types.SimpleNamespace(
+                **entry.as_version_info_entry(),
+                body_source=entry.body_source))
+        self.assertEqual(
+            self.test_entries, [row.to_entry() for row in table])
+
+    def test_getitem_accepts_negative_index(self):
+        """ Should get the row at a negative index from the end. """
+        self.assertEqual(
+            self.test_entries[-1], self.test_instance[-1].to_entry())
+
+    def test_getitem_slice_returns_table(self):
+        """ Should return a table of the rows in a slice. """
+        result = self.test_instance[1:3]
+        self.assertIsInstance(result, chug.model.ChangeLogEntryTable)
+        self.assertEqual(
+            self.test_entries[1:3], [row.to_entry() for row in result])
+
+    def test_getitem_raises_index_error_out_of_range(self):
+        """ Should raise IndexError for an index out of range. """
+        with testtools.ExpectedException(IndexError):
+            self.test_instance[len(self.test_entries)]
+
+    def test_interns_text_values(self):
+        """ Should store each distinct text value only once. """
+        maintainers = [
+            row.maintainer for row in self.test_instance
+            if row.maintainer is not None]
+        self.assertEqual(
+            len(set(maintainers)),
+            len(set(self.test_instance.maintainer_indices) - {
+                chug.model.ChangeLogEntryTable.no_string_index}))
+        self.assertIs(
+            self.test_instance[0].maintainer,
+            self.test_instance[1].maintainer)
+
+    def test_rows_compare_equal_with_equal_fields(self):
+        """ Should have rows equal when their fields are equal. """
+        other_instance = chug.model.ChangeLogEntryTable.from_entries(
+            reversed(self.test_entries))
+        self.assertEqual(self.test_instance[0], other_instance[-1])
+        self.assertNotEqual(self.test_instance[0], other_instance[0])
+
+    def test_version_order_matches_version_info(self):
+        """ Should order versions the same as their parsed values. """
+        result = self.test_instance.sort_indices('version')
+        self.assertEqual(
+            sorted(
+                range(len(self.test_entries)),
+                key=(lambda index: (
+                    self.test_entries[index].version_info))),
+            result)
+
+
+class ChangeLogEntryTable_where_TestCase(ChangeLogEntryTable_BaseTestCase):
+    """ Test cases for ‘ChangeLogEntryTable’ filtering methods. """
+
+    def test_release_date_mask_selects_date_range(self):
+        """ Should select the rows with release date in the range. """
+        mask = self.test_instance.release_date_mask(
+            start=datetime.date(2009, 1, 1),
+            end=datetime.date(2009, 1, 3))
+        result = self.test_instance.where(mask)
+        self.assertEqual(
+            self.test_entries[1:4], [row.to_entry() for row in result])
+
+    def test_release_date_mask_selects_special_values(self):
+        """ Should select the rows with special release date values. """
+        mask = self.test_instance.release_date_mask(
+            start=chug.model.future_value)
+        result = self.test_instance.where(mask)
+        self.assertEqual(
+            [self.test_entries[0]], [row.to_entry() for row in result])
+
+    def test_maintainer_mask_selects_maintainer(self):
+        """ Should select the rows with the specified maintainer. """
+        mask = self.test_instance.maintainer_mask(
+            "Cathy Morris <cathy.morris@example.com>")
+        result = self.test_instance.where(mask)
+        self.assertEqual(
+            [self.test_entries[2], self.test_entries[4]],
+            [row.to_entry() for row in result])
+
+    def test_maintainer_mask_selects_none_for_unknown_maintainer(self):
+        """ Should select no rows for a maintainer not in the table. """
+        mask = self.test_instance.maintainer_mask("Nobody <nobody@example>")
+        self.assertEqual(0, len(self.test_instance.where(mask)))
+
+
+class ChangeLogEntryTable_sorted_by_TestCase(
+        testscenarios.WithScenarios, ChangeLogEntryTable_BaseTestCase):
+    """ Test cases for ‘ChangeLogEntryTable.sorted_by’ method. """
+
+    scenarios = [
+        ('release date', {
+            'test_args': ['release_date'],
+            'test_kwargs': {},
+            'expected_order': [5, 3, 2, 1, 4, 0],
+        }),
+        ('version', {
+            'test_args': ['version'],
+            'test_kwargs': {},
+            'expected_order': [5, 3, 2, 1, 4, 0],
+        }),
+        ('version reversed', {
+            'test_args': ['version'],
+            'test_kwargs': {'reverse': True},
+            'expected_order': [0, 4, 1, 2, 3, 5],
+        }),
+        ('maintainer then release date', {
+            'test_args': ['maintainer', 'release_date'],
+            'test_kwargs': {},
+            'expected_order': [5, 2, 4, 3, 1, 0],
+        }),
+    ]
+
+    def test_returns_rows_in_expected_order(self):
+        """ Should return a table with rows in the expected order. """
+        result = self.test_instance.sorted_by(
+            *self.test_args, **self.test_kwargs)
+        expected_entries = [
+            self.test_entries[index] for index in self.expected_order]
+        self.assertEqual(
+            expected_entries, [row.to_entry() for row in result])
+
+
+class ChangeLogEntryTable_sorted_by_ErrorTestCase(
+        ChangeLogEntryTable_BaseTestCase):
+    """ Error test cases for ‘ChangeLogEntryTable.sorted_by’ method. """
+
+    def test_raises_value_error_for_unknown_column(self):
+        """ Should raise ValueError for an unknown column name. """
+        with testtools.ExpectedException(ValueError):
+            self.test_instance.sorted_by('body')
+
+
+class VersionParseCache_TestCase(testtools.TestCase):
+    """ Test cases for ‘VersionParseCache’ class. """
+
+    def setUp(self):
+        """ Set up test fixtures. """
+        super().setUp()
+
+        self.test_instance = chug.model.VersionParseCache(max_size=2)
+
+    def test_parse_returns_expected_version(self):
+        """ Should return the `semver.Version` parsed from the text. """
+        result = self.test_instance.parse("1.5")
+        self.assertEqual(semver.Version(1, 5, 0), result)
+
+    def test_parse_returns_same_instance_for_same_text(self):
+        """ Should return the same instance when parsing the same text. """
+        first_result = self.test_instance.parse("1.5")
+        second_result = self.test_instance.parse("1.5")
+        self.assertIs(first_result, second_result)
+
+    def test_parse_raises_error_for_invalid_text(self):
+        """ Should raise `ValueError` for text that is not a version. """
+        with testtools.ExpectedException(ValueError):
+            __ = self.test_instance.parse("b0gUs")
+
+    def test_cache_info_counts_hits_and_misses(self):
+        """ Should count the cache hits and misses. """
+        for text in ["1.0", "1.5", "1.0", "1.0"]:
+            __ = self.test_instance.parse(text)
+        result = self.test_instance.cache_info()
+        self.assertEqual((2, 2, 2, 2), tuple(result))
+
+    def test_parse_keeps_at_most_max_size_versions(self):
+        """ Should discard least recently used versions beyond `max_size`. """
+        for text in ["1.0", "1.5", "2.0", "1.0"]:
+            __ = self.test_instance.parse(text)
+        result = self.test_instance.cache_info()
+        self.assertEqual((0, 4, 2, 2), tuple(result))
+
+    def test_set_max_size_changes_max_size(self):
+        """ Should change the maximum size and discard the cache. """
+        __ = self.test_instance.parse("1.0")
+        self.test_instance.set_max_size(10)
+        result = self.test_instance.cache_info()
+        self.assertEqual((0, 0, 10, 0), tuple(result))
+
+    def test_clear_discards_versions_and_statistics(self):
+        """ Should discard the parsed versions and statistics. """
+        __ = self.test_instance.parse("1.0")
+        self.test_instance.clear()
+        result = self.test_instance.cache_info()
+        self.assertEqual((0, 0, 2, 0), tuple(result))
+
+
+class version_parse_cache_TestCase(testtools.TestCase):
+    """ Test cases for ‘version_parse_cache’ object. """
+
+    def setUp(self):
+        """ Set up test fixtures. """
+        super().setUp()
+
+        chug.model.version_parse_cache.clear()
+        self.addCleanup(chug.model.version_parse_cache.clear)
+
+    def test_entry_version_info_is_shared_for_same_version(self):
+        """ Should share the parsed version between entries. """
+        entries = [
+            chug.model.ChangeLogEntry(version="1.5") for __ in range(3)]
+        self.assertIs(entries[0].version_info, entries[2].version_info)
+        result = chug.model.version_parse_cache.cache_info()
+        self.assertEqual((2, 1), (result.hits, result.misses))
+
 
 DefaultNoneDict = functools.partial(collections.defaultdict, lambda: None)
 
@@ -369,6 +1149,68 @@ class get_latest_version_TestCase(
             'expected_result': chug.model.ChangeLogEntry.make_ordered_dict(
                 DefaultNoneDict({'release_date': "LATEST"})),
         }),
+        ('same release date', {
+            'test_versions': [
+                DefaultNoneDict(
+                    {'release_date': "2020-01-10", 'version': "1.0"}),
+                DefaultNoneDict(
+                    {'release_date': "2020-01-10", 'version': "1.0.1"}),
+                DefaultNoneDict(
+                    {'release_date': "2019-07-04", 'version': "0.2"}),
+            ],
+            'expected_result': chug.model.ChangeLogEntry.make_ordered_dict(
+                DefaultNoneDict(
+                    {'release_date': "2020-01-10", 'version': "1.0.1"})),
+        }),
+        ('same release date, pre-release versions', {
+            'test_versions': [
+                DefaultNoneDict(
+                    {'release_date': "2020-01-10", 'version': "1.0.0-rc.2"}),
+                DefaultNoneDict(
+                    {'release_date': "2020-01-10", 'version': "1.0.0-rc.10"}),
+            ],
+            'expected_result': chug.model.ChangeLogEntry.make_ordered_dict(
+                DefaultNoneDict(
+                    {'release_date': "2020-01-10", 'version': "1.0.0-rc.10"})),
+        }),
+        ('dates not in text order', {
+            'test_versions': [
+                DefaultNoneDict({'release_date': "2009-9-1"}),
+                DefaultNoneDict({'release_date': "2009-10-01"}),
+            ],
+            'expected_result': chug.model.ChangeLogEntry.make_ordered_dict(
+                DefaultNoneDict({'release_date': "2009-10-01"})),
+        }),
+        ('special release dates', {
+            'test_versions': [
+                DefaultNoneDict({'release_date': "UNKNOWN"}),
+                DefaultNoneDict(
+                    {'release_date': "FUTURE", 'version': "NEXT"}),
+                DefaultNoneDict({'release_date': "2009-01-01"}),
+            ],
+            'expected_result': chug.model.ChangeLogEntry.make_ordered_dict(
+                DefaultNoneDict(
+                    {'release_date': "FUTURE", 'version': "NEXT"})),
+        }),
+        ('only unknown release dates', {
+            'test_versions': [
+                DefaultNoneDict(
+                    {'release_date': "UNKNOWN", 'version': "0.1"}),
+                DefaultNoneDict(
+                    {'release_date': "UNKNOWN", 'version': "UNKNOWN"}),
+            ],
+            'expected_result': chug.model.ChangeLogEntry.make_ordered_dict(
+                DefaultNoneDict(
+                    {'release_date': "UNKNOWN", 'version': "0.1"})),
+        }),
+        ('generator', {
+            'test_versions': (
+                DefaultNoneDict({'release_date': release_date})
+                for release_date in ["2009-01-02", "2009-01-03", "2009-01-01"]
+            ),
+            'expected_result': chug.model.ChangeLogEntry.make_ordered_dict(
+                DefaultNoneDict({'release_date': "2009-01-03"})),
+        }),
     ]
 
     def test_returns_expected_result(self):
@@ -376,6 +1218,194 @@ class get_latest_version_TestCase(
         result = chug.model.get_latest_version(self.test_versions)
         self.assertDictEqual(self.expected_result, result)
 
+
+class get_latest_versions_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘get_latest_versions’ function. """
+
+    test_versions = [
+        DefaultNoneDict({'release_date': "2009-01-02", 'version': "0.2"}),
+        DefaultNoneDict({'release_date': "FUTURE", 'version': "NEXT"}),
+        DefaultNoneDict({'release_date': "2009-01-03", 'version': "1.0"}),
+        DefaultNoneDict({'release_date': "2009-01-03", 'version': "0.3"}),
+        DefaultNoneDict({'release_date': "2009-01-01", 'version': "0.1"}),
+    ]
+
+    scenarios = [
+        ('none', {
+            'test_count': 0,
+            'expected_versions': [],
+        }),
+        ('one', {
+            'test_count': 1,
+            'expected_versions': ["NEXT"],
+        }),
+        ('some', {
+            'test_count': 3,
+            'expected_versions': ["NEXT", "1.0", "0.3"],
+        }),
+        ('more than all', {
+            'test_count': 10,
+            'expected_versions': ["NEXT", "1.0", "0.3", "0.2", "0.1"],
+        }),
+    ]
+
+    def test_returns_expected_versions(self):
+        """ Should return the expected versions, latest first. """
+        result = chug.model.get_latest_versions(
+            iter(self.test_versions), self.test_count)
+        self.assertEqual(
+            self.expected_versions, [item['version'] for item in result])
+
+    def test_first_is_same_as_get_latest_version(self):
+        """ Should return first the same version as `get_latest_version`. """
+        result = chug.model.get_latest_versions(
+            self.test_versions, self.test_count)
+        if result:
+            self.assertEqual(
+                chug.model.get_latest_version(self.test_versions), result[0])
+
+
+class get_field_problem_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for the functions that get a field value's problem. """
+
+    scenarios = [
+        ('release-date canonical', {
+            'test_field_name': 'release_date',
+            'test_value': "2009-01-01",
+            'expected_valid': True,
+        }),
+        ('release-date leap-day', {
+            'test_field_name': 'release_date',
+            'test_value': "2008-02-29",
+            'expected_valid': True,
+        }),
+        ('release-date not-leap-day', {
+            'test_field_name': 'release_date',
+            'test_value': "2009-02-29",
+            'expected_valid': False,
+        }),
+        ('release-date month-thirteen', {
+            'test_field_name': 'release_date',
+            'test_value': "2009-13-01",
+            'expected_valid': False,
+        }),
+        ('release-date year-zero', {
+            'test_field_name': 'release_date',
+            'test_value': "0000-01-01",
+            'expected_valid': False,
+        }),
+        ('release-date not-zero-padded', {
+            'test_field_name': 'release_date',
+            'test_value': "2009-1-1",
+            'expected_valid': True,
+        }),
+        ('release-date special', {
+            'test_field_name': 'release_date',
+            'test_value': "FUTURE",
+            'expected_valid': True,
+        }),
+        ('release-date bogus', {
+            'test_field_name': 'release_date',
+            'test_value': "b0gUs",
+            'expected_valid': False,
+        }),
+        ('version semver', {
+            'test_field_name': 'version',
+            'test_value': "1.5.3-beta2",
+            'expected_valid': True,
+        }),
+        ('version special', {
+            'test_field_name': 'version',
+            'test_value': "NEXT",
+            'expected_valid': True,
+        }),
+        ('version bogus', {
+            'test_field_name': 'version',
+            'test_value': "b0gUs",
+            'expected_valid': False,
+        }),
+        ('maintainer person', {
+            'test_field_name': 'maintainer',
+            'test_value': "Foo Bar <foo.bar@example.org>",
+            'expected_valid': True,
+        }),
+        ('maintainer none', {
+            'test_field_name': 'maintainer',
+            'test_value': None,
+            'expected_valid': True,
+        }),
+        ('maintainer bogus', {
+            'test_field_name': 'maintainer',
+            'test_value': "b0gUs",
+            'expected_valid': False,
+        }),
+    ]
+
+    def test_returns_problem_only_for_invalid_value(self):
+        """ Should return problem text only if the value is invalid. """
+        get_problem = chug.model.field_problem_getters[self.test_field_name]
+        result = get_problem(self.test_value)
+        if self.expected_valid:
+            self.assertIs(None, result)
+        else:
+            self.assertIsInstance(result, str)
+
+    def test_agrees_with_making_entry(self):
+        """ Should find a problem iff making an entry raises ValueError. """
+        get_problem = chug.model.field_problem_getters[self.test_field_name]
+        try:
+            __ = chug.model.ChangeLogEntry(
+                **{self.test_field_name: self.test_value})
+        except ValueError:
+            entry_raises_error = True
+        else:
+            entry_raises_error = False
+        self.assertEqual(
+            entry_raises_error, (get_problem(self.test_value) is not None))
+
+
+class validate_entries_TestCase(testtools.TestCase):
+    """ Test cases for ‘validate_entries’ function. """
+
+    function_to_test = staticmethod(chug.model.validate_entries)
+
+    test_entries = [
+        {'release_date': "2009-01-01", 'version': "1.0"},
+        {
+            'release_date': "b0gUs", 'version': "1.1",
+            'maintainer': "Foo Bar"},
+        {'version': "b0gUs"},
+    ]
+
+    def test_returns_diagnostic_for_each_invalid_value(self):
+        """ Should return a diagnostic for each invalid value, in order. """
+        result = self.function_to_test(iter(self.test_entries))
+        self.assertEqual(
+            [(1, 'release_date'), (1, 'maintainer'), (2, 'version')],
+            [
+                (diagnostic.entry_index, diagnostic.field_name)
+                for diagnostic in result])
+
+    def test_returns_diagnostics_without_line(self):
+        """ Should return diagnostics with unknown line number. """
+        result = self.function_to_test(self.test_entries)
+        self.assertEqual(
+            [None] * len(result), [diagnostic.line for diagnostic in result])
+
+    def test_returns_empty_for_valid_entries(self):
+        """ Should return no diagnostics for valid entries. """
+        result = self.function_to_test([
+            entry.as_version_info_entry() for entry in [
+                chug.model.ChangeLogEntry(
+                    release_date="2009-01-01", version="1.0",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body="Lorem ipsum dolor sit amet."),
+                chug.model.ChangeLogEntry(),
+            ]])
+        self.assertEqual([], result)
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
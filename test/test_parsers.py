@@ -8,6 +8,7 @@
 """ Test cases for ‘chug.parsers’ package. """
 
 import builtins
+import mmap
 import re
 import textwrap
 import unittest.mock
@@ -16,6 +17,7 @@ import semver
 import testscenarios
 import testtools
 
+import chug.model
 import chug.parsers
 from chug.parsers.core import (
     ChangeLogEntryTitleFormatInvalidError,
@@ -23,7 +25,10 @@ from chug.parsers.core import (
 )
 import chug.parsers.core
 
-from . import make_expected_error_context
+from . import (
+    make_expected_error_context,
+    make_temporary_file_path,
+)
 
 
 class FakeNode:
@@ -404,6 +409,166 @@ class get_version_from_version_text_ErrorTestCase(
         with testtools.ExpectedException(self.expected_error):
             __ = self.function_to_test(*self.test_args, **self.test_kwargs)
 
+
+class get_version_from_version_text_CacheTestCase(testtools.TestCase):
+    """ Test cases for ‘get_version_from_version_text’ use of the cache. """
+
+    function_to_test = staticmethod(
+        chug.parsers.core.get_version_from_version_text)
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        chug.model.version_parse_cache.clear()
+        self.addCleanup(chug.model.version_parse_cache.clear)
+
+    def test_shares_parsed_version_with_change_log_entry(self):
+        """ Should share the version parsed for a `ChangeLogEntry`. """
+        entry = chug.model.ChangeLogEntry(version="1.5.3")
+        result = self.function_to_test("1.5.3")
+        self.assertIs(entry.version_info, result)
+        cache_info = chug.model.version_parse_cache.cache_info()
+        self.assertEqual((1, 1), (cache_info.hits, cache_info.misses))
+
+
+class DocumentSource_TestCase(testtools.TestCase):
+    """ Test cases for ‘DocumentSource’ class. """
+
+    test_text = (
+        "Lorem ipsum\r\n"
+        "dolor\fsit amet\n"
+        "\n"
+        ":Foo: bar\n"
+        "  baz\n"
+        "\n"
+        ":Wibble: wobble\n"
+        "Donec venenatis\n"
+        "\n"
+        "\n")
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_instance = chug.parsers.core.DocumentSource(self.test_text)
+
+    def test_has_length_of_line_count(self):
+        """ Should have length equal to the number of lines. """
+        self.assertEqual(10, len(self.test_instance))
+
+    def test_get_line_returns_line_without_line_ending(self):
+        """ Should return the text of the line, without its line ending. """
+        self.assertEqual(
+            ["Lorem ipsum", "dolor\fsit amet", ""],
+            [self.test_instance.get_line(index) for index in range(3)])
+
+    def test_get_field_list_end_skips_fields_and_continuations(self):
+        """ Should return the index of the line following the field list. """
+        result = self.test_instance.get_field_list_end(3)
+        self.assertEqual(7, result)
+
+    def test_get_field_list_end_returns_line_count_at_end(self):
+        """ Should return the number of lines if the document ends. """
+        result = self.test_instance.get_field_list_end(8)
+        self.assertEqual(10, result)
+
+    def test_get_lines_span_omits_trailing_blank_lines(self):
+        """ Should return the span of the lines, without blank lines. """
+        result = self.test_instance.get_lines_span(7, 10)
+        self.assertIsInstance(result, chug.model.TextSpan)
+        self.assertEqual("Donec venenatis\n", str(result))
+
+    def test_get_lines_span_includes_line_endings(self):
+        """ Should include the line endings of the lines. """
+        result = self.test_instance.get_lines_span(0, 2)
+        self.assertEqual("Lorem ipsum\r\ndolor\fsit amet\n", str(result))
+
+    def test_get_lines_span_empty_for_blank_lines(self):
+        """ Should return an empty span if the lines are all blank. """
+        result = self.test_instance.get_lines_span(8, 20)
+        self.assertEqual("", str(result))
+
+
+class ChangeLogDocumentFile_TestCase(testtools.TestCase):
+    """ Test cases for ‘ChangeLogDocumentFile’ class. """
+
+    test_content = "Lorem ipsum\ndolor sit amet\n€uro\n".encode('utf-8')
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_infile_path = make_temporary_file_path(
+            self, self.test_content)
+
+    def make_test_instance(self):
+        """ Make a test instance, closed at the end of the test. """
+        instance = chug.parsers.core.ChangeLogDocumentFile(
+            self.test_infile_path)
+        self.addCleanup(instance.close)
+        return instance
+
+    def test_maps_regular_file(self):
+        """ Should map the content of a regular file into memory. """
+        instance = self.make_test_instance()
+        self.assertTrue(instance.is_mapped)
+
+    def test_has_length_of_file_size(self):
+        """ Should have length equal to the size of the file in bytes. """
+        instance = self.make_test_instance()
+        self.assertEqual(len(self.test_content), len(instance))
+
+    def test_reads_empty_file(self):
+        """ Should read an empty file, without mapping it. """
+        self.test_infile_path = make_temporary_file_path(self, b"")
+        instance = self.make_test_instance()
+        self.assertFalse(instance.is_mapped)
+        self.assertEqual("", instance.decode())
+
+    def test_reads_file_that_cannot_be_mapped(self):
+        """ Should read the file content if it cannot be mapped. """
+        with unittest.mock.patch.object(
+                mmap, "mmap", side_effect=OSError("Not mappable")):
+            instance = self.make_test_instance()
+        self.assertFalse(instance.is_mapped)
+        self.assertEqual(self.test_content.decode('utf-8'), instance.decode())
+
+    def test_decode_returns_text_of_byte_range(self):
+        """ Should return the text decoded from the byte range. """
+        instance = self.make_test_instance()
+        self.assertEqual("dolor sit amet\n", instance.decode(12, 27))
+
+    def test_decode_defaults_to_whole_file(self):
+        """ Should return the text of the whole file by default. """
+        instance = self.make_test_instance()
+        self.assertEqual(self.test_content.decode('utf-8'), instance.decode())
+
+    def test_decode_raises_error_for_invalid_text(self):
+        """ Should raise UnicodeDecodeError for a partial character. """
+        instance = self.make_test_instance()
+        with testtools.ExpectedException(UnicodeDecodeError):
+            __ = instance.decode(27, 29)
+
+    def test_get_line_end_returns_offset_following_line_feed(self):
+        """ Should return the offset following the end of the line. """
+        instance = self.make_test_instance()
+        self.assertEqual(
+            [12, 12, 27],
+            [instance.get_line_end(offset) for offset in [0, 11, 12]])
+
+    def test_get_line_end_returns_file_size_at_end(self):
+        """ Should return the size of the file at its end. """
+        instance = self.make_test_instance()
+        self.assertEqual(
+            len(self.test_content), instance.get_line_end(len(instance)))
+
+    def test_context_manager_closes_map(self):
+        """ Should close the memory map on exiting the context. """
+        with self.make_test_instance() as instance:
+            content = instance.content
+        self.assertTrue(content.closed)
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
@@ -0,0 +1,281 @@
+# test/test_parsers_batch.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Test cases for ‘chug.parsers.batch’ module. """
+
+import os
+import pickle
+import textwrap
+
+import testscenarios
+import testtools
+
+import chug.model
+import chug.parsers
+import chug.parsers.batch
+
+from . import (
+    make_expected_error_context,
+    make_temporary_file_path,
+)
+
+
+def make_test_document_text(version):
+    """ Make the text of a Change Log document with one entry.
+
+        :param version: The version text for the entry.
+        :return: The document text.
+        """
+    text = textwrap.dedent("""\
+        Version {version}
+        ========={underline}
+
+        :Released: 2009-01-01
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+        * Lorem ipsum dolor sit amet.
+        """).format(version=version, underline=("=" * len(version)))
+    return text
+
+
+def make_test_infile_paths(testcase, versions):
+    """ Make a document file for each of `versions`.
+
+        :param testcase: The `TestCase` instance for binding to the cleanup.
+        :param versions: Sequence of version texts. A version of ``None``
+            gets a document that is not a valid Change Log.
+        :return: A sequence of the filesystem paths of the documents.
+        """
+    paths = [
+        make_temporary_file_path(
+            testcase, (
+                "Lorem ipsum.\n" if version is None
+                else make_test_document_text(version)).encode('utf-8'))
+        for version in versions]
+    return paths
+
+
+class DocumentParseError_TestCase(testtools.TestCase):
+    """ Test cases for ‘DocumentParseError’ class. """
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_instance = chug.parsers.batch.DocumentParseError(
+            "/lorem/ipsum", "ValueError", "Dolor sit amet")
+
+    def test_has_text_of_path_type_and_message(self):
+        """ Should have text of the path, error type, and message. """
+        self.assertEqual(
+            "/lorem/ipsum: ValueError: Dolor sit amet",
+            str(self.test_instance))
+
+    def test_can_be_pickled(self):
+        """ Should be restored equivalent from pickle. """
+        result = pickle.loads(pickle.dumps(self.test_instance))
+        self.assertEqual(
+            (
+                self.test_instance.infile_path,
+                self.test_instance.error_type_name,
+                self.test_instance.message),
+            (result.infile_path, result.error_type_name, result.message))
+
+
+class parse_document_TestCase(testtools.TestCase):
+    """ Test cases for ‘parse_document’ function. """
+
+    function_to_test = staticmethod(chug.parsers.batch.parse_document)
+
+    def test_returns_compact_entries_for_document(self):
+        """ Should return result with the entries as compact entries. """
+        (infile_path,) = make_test_infile_paths(self, ["1.0"])
+        result = self.function_to_test(infile_path)
+        self.assertEqual(infile_path, result.infile_path)
+        self.assertIs(None, result.error)
+        self.assertEqual(
+            [chug.model.CompactChangeLogEntry(
+                release_date="2009-01-01",
+                version="1.0",
+                maintainer="Foo Bar <foo.bar@example.org>",
+                body="Lorem ipsum dolor sit amet.",
+            )],
+            result.entries)
+
+    def test_result_can_be_pickled(self):
+        """ Should return a result that is restored equal from pickle. """
+        (infile_path,) = make_test_infile_paths(self, ["1.0"])
+        result = self.function_to_test(infile_path)
+        self.assertEqual(result, pickle.loads(pickle.dumps(result)))
+
+    def test_returns_error_for_invalid_document(self):
+        """ Should return result with the error for an invalid document. """
+        (infile_path,) = make_test_infile_paths(self, [None])
+        result = self.function_to_test(infile_path)
+        self.assertIs(None, result.entries)
+        self.assertIsInstance(
+            result.error, chug.parsers.batch.DocumentParseError)
+        self.assertEqual(infile_path, result.error.infile_path)
+
+    def test_returns_error_for_nonexistent_file(self):
+        """ Should return result with the error for a nonexistent file. """
+        infile_path = os.path.join(
+            os.path.dirname(make_temporary_file_path(self, b"")), "b0gUs")
+        result = self.function_to_test(infile_path)
+        self.assertIs(None, result.entries)
+        self.assertEqual(
+            "FileNotFoundError", result.error.error_type_name)
+
+
+class get_path_chunks_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘get_path_chunks’ function. """
+
+    function_to_test = staticmethod(chug.parsers.batch.get_path_chunks)
+
+    scenarios = [
+        ('chunk-size-default', {
+            'test_infile_paths': list("abcdefghij"),
+            'test_kwargs': {'workers': 2},
+            'expected_result': [
+                list("ab"), list("cd"), list("ef"), list("gh"), list("ij")],
+        }),
+        ('chunk-size-default few-paths', {
+            'test_infile_paths': list("abc"),
+            'test_kwargs': {'workers': 4},
+            'expected_result': [list("a"), list("b"), list("c")],
+        }),
+        ('chunk-size-specified', {
+            'test_infile_paths': list("abcdefg"),
+            'test_kwargs': {'workers': 2, 'chunk_size': 3},
+            'expected_result': [list("abc"), list("def"), list("g")],
+        }),
+        ('paths-empty', {
+            'test_infile_paths': [],
+            'test_kwargs': {'workers': 2},
+            'expected_result': [],
+        }),
+        ('chunk-size-zero', {
+            'test_infile_paths': list("abc"),
+            'test_kwargs': {'workers': 2, 'chunk_size': 0},
+            'expected_error': ValueError,
+        }),
+    ]
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(
+                self.test_infile_paths, **self.test_kwargs)
+        if hasattr(self, 'expected_result'):
+            self.assertEqual(self.expected_result, result)
+
+
+class parse_many_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘parse_many’ function. """
+
+    function_to_test = staticmethod(chug.parsers.parse_many)
+
+    scenarios = [
+        ('workers-one', {
+            'test_kwargs': {'workers': 1},
+        }),
+        ('workers-two', {
+            'test_kwargs': {'workers': 2},
+        }),
+        ('workers-two chunk-size-one', {
+            'test_kwargs': {'workers': 2, 'chunk_size': 1},
+        }),
+    ]
+
+    test_versions = ["1.0", None, "1.2", "1.3", None, "1.5"]
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_infile_paths = make_test_infile_paths(
+            self, self.test_versions)
+
+    def test_returns_results_in_input_order(self):
+        """ Should return a result for each path, in the same order. """
+        result = self.function_to_test(
+            self.test_infile_paths, **self.test_kwargs)
+        self.assertEqual(
+            self.test_infile_paths,
+            [item.infile_path for item in result])
+
+    def test_returns_entries_or_error_for_each_document(self):
+        """ Should return the entries, or the error, for each document. """
+        result = self.function_to_test(
+            self.test_infile_paths, **self.test_kwargs)
+        self.assertEqual(
+            [
+                (None if version is None else [version])
+                for version in self.test_versions],
+            [
+                (None if item.entries is None else [
+                    entry.version for entry in item.entries])
+                for item in result])
+        self.assertEqual(
+            [version is None for version in self.test_versions],
+            [item.error is not None for item in result])
+
+    def test_raises_error_for_workers_zero(self):
+        """ Should raise ValueError if `workers` is zero. """
+        with testtools.ExpectedException(ValueError):
+            __ = self.function_to_test(self.test_infile_paths, workers=0)
+
+
+class iter_parse_many_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘iter_parse_many’ function. """
+
+    function_to_test = staticmethod(chug.parsers.iter_parse_many)
+
+    scenarios = parse_many_TestCase.scenarios
+
+    test_versions = parse_many_TestCase.test_versions
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_infile_paths = make_test_infile_paths(
+            self, self.test_versions)
+
+    def test_generates_same_results_as_parse_many(self):
+        """ Should generate the same results as ‘parse_many’, any order. """
+        expected_result = chug.parsers.parse_many(
+            self.test_infile_paths, workers=1)
+        result = list(self.function_to_test(
+            self.test_infile_paths, **self.test_kwargs))
+        self.assertEqual(
+            [
+                (item.infile_path, item.entries, str(item.error))
+                for item in expected_result],
+            [
+                (item.infile_path, item.entries, str(item.error))
+                for item in sorted(result, key=(
+                    lambda item: self.test_infile_paths.index(
+                        item.infile_path)))])
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
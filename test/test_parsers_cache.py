@@ -0,0 +1,289 @@
+# test/test_parsers_cache.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Test cases for ‘chug.parsers.cache’ module. """
+
+import importlib.metadata
+import os
+import pathlib
+import tempfile
+import textwrap
+import unittest.mock
+
+import testscenarios
+import testtools
+
+import chug.model
+import chug.parsers.cache
+import chug.parsers.rest
+
+from . import make_expected_error_context
+
+
+test_document_text = textwrap.dedent("""\
+    Version 1.0
+    ===========
+
+    :Released: 2009-01-01
+    :Maintainer: Foo Bar <foo.bar@example.org>
+
+    * Lorem ipsum dolor sit amet.
+    """)
+
+test_entries = [
+    chug.model.ChangeLogEntry(
+        release_date="2009-01-01",
+        version="1.0",
+        maintainer="Foo Bar <foo.bar@example.org>",
+        body="Lorem ipsum dolor sit amet.",
+    ),
+]
+
+
+def make_temporary_directory(testcase):
+    """ Make a temporary directory for the duration of `testcase`.
+
+        :param testcase: The `TestCase` instance for binding to the cleanup.
+        :return: The `pathlib.Path` of the new directory.
+        """
+    temporary_directory = tempfile.TemporaryDirectory()
+    testcase.addCleanup(temporary_directory.cleanup)
+    path = pathlib.Path(temporary_directory.name)
+    return path
+
+
+class get_library_version_TestCase(testtools.TestCase):
+    """ Test cases for ‘get_library_version’ function. """
+
+    function_to_test = staticmethod(chug.parsers.cache.get_library_version)
+
+    def test_returns_installed_version(self):
+        """ Should return the installed distribution version. """
+        with unittest.mock.patch.object(
+                importlib.metadata, "version", return_value="1.2.3"):
+            result = self.function_to_test()
+        self.assertEqual("1.2.3", result)
+
+    def test_returns_unknown_when_not_installed(self):
+        """ Should return “UNKNOWN” when the distribution is not installed. """
+        with unittest.mock.patch.object(
+                importlib.metadata, "version",
+                side_effect=importlib.metadata.PackageNotFoundError):
+            result = self.function_to_test()
+        self.assertEqual("UNKNOWN", result)
+
+
+class get_default_cache_directory_path_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘get_default_cache_directory_path’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.cache.get_default_cache_directory_path)
+
+    scenarios = [
+        ('xdg-cache-home', {
+            'test_environ': {
+                'XDG_CACHE_HOME': "/example/cache",
+                'HOME': "/example/home",
+            },
+            'expected_result': pathlib.Path("/example/cache/changelog-chug"),
+        }),
+        ('xdg-cache-home-empty', {
+            'test_environ': {
+                'XDG_CACHE_HOME': "",
+                'HOME': "/example/home",
+            },
+            'expected_result': pathlib.Path(
+                "/example/home/.cache/changelog-chug"),
+        }),
+        ('no-xdg-cache-home', {
+            'test_environ': {
+                'HOME': "/example/home",
+            },
+            'expected_result': pathlib.Path(
+                "/example/home/.cache/changelog-chug"),
+        }),
+    ]
+
+    def test_returns_expected_result(self):
+        """ Should return expected result. """
+        with unittest.mock.patch.dict(
+                os.environ, self.test_environ, clear=True):
+            result = self.function_to_test()
+        self.assertEqual(self.expected_result, result)
+
+
+class ChangeLogEntryCache_TestCase(testtools.TestCase):
+    """ Test cases for ‘ChangeLogEntryCache’ class. """
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_directory_path = make_temporary_directory(self)
+        self.test_instance = chug.parsers.cache.ChangeLogEntryCache(
+            self.test_directory_path)
+
+    def test_get_key_differs_for_document_text(self):
+        """ Should get a different key for different document text. """
+        self.assertNotEqual(
+            self.test_instance.get_key(test_document_text),
+            self.test_instance.get_key(test_document_text + "\n"))
+
+    def test_get_key_differs_for_library_version(self):
+        """ Should get a different key for a different library version. """
+        other_instance = chug.parsers.cache.ChangeLogEntryCache(
+            self.test_directory_path)
+        other_instance.library_version = "b0gUs"
+        self.assertNotEqual(
+            self.test_instance.get_key(test_document_text),
+            other_instance.get_key(test_document_text))
+
+    def test_get_returns_none_when_not_cached(self):
+        """ Should return ``None`` when no item is cached. """
+        result = self.test_instance.get(test_document_text)
+        self.assertIs(None, result)
+
+    def test_get_returns_entries_that_were_put(self):
+        """ Should return the same entries as were stored. """
+        self.test_instance.put(test_document_text, test_entries)
+        result = self.test_instance.get(test_document_text)
+        self.assertEqual(test_entries, result)
+
+    def test_get_returns_entries_with_body_source(self):
+        """ Should return entries with the body source in the document. """
+        entries = chug.parsers.rest.make_change_log_entries_from_text(
+            test_document_text)
+        self.test_instance.put(test_document_text, entries)
+        result = self.test_instance.get(test_document_text)
+        self.assertEqual(
+            [str(entry.body_source) for entry in entries],
+            [str(entry.body_source) for entry in result])
+        for entry in result:
+            self.assertIs(test_document_text, entry.body_source.text)
+
+    def test_put_leaves_no_temporary_file(self):
+        """ Should leave only the item file in the cache directory. """
+        self.test_instance.put(test_document_text, test_entries)
+        expected_paths = [self.test_instance.get_item_path(
+            self.test_instance.get_key(test_document_text))]
+        self.assertEqual(
+            expected_paths, list(self.test_directory_path.iterdir()))
+
+    def test_put_creates_cache_directory(self):
+        """ Should create the cache directory if it does not exist. """
+        directory_path = self.test_directory_path.joinpath("lorem", "ipsum")
+        instance = chug.parsers.cache.ChangeLogEntryCache(directory_path)
+        instance.put(test_document_text, test_entries)
+        self.assertEqual(test_entries, instance.get(test_document_text))
+
+    def test_put_ignores_error_writing_cache(self):
+        """ Should not raise an error if the cache is not writable. """
+        file_path = self.test_directory_path.joinpath("lorem")
+        file_path.write_text("")
+        instance = chug.parsers.cache.ChangeLogEntryCache(file_path)
+        instance.put(test_document_text, test_entries)
+        self.assertIs(None, instance.get(test_document_text))
+
+    def test_get_returns_none_when_item_corrupt(self):
+        """ Should return ``None`` when the cached item is not valid. """
+        item_path = self.test_instance.get_item_path(
+            self.test_instance.get_key(test_document_text))
+        item_path.write_text("b0gUs")
+        result = self.test_instance.get(test_document_text)
+        self.assertIs(None, result)
+
+    def test_put_evicts_least_recently_used_items(self):
+        """ Should remove least recently used items beyond `max_size`. """
+        document_texts = [
+            test_document_text + "\n" * count for count in range(3)]
+        for (count, document_text) in enumerate(document_texts):
+            self.test_instance.put(document_text, test_entries)
+            item_path = self.test_instance.get_item_path(
+                self.test_instance.get_key(document_text))
+            os.utime(item_path, (count, count))
+        self.test_instance.max_size = item_path.stat().st_size * 2
+        self.test_instance.evict()
+        result = [
+            self.test_instance.get(document_text)
+            for document_text in document_texts]
+        self.assertEqual([None, test_entries, test_entries], result)
+
+
+class ChangeLogEntryCache_make_change_log_entries_from_text_TestCase(
+        testtools.TestCase):
+    """ Test cases for ‘make_change_log_entries_from_text’ method. """
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_instance = chug.parsers.cache.ChangeLogEntryCache(
+            make_temporary_directory(self))
+
+        func_patcher = unittest.mock.patch.object(
+            chug.parsers.rest, "make_change_log_entries_from_text",
+            wraps=chug.parsers.rest.make_change_log_entries_from_text)
+        self.mock_make_entries = func_patcher.start()
+        self.addCleanup(func_patcher.stop)
+
+    def test_returns_expected_result(self):
+        """ Should return the entries from the document. """
+        result = self.test_instance.make_change_log_entries_from_text(
+            test_document_text)
+        self.assertEqual(test_entries, result)
+
+    def test_parses_document_only_once(self):
+        """ Should parse the document only when it is not cached. """
+        for __ in range(3):
+            result = self.test_instance.make_change_log_entries_from_text(
+                test_document_text)
+        self.assertEqual(test_entries, result)
+        self.mock_make_entries.assert_called_once_with(test_document_text)
+
+
+class ChangeLogEntryCache_make_change_log_entries_from_text_ErrorTestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Error test cases for ‘make_change_log_entries_from_text’ method. """
+
+    scenarios = [
+        ('type-none', {
+            'test_document_text': None,
+            'expected_error': TypeError,
+        }),
+        ('type-bytes', {
+            'test_document_text': b"b0gUs",
+            'expected_error': TypeError,
+        }),
+        ('not-a-change-log', {
+            'test_document_text': "Lorem ipsum dolor sit amet.\n",
+            'expected_error': ValueError,
+        }),
+    ]
+
+    def test_raises_expected_error(self):
+        """ Should raise expected error. """
+        instance = chug.parsers.cache.ChangeLogEntryCache(
+            make_temporary_directory(self))
+        with make_expected_error_context(self):
+            __ = instance.make_change_log_entries_from_text(
+                self.test_document_text)
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -0,0 +1,451 @@
+# test/test_parsers_incremental.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Test cases for ‘chug.parsers.incremental’ module. """
+
+import textwrap
+import unittest.mock
+
+import testscenarios
+import testtools
+
+import chug.model
+import chug.parsers
+import chug.parsers.incremental
+import chug.parsers.instrumentation
+import chug.parsers.rest
+import chug.parsers.scanner
+
+from . import make_expected_error_context
+
+
+test_preamble = textwrap.dedent("""\
+    Change Log
+    ##########
+
+    Lorem ipsum dolor sit amet.
+
+
+    """)
+
+test_section_texts = [
+    textwrap.dedent("""\
+        Version 1.0
+        ===========
+
+        :Released: FUTURE
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+        * Donec venenatis nisl aliquam ipsum.
+
+
+        """),
+    textwrap.dedent("""\
+        Version 0.9
+        ===========
+
+        :Released: 2009-01-01
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+        * Nullam at nibh et risus.
+
+
+        """),
+    textwrap.dedent("""\
+        Version 0.1
+        ===========
+
+        :Released: 2008-01-01
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+        * Vestibulum eu risus sed velit.
+        """),
+]
+
+
+def make_test_document_text(
+        section_texts=test_section_texts, *, preamble=test_preamble):
+    """ Make a test document from the `preamble` and `section_texts`. """
+    text = preamble + "".join(section_texts)
+    return text
+
+
+class split_entry_sections_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘split_entry_sections’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.incremental.split_entry_sections)
+
+    scenarios = [
+        ('preamble', {
+            'test_document_text': make_test_document_text(),
+            'expected_preamble': test_preamble,
+            'expected_style': ("=", False),
+            'expected_section_texts': test_section_texts,
+            'expected_versions': ["1.0", "0.9", "0.1"],
+        }),
+        ('no-preamble', {
+            'test_document_text': make_test_document_text(preamble=""),
+            'expected_preamble': "",
+            'expected_style': ("=", False),
+            'expected_section_texts': test_section_texts,
+            'expected_versions': ["1.0", "0.9", "0.1"],
+        }),
+        ('overline', {
+            'test_document_text': textwrap.dedent("""\
+                ===========
+                Version 1.0
+                ===========
+
+                :Released: FUTURE
+
+                ===========
+                Version 0.1
+                ===========
+                """),
+            'expected_preamble': "",
+            'expected_style': ("=", True),
+            'expected_section_texts': [
+                "===========\nVersion 1.0\n===========\n\n"
+                ":Released: FUTURE\n\n",
+                "===========\nVersion 0.1\n===========\n",
+            ],
+            'expected_versions': ["1.0", "0.1"],
+        }),
+        ('title-not-after-blank-line', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                Lorem ipsum.
+                Version 0.1
+                ===========
+                """),
+            'expected_preamble': "",
+            'expected_style': ("=", False),
+            'expected_section_texts': [
+                "Version 1.0\n===========\n\n"
+                "Lorem ipsum.\nVersion 0.1\n===========\n",
+            ],
+            'expected_versions': ["1.0"],
+        }),
+        ('no-entry-titles', {
+            'test_document_text': "Lorem ipsum.\n",
+            'expected_error': chug.parsers.scanner.UnsupportedConstructError,
+        }),
+        ('inconsistent-styles', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                Version 0.1
+                -----------
+                """),
+            'expected_error': chug.parsers.scanner.UnsupportedConstructError,
+        }),
+        ('not-text', {
+            'test_document_text': b"Version 1.0\n===========\n",
+            'expected_error': TypeError,
+        }),
+    ]
+
+    def test_returns_expected_result(self):
+        """ Should return the expected preamble, style, and sections. """
+        with make_expected_error_context(self):
+            (preamble, style, sections) = self.function_to_test(
+                self.test_document_text)
+        if hasattr(self, 'expected_error'):
+            return
+        self.assertEqual(self.expected_preamble, preamble)
+        self.assertEqual(self.expected_style, style)
+        self.assertEqual(
+            self.expected_section_texts,
+            [section.text for section in sections])
+        self.assertEqual(
+            self.expected_versions,
+            [section.version for section in sections])
+        self.assertEqual(
+            ["Version " + version for version in self.expected_versions],
+            [section.title for section in sections])
+        self.assertEqual(
+            self.expected_section_texts,
+            [
+                self.test_document_text[section.start:section.end]
+                for section in sections])
+
+
+class get_reference_names_TestCase(testtools.TestCase):
+    """ Test cases for ‘get_reference_names’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.incremental.get_reference_names)
+
+    def test_returns_normalised_names_of_titles_and_targets(self):
+        """ Should return the normalised section titles and target names. """
+        lines = chug.parsers.scanner.get_document_lines(
+            test_preamble + ".. _Lorem  Ipsum:\n\n" + test_section_texts[1])
+        items = chug.parsers.scanner.generate_document_items(lines)
+        result = self.function_to_test(items)
+        self.assertEqual({"change log", "lorem ipsum", "version 0.9"}, result)
+
+
+class scan_entry_section_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘scan_entry_section’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.incremental.scan_entry_section)
+
+    scenarios = [
+        ('simple', {
+            'test_section_text': test_section_texts[1],
+            'expected_fields': (
+                "2009-01-01", "0.9", "Foo Bar <foo.bar@example.org>",
+                "Nullam at nibh et risus."),
+            'expected_body_source_text': "* Nullam at nibh et risus.\n",
+        }),
+        ('subsection', {
+            'test_section_text': test_section_texts[1] + textwrap.dedent("""\
+                Lorem
+                -----
+
+                Ipsum.
+                """),
+            'expected_error': chug.parsers.scanner.UnsupportedConstructError,
+        }),
+        ('inline-markup', {
+            'test_section_text': test_section_texts[1].replace(
+                "Nullam", "*Nullam*"),
+            'expected_error': chug.parsers.scanner.UnsupportedConstructError,
+        }),
+        ('hyperlink-target', {
+            'test_section_text': test_section_texts[1] + ".. _lorem:\n",
+            'expected_error': chug.parsers.scanner.UnsupportedConstructError,
+        }),
+    ]
+
+    def test_returns_expected_result(self):
+        """ Should return the entry scanned from the section. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(self.test_section_text)
+        if hasattr(self, 'expected_error'):
+            return
+        self.assertEqual(self.expected_fields, result.field_values())
+        self.assertEqual(
+            self.expected_body_source_text, str(result.body_source))
+
+
+class IncrementalChangeLogParser_TestCase(testtools.TestCase):
+    """ Test cases for ‘IncrementalChangeLogParser’ class. """
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+        self.instance = chug.parsers.incremental.IncrementalChangeLogParser()
+        self.observer = chug.parsers.instrumentation.SummaryObserver()
+
+    def parse(self, document_text):
+        """ Parse `document_text` with the instance, while observing. """
+        with chug.parsers.instrumentation.observing(self.observer):
+            result = self.instance.parse(document_text)
+        return result
+
+    def assert_entries_match_full_parse(self, entries, document_text):
+        """ Assert the `entries` match those from parsing `document_text`. """
+        expected_entries = chug.parsers.rest.make_change_log_entries_from_text(
+            document_text)
+        self.assertEqual(expected_entries, entries)
+        self.assertEqual(
+            [
+                (entry.body_source.start, entry.body_source.end)
+                for entry in expected_entries],
+            [
+                (entry.body_source.start, entry.body_source.end)
+                for entry in entries])
+        for entry in entries:
+            self.assertIs(document_text, entry.body_source.text)
+
+    def get_sections_parsed_count(self):
+        """ Get the number of sections parsed by the last parse. """
+        stage_summary = self.observer.summary['incremental_parse']
+        self.observer.summary.clear()
+        result = stage_summary['sections_parsed']
+        return result
+
+    def test_first_parse_returns_entries(self):
+        """ Should return the entries of the document on the first parse. """
+        document_text = make_test_document_text()
+        result = self.parse(document_text)
+        self.assert_entries_match_full_parse(result, document_text)
+        self.assertEqual(3, self.get_sections_parsed_count())
+
+    def test_unchanged_document_reuses_all_entries(self):
+        """ Should parse no section again for an unchanged document. """
+        document_text = make_test_document_text()
+        self.parse(document_text)
+        self.get_sections_parsed_count()
+        result = self.parse(document_text)
+        self.assert_entries_match_full_parse(result, document_text)
+        self.assertEqual(0, self.get_sections_parsed_count())
+
+    def test_changed_section_is_parsed_again(self):
+        """ Should parse only the section that changed. """
+        self.parse(make_test_document_text())
+        self.get_sections_parsed_count()
+        document_text = make_test_document_text([
+            test_section_texts[0].replace("Donec", "Aenean"),
+            *test_section_texts[1:]])
+        result = self.parse(document_text)
+        self.assert_entries_match_full_parse(result, document_text)
+        self.assertEqual("* Aenean venenatis nisl aliquam ipsum.", (
+            str(result[0].body_source)).strip())
+        self.assertEqual(1, self.get_sections_parsed_count())
+
+    def test_added_section_is_parsed(self):
+        """ Should parse only a section added to the document. """
+        self.parse(make_test_document_text())
+        self.get_sections_parsed_count()
+        new_section_text = test_section_texts[0].replace("1.0", "1.1")
+        document_text = make_test_document_text(
+            [new_section_text, *test_section_texts])
+        result = self.parse(document_text)
+        self.assert_entries_match_full_parse(result, document_text)
+        self.assertEqual(1, self.get_sections_parsed_count())
+
+    def test_removed_section_is_omitted(self):
+        """ Should omit the entry of a section removed from the document. """
+        self.parse(make_test_document_text())
+        self.get_sections_parsed_count()
+        document_text = make_test_document_text(test_section_texts[1:])
+        result = self.parse(document_text)
+        self.assert_entries_match_full_parse(result, document_text)
+        self.assertEqual(0, self.get_sections_parsed_count())
+
+    def test_changed_preamble_parses_whole_document(self):
+        """ Should parse the whole document when the preamble changed. """
+        self.parse(make_test_document_text())
+        self.get_sections_parsed_count()
+        document_text = make_test_document_text(preamble="")
+        result = self.parse(document_text)
+        self.assert_entries_match_full_parse(result, document_text)
+        self.assertEqual(3, self.get_sections_parsed_count())
+
+    def test_unsupported_section_parses_whole_document(self):
+        """ Should parse the whole document for an unsupported construct. """
+        self.parse(make_test_document_text())
+        self.get_sections_parsed_count()
+        document_text = make_test_document_text([
+            test_section_texts[0].replace("Donec", "*Donec*"),
+            *test_section_texts[1:]])
+        result = self.parse(document_text)
+        self.assertEqual(
+            chug.parsers.rest.make_change_log_entries_from_text(
+                document_text),
+            result)
+        self.assertEqual(3, self.get_sections_parsed_count())
+        self.assertEqual({}, self.instance.entries_by_section_hash)
+
+    def test_repeated_entry_title_parses_whole_document(self):
+        """ Should parse the whole document for a repeated entry title. """
+        self.parse(make_test_document_text())
+        self.get_sections_parsed_count()
+        document_text = make_test_document_text(
+            [test_section_texts[0], *test_section_texts])
+        result = self.parse(document_text)
+        self.assertEqual(
+            chug.parsers.rest.make_change_log_entries_from_text(
+                document_text),
+            result)
+        self.assertEqual(4, self.get_sections_parsed_count())
+
+    def test_target_in_changed_section_parses_whole_document(self):
+        """ Should parse the whole document for a new hyperlink target. """
+        self.parse(make_test_document_text())
+        self.get_sections_parsed_count()
+        document_text = make_test_document_text([
+            test_section_texts[0].replace(
+                "* Donec", ".. _lorem:\n\n* Donec"),
+            *test_section_texts[1:]])
+        result = self.parse(document_text)
+        self.assert_entries_match_full_parse(result, document_text)
+        self.assertEqual(3, self.get_sections_parsed_count())
+
+    def test_single_entry_parses_whole_document(self):
+        """ Should parse the whole document when it has only one entry. """
+        self.parse(make_test_document_text())
+        self.get_sections_parsed_count()
+        document_text = make_test_document_text(test_section_texts[:1])
+        result = self.parse(document_text)
+        self.assert_entries_match_full_parse(result, document_text)
+        self.assertEqual(1, self.get_sections_parsed_count())
+
+    def test_single_entry_document_keeps_no_entries(self):
+        """ Should keep no entries from a document with only one entry. """
+        preamble = ".. lorem\n\n"
+        self.parse(make_test_document_text(
+            test_section_texts[1:2], preamble=preamble))
+        self.assertEqual({}, self.instance.entries_by_section_hash)
+        document_text = make_test_document_text(
+            test_section_texts[0:2], preamble=preamble)
+        result = self.parse(document_text)
+        self.assert_entries_match_full_parse(result, document_text)
+        self.assertEqual(
+            [
+                "Donec venenatis nisl aliquam ipsum.",
+                "Nullam at nibh et risus."],
+            [entry.body for entry in result])
+
+    def test_invalid_changed_section_raises_error(self):
+        """ Should raise the error from an invalid changed section. """
+        self.parse(make_test_document_text())
+        document_text = make_test_document_text([
+            test_section_texts[0].replace("FUTURE", "2009-13-01"),
+            *test_section_texts[1:]])
+        with testtools.ExpectedException(chug.model.DateInvalidError):
+            self.parse(document_text)
+
+    def test_reset_discards_kept_entries(self):
+        """ Should parse the whole document after `reset`. """
+        document_text = make_test_document_text()
+        self.parse(document_text)
+        self.get_sections_parsed_count()
+        self.instance.reset()
+        self.parse(document_text)
+        self.assertEqual(3, self.get_sections_parsed_count())
+
+    def test_reused_entries_are_copies(self):
+        """ Should return a new entry for each parse. """
+        document_text = make_test_document_text()
+        first_result = self.parse(document_text)
+        with unittest.mock.patch.object(
+                chug.parsers.scanner, "make_change_log_entries_from_nodes",
+                side_effect=AssertionError):
+            result = self.parse(document_text)
+        for (first_entry, entry) in zip(first_result, result):
+            self.assertIsNot(first_entry, entry)
+
+    def test_exported_from_parsers_package(self):
+        """ Should be available from the ‘chug.parsers’ package. """
+        self.assertIs(
+            chug.parsers.incremental.IncrementalChangeLogParser,
+            chug.parsers.IncrementalChangeLogParser)
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
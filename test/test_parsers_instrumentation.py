@@ -0,0 +1,237 @@
+# test/test_parsers_instrumentation.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Test cases for ‘chug.parsers.instrumentation’ module. """
+
+import textwrap
+import unittest.mock
+
+import testscenarios
+import testtools
+
+import chug.parsers
+import chug.parsers.core
+import chug.parsers.instrumentation
+import chug.parsers.rest
+
+from . import make_temporary_file_path
+
+
+test_document_text = textwrap.dedent("""\
+    Version 1.0
+    ===========
+
+    :Released: 2009-01-01
+    :Maintainer: Foo Bar <foo.bar@example.org>
+
+    * Lorem ipsum dolor sit amet.
+
+
+    Version 0.1
+    ===========
+
+    :Released: 2008-01-01
+    :Maintainer: Foo Bar <foo.bar@example.org>
+
+    * Donec venenatis nisl aliquam ipsum.
+    """)
+
+
+class stage_TestCase(testtools.TestCase):
+    """ Test cases for ‘stage’ function. """
+
+    function_to_test = staticmethod(chug.parsers.instrumentation.stage)
+
+    def test_returns_null_stage_when_no_observer(self):
+        """ Should return the `null_stage` when no observer is active. """
+        result = self.function_to_test('lorem', entries=1)
+        self.assertIs(chug.parsers.instrumentation.null_stage, result)
+
+    def test_null_stage_ignores_counts(self):
+        """ Should accept and ignore counts added to the null stage. """
+        with self.function_to_test('lorem') as stage:
+            stage.add_counts(entries=1)
+
+    def test_reports_stage_to_observer(self):
+        """ Should call the observer with name, duration, and counts. """
+        observer = unittest.mock.MagicMock()
+        with chug.parsers.instrumentation.observing(observer):
+            with self.function_to_test('lorem', bytes=7) as stage:
+                stage.add_counts(entries=2)
+        observer.assert_called_once_with(
+            'lorem', unittest.mock.ANY, {'bytes': 7, 'entries': 2})
+        (__, duration, __) = observer.call_args.args
+        self.assertGreaterEqual(duration, 0)
+
+    def test_reports_stage_when_error_raised(self):
+        """ Should report the stage when an exception ends it. """
+        observer = unittest.mock.MagicMock()
+        with chug.parsers.instrumentation.observing(observer):
+            with testtools.ExpectedException(ValueError):
+                with self.function_to_test('lorem'):
+                    raise ValueError
+        observer.assert_called_once_with('lorem', unittest.mock.ANY, {})
+
+
+class observing_TestCase(testtools.TestCase):
+    """ Test cases for ‘observing’ function. """
+
+    function_to_test = staticmethod(chug.parsers.instrumentation.observing)
+
+    def test_returns_observer_as_context_value(self):
+        """ Should give the `observer` as the value of the context. """
+        observer = unittest.mock.MagicMock()
+        with self.function_to_test(observer) as result:
+            self.assertIs(observer, result)
+
+    def test_restores_previous_observer_at_end(self):
+        """ Should restore the previous observer at the end of context. """
+        outer_observer = unittest.mock.MagicMock()
+        inner_observer = unittest.mock.MagicMock()
+        current_observer = chug.parsers.instrumentation.current_observer
+        with self.function_to_test(outer_observer):
+            with self.function_to_test(inner_observer):
+                self.assertIs(inner_observer, current_observer.get())
+            self.assertIs(outer_observer, current_observer.get())
+        self.assertIsNone(current_observer.get())
+
+    def test_restores_previous_observer_when_error_raised(self):
+        """ Should restore the previous observer when an error is raised. """
+        observer = unittest.mock.MagicMock()
+        with testtools.ExpectedException(ValueError):
+            with self.function_to_test(observer):
+                raise ValueError
+        self.assertIsNone(
+            chug.parsers.instrumentation.current_observer.get())
+
+
+class SummaryObserver_TestCase(testtools.TestCase):
+    """ Test cases for ‘SummaryObserver’ class. """
+
+    def test_summary_initially_empty(self):
+        """ Should have an empty `summary` initially. """
+        instance = chug.parsers.instrumentation.SummaryObserver()
+        self.assertEqual({}, instance.summary)
+
+    def test_aggregates_stages_by_name(self):
+        """ Should aggregate calls, durations, and counts for each stage. """
+        instance = chug.parsers.instrumentation.SummaryObserver()
+        instance('lorem', 0.5, {'entries': 1, 'fields': 2})
+        instance('lorem', 0.25, {'entries': 3})
+        instance('ipsum', 1.0, {})
+        expected_summary = {
+            'lorem': {
+                'calls': 2, 'seconds': 0.75, 'entries': 4, 'fields': 2},
+            'ipsum': {'calls': 1, 'seconds': 1.0},
+        }
+        self.assertEqual(expected_summary, instance.summary)
+
+
+class parse_stages_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for stages observed while parsing a document. """
+
+    scenarios = [
+        ('scanner', {
+            'parse_func': (
+                chug.parsers.rest.make_change_log_entries_from_text),
+            'expected_stages': {
+                'scan': {'calls': 1, 'characters': len(test_document_text)},
+                'field_lookup': {'calls': 1, 'fields': 8},
+                'model_validation': {'calls': 1, 'entries': 2},
+            },
+        }),
+        ('docutils', {
+            'parse_func': (
+                lambda text: [
+                    entry for entry in (
+                        chug.parsers.rest
+                        .make_change_log_entries_from_document(
+                            chug.parsers.rest.parse_rest_document_from_text(
+                                text)))
+                    if entry.body]),
+            'expected_stages': {
+                'docutils_publish': {
+                    'calls': 1, 'characters': len(test_document_text)},
+                'title_verification': {'calls': 2},
+                'field_lookup': {'calls': 2, 'fields': 4},
+                'body_flattening': {
+                    'calls': 2,
+                    'characters': len(
+                        "Lorem ipsum dolor sit amet."
+                        "Donec venenatis nisl aliquam ipsum."),
+                },
+                'model_validation': {'calls': 2, 'entries': 2},
+            },
+        }),
+    ]
+
+    def test_observes_expected_stages(self):
+        """ Should report the expected stages and counts. """
+        observer = chug.parsers.instrumentation.SummaryObserver()
+        with chug.parsers.observing(observer):
+            self.parse_func(test_document_text)
+        summary_without_seconds = {
+            name: {
+                key: value for (key, value) in stage_summary.items()
+                if key != 'seconds'}
+            for (name, stage_summary) in observer.summary.items()}
+        self.assertEqual(self.expected_stages, summary_without_seconds)
+
+    def test_observes_nothing_when_not_observing(self):
+        """ Should not call any observer outside an observing context. """
+        observer = unittest.mock.MagicMock()
+        with chug.parsers.observing(observer):
+            pass
+        self.parse_func(test_document_text)
+        observer.assert_not_called()
+
+
+class read_file_stage_TestCase(testtools.TestCase):
+    """ Test cases for stages observed while reading a document file. """
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+        self.test_infile_path = make_temporary_file_path(
+            self, test_document_text.encode('utf-8'))
+        self.observer = chug.parsers.instrumentation.SummaryObserver()
+
+    def test_get_changelog_document_text_observes_read(self):
+        """ Should report the characters read from the document file. """
+        with chug.parsers.observing(self.observer):
+            chug.parsers.core.get_changelog_document_text(
+                self.test_infile_path)
+        self.assertEqual(
+            len(test_document_text),
+            self.observer.summary['read_file']['characters'])
+
+    def test_document_file_observes_read_and_decode(self):
+        """ Should report the bytes read from, and decoded from, the file. """
+        with chug.parsers.observing(self.observer):
+            with chug.parsers.core.ChangeLogDocumentFile(
+                    self.test_infile_path) as document_file:
+                document_file.decode(0, 10)
+        expected_size = len(test_document_text.encode('utf-8'))
+        self.assertEqual(
+            expected_size, self.observer.summary['read_file']['bytes'])
+        self.assertEqual(10, self.observer.summary['decode']['bytes'])
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
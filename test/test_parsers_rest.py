@@ -7,8 +7,11 @@
 
 """ Test cases for ‘chug.parsers.rest’ module. """
 
+import copy
 import itertools
+import pickle
 import textwrap
+import types
 import unittest.mock
 
 import docutils.core
@@ -19,9 +22,13 @@ import testscenarios
 import testtools
 
 import chug.model
+import chug.parsers.core
 import chug.parsers.rest
 
-from . import make_expected_error_context
+from . import (
+    make_expected_error_context,
+    make_temporary_file_path,
+)
 
 
 def patch_docutils_publish_doctree(testcase, *, fake_document=None):
@@ -194,6 +201,37 @@ class verify_is_docutils_node_TestCase(
             self.assertEqual(self.expected_result, result)
 
 
+class verify_is_docutils_node_MessageTestCase(testtools.TestCase):
+    """ Test cases for the error message of ‘verify_is_docutils_node’. """
+
+    function_to_test = staticmethod(chug.parsers.rest.verify_is_docutils_node)
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        func_patcher = unittest.mock.patch.object(
+            chug.parsers.rest, "make_node_type_error_message",
+            wraps=chug.parsers.rest.make_node_type_error_message)
+        func_patcher.start()
+        self.addCleanup(func_patcher.stop)
+
+    def test_makes_no_message_when_verified(self):
+        """ Should not make the error message if the node is verified. """
+        self.function_to_test(
+            docutils.nodes.paragraph(""), node_type=docutils.nodes.paragraph)
+        chug.parsers.rest.make_node_type_error_message.assert_not_called()
+
+    def test_makes_message_when_not_verified(self):
+        """ Should make the error message if the node is not verified. """
+        test_node = docutils.nodes.paragraph("")
+        with testtools.ExpectedException(TypeError):
+            self.function_to_test(
+                test_node, node_type=docutils.nodes.title)
+        chug.parsers.rest.make_node_type_error_message.assert_called_once_with(
+            test_node, docutils.nodes.title)
+
+
 class get_node_text_TestCase(
         testscenarios.WithScenarios, testtools.TestCase):
     """ Test cases for ‘get_node_text’ function. """
@@ -2415,6 +2453,132 @@ class get_field_list_from_entry_node_ErrorTestCase(
             __ = self.function_to_test(*self.test_args)
 
 
+class get_field_bodies_by_name_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘get_field_bodies_by_name’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.get_field_bodies_by_name)
+
+    scenarios = [
+        ('entries-one fields-three', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+                :License: AGPL-3+
+
+                * Lorem ipsum dolor sit amet.
+                """),
+            'test_change_log_entry_node_id': "version-1-0",
+            'expected_field_texts': {
+                'released': "2009-01-01",
+                'maintainer': "Foo Bar <foo.bar@example.org>",
+                'license': "AGPL-3+",
+            },
+        }),
+        ('entries-one fields-extra mixed-case', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :RELEASED: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+                :Tags: lorem, ipsum
+                :Security: CVE-2009-0001
+
+                * Lorem ipsum dolor sit amet.
+                """),
+            'test_change_log_entry_node_id': "version-1-0",
+            'expected_field_texts': {
+                'released': "2009-01-01",
+                'maintainer': "Foo Bar <foo.bar@example.org>",
+                'tags': "lorem, ipsum",
+                'security': "CVE-2009-0001",
+            },
+        }),
+        ('entries-one fields-duplicate', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+                :Maintainer: Zang Warx <zang.warx@example.org>
+
+                * Lorem ipsum dolor sit amet.
+                """),
+            'test_change_log_entry_node_id': "version-1-0",
+            'expected_field_texts': {
+                'released': "2009-01-01",
+                'maintainer': "Foo Bar <foo.bar@example.org>",
+            },
+        }),
+    ]
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_document = docutils.core.publish_doctree(
+            self.test_document_text)
+        self.test_change_log_entry_node = get_node_from_document_by_node_id(
+            self.test_document, node_id=self.test_change_log_entry_node_id)
+        self.test_field_list_node = next(iter(
+            child_node
+            for child_node in self.test_change_log_entry_node.children
+            if isinstance(child_node, (
+                    docutils.nodes.docinfo,
+                    docutils.nodes.field_list))
+        ))
+        self.test_args = [self.test_field_list_node]
+
+    def test_returns_expected_result(self):
+        """ Should return expected result. """
+        result = self.function_to_test(*self.test_args)
+        self.assertEqual(
+            self.expected_field_texts,
+            {name: node.astext() for (name, node) in result.items()})
+
+    def test_returns_field_body_nodes(self):
+        """ Should return the field body node for each name. """
+        result = self.function_to_test(*self.test_args)
+        for node in result.values():
+            self.assertIsInstance(node, docutils.nodes.field_body)
+
+    def test_field_texts_from_entry_node_same_as_result(self):
+        """ Should get the same field text from the entry node. """
+        result = chug.parsers.rest.get_field_texts_from_entry_node(
+            self.test_change_log_entry_node)
+        self.assertEqual(self.expected_field_texts, result)
+
+
+class get_field_bodies_by_name_ErrorTestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Error test cases for ‘get_field_bodies_by_name’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.get_field_bodies_by_name)
+
+    scenarios = [
+        ('not-a-node', {
+            'test_field_list_node': object(),
+            'expected_error': TypeError,
+        }),
+        ('not-a-field-list-node', {
+            'test_field_list_node': docutils.nodes.paragraph(),
+            'expected_error': TypeError,
+        }),
+    ]
+
+    def test_raises_expected_error(self):
+        """ Should raise expected error. """
+        with make_expected_error_context(self):
+            __ = self.function_to_test(self.test_field_list_node)
+
+
 class get_field_body_for_name_TestCase(
         testscenarios.WithScenarios, testtools.TestCase):
     """ Test cases for ‘get_field_body_for_name’ function. """
@@ -2829,6 +2993,48 @@ class make_change_log_entry_from_node_TestCase(
             self.expected_change_log_entry.as_version_info_entry(),
             result.as_version_info_entry())
 
+    def test_defers_body_text_until_accessed(self):
+        """ Should get the body text only when `body` is first accessed. """
+        with unittest.mock.patch.object(
+                chug.parsers.rest, 'get_body_text_from_entry_node',
+                wraps=chug.parsers.rest.get_body_text_from_entry_node,
+        ) as mock_get_body_text:
+            result = self.function_to_test(*self.test_args)
+            mock_get_body_text.assert_not_called()
+            self.assertEqual(
+                self.expected_change_log_entry.body, result.body)
+            self.assertEqual(
+                self.expected_change_log_entry.body, result.body)
+        mock_get_body_text.assert_called_once_with(
+            self.test_change_log_entry_node, trusted=True)
+
+    def test_trusted_returns_same_result(self):
+        """ Should return the same result when the node is trusted. """
+        result = self.function_to_test(*self.test_args, trusted=True)
+        self.assertEqual(
+            self.expected_change_log_entry.as_version_info_entry(),
+            result.as_version_info_entry())
+
+    def test_trusted_does_not_verify_node_types(self):
+        """ Should not verify any node type when the node is trusted. """
+        with unittest.mock.patch.object(
+                chug.parsers.rest, 'verify_is_docutils_node',
+        ) as mock_verify:
+            result = self.function_to_test(*self.test_args, trusted=True)
+            __ = result.body
+        mock_verify.assert_not_called()
+
+    def test_verifies_entry_node_type_only_once(self):
+        """ Should verify the node type only once, if not trusted. """
+        with unittest.mock.patch.object(
+                chug.parsers.rest, 'verify_is_docutils_node',
+        ) as mock_verify:
+            result = self.function_to_test(*self.test_args)
+            __ = result.body
+        mock_verify.assert_called_once_with(
+            self.test_change_log_entry_node, node_type=tuple(
+                chug.parsers.rest.get_field_list_type_by_entry_node_type()))
+
 
 class make_change_log_entry_from_node_ErrorTestCase(
         testscenarios.WithScenarios, testtools.TestCase):
@@ -2931,6 +3137,51 @@ class make_change_log_entries_from_document_TestCase(
                     result_item.as_version_info_entry())
 
 
+class make_change_log_entries_from_document_PickleTestCase(
+        testtools.TestCase):
+    """ Test cases for pickling entries made from a document. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.make_change_log_entries_from_document)
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_document = docutils.core.publish_doctree(textwrap.dedent("""\
+            Version 1.0
+            ===========
+
+            :Released: 2009-01-01
+            :Maintainer: Foo Bar <foo.bar@example.org>
+
+            * Lorem ipsum dolor sit amet.
+            """))
+        (self.test_entry,) = self.function_to_test(self.test_document)
+
+    def test_pickle_round_trip_gives_equal_entry(self):
+        """ Should unpickle to an entry equal to the original. """
+        data = pickle.dumps(self.test_entry)
+        result = pickle.loads(data)
+        self.assertEqual(self.test_entry, result)
+
+    def test_pickle_omits_document(self):
+        """ Should not pickle the document from which the body comes. """
+        data = pickle.dumps(self.test_entry)
+        self.assertNotIn(b"docutils", data)
+
+    def test_deepcopy_gives_equal_entry(self):
+        """ Should deep-copy to an entry equal to the original. """
+        result = copy.deepcopy(self.test_entry)
+        self.assertEqual(self.test_entry, result)
+
+    def test_instance_attributes_name_body_field(self):
+        """ Should name the ‘body’ field among the instance attributes. """
+        attribute_names = vars(self.test_entry)
+        self.assertIn('body', attribute_names)
+        self.assertNotIn('body_content', attribute_names)
+
+
 class make_change_log_entries_from_document_ErrorTestCase(
         testscenarios.WithScenarios, testtools.TestCase):
     """ Error test cases for ‘make_change_log_entries_from_document’. """
@@ -2991,6 +3242,671 @@ class make_change_log_entries_from_document_ErrorTestCase(
         with make_expected_error_context(self):
             __ = self.function_to_test(*self.test_args)
 
+
+class iter_change_log_entries_from_document_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘iter_change_log_entries_from_document’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.iter_change_log_entries_from_document)
+
+    scenarios = make_rest_document_test_scenarios()
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_document = docutils.core.publish_doctree(
+            self.test_document_text)
+        self.test_args = [self.test_document]
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = list(self.function_to_test(*self.test_args))
+        if hasattr(self, 'expected_change_log_entries'):
+            self.assertEqual(
+                [
+                    entry.as_version_info_entry()
+                    for entry in self.expected_change_log_entries],
+                [entry.as_version_info_entry() for entry in result])
+
+
+class iter_change_log_entries_from_document_LazyTestCase(
+        testtools.TestCase):
+    """ Test cases for ‘iter_change_log_entries_from_document’ laziness. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.iter_change_log_entries_from_document)
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_document = docutils.core.publish_doctree(
+            textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem ipsum dolor sit amet.
+
+
+                Felis gravida lacinia
+                =====================
+
+                Maecenas feugiat nibh sed enim fringilla faucibus.
+                """))
+        self.test_args = [self.test_document]
+
+    def test_returns_generator(self):
+        """ Should return a generator, without processing any entry. """
+        result = self.function_to_test(*self.test_args)
+        self.assertIsInstance(result, types.GeneratorType)
+
+    def test_generates_valid_entry_before_invalid_entry(self):
+        """ Should generate valid entry before reaching an invalid entry. """
+        entries = self.function_to_test(*self.test_args)
+        expected_entry = chug.model.ChangeLogEntry(
+            release_date="2009-01-01",
+            version="1.0",
+            maintainer="Foo Bar <foo.bar@example.org>",
+            body="Lorem ipsum dolor sit amet.",
+        )
+        self.assertEqual(expected_entry, next(entries))
+        with testtools.ExpectedException(ValueError):
+            __ = next(entries)
+
+
+class iter_change_log_entries_from_document_ErrorTestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Error test cases for ‘iter_change_log_entries_from_document’. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.iter_change_log_entries_from_document)
+
+    scenarios = make_change_log_entries_from_document_ErrorTestCase.scenarios
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_args = [self.test_document]
+
+    def test_raises_expected_error(self):
+        """ Should raise expected error. """
+        with make_expected_error_context(self):
+            __ = list(self.function_to_test(*self.test_args))
+
+
+class make_change_log_entries_from_text_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘make_change_log_entries_from_text’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.make_change_log_entries_from_text)
+
+    scenarios = make_rest_document_test_scenarios()
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_args = [self.test_document_text]
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(*self.test_args)
+        if hasattr(self, 'expected_change_log_entries'):
+            for (expected_change_log_entry, result_item) in zip(
+                    self.expected_change_log_entries,
+                    result,
+                    strict=True,
+            ):
+                self.assertEqual(
+                    expected_change_log_entry.as_version_info_entry(),
+                    result_item.as_version_info_entry())
+
+
+class make_change_log_entries_from_text_FallbackTestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘make_change_log_entries_from_text’ fallback. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.make_change_log_entries_from_text)
+
+    scenarios = [
+        ('scanner-supported', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem ipsum dolor sit amet.
+                """),
+            'expected_body': "Lorem ipsum dolor sit amet.",
+            'expect_docutils_called': False,
+        }),
+        ('scanner-unsupported inline-markup', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem *ipsum* dolor sit amet.
+                """),
+            'expected_body': "Lorem ipsum dolor sit amet.",
+            'expect_docutils_called': True,
+        }),
+    ]
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        func_patcher = unittest.mock.patch.object(
+            docutils.core, "publish_doctree",
+            wraps=docutils.core.publish_doctree)
+        func_patcher.start()
+        self.addCleanup(func_patcher.stop)
+
+        self.test_args = [self.test_document_text]
+
+    def test_returns_expected_body(self):
+        """ Should return entry with expected body text. """
+        (result,) = self.function_to_test(*self.test_args)
+        self.assertEqual(self.expected_body, result.body)
+
+    def test_calls_docutils_only_when_expected(self):
+        """ Should parse with Docutils only when scanner is unsupported. """
+        __ = self.function_to_test(*self.test_args)
+        self.assertEqual(
+            self.expect_docutils_called,
+            docutils.core.publish_doctree.called)
+
+
+class make_change_log_entries_from_text_body_source_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘body_source’ of entries made from text. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.make_change_log_entries_from_text)
+
+    scenarios = [
+        ('scanner', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem ipsum dolor sit amet.
+
+
+                Version 0.8
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Donec venenatis nisl aliquam ipsum.
+                """),
+            'expected_body_sources': [
+                "* Lorem ipsum dolor sit amet.\n",
+                "* Donec venenatis nisl aliquam ipsum.\n",
+            ],
+        }),
+        ('docutils overline-titles directive', {
+            'test_document_text': textwrap.dedent("""\
+                ===========
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+                :Tags: lorem,
+                    ipsum
+
+                * Lorem ipsum *dolor* sit amet.
+
+                ===========
+                Version 0.8
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                ..  note:: Donec venenatis nisl aliquam ipsum.
+
+                    Pellentesque elementum mollis finibus.
+
+                """),
+            'expected_body_sources': [
+                "* Lorem ipsum *dolor* sit amet.\n",
+                textwrap.dedent("""\
+                    ..  note:: Donec venenatis nisl aliquam ipsum.
+
+                        Pellentesque elementum mollis finibus.
+                    """),
+            ],
+        }),
+        ('docutils document-title entry', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                Lorem ipsum *dolor* sit amet.
+                """),
+            'expected_body_sources': [
+                "Lorem ipsum *dolor* sit amet.\n",
+            ],
+        }),
+    ]
+
+    def test_has_expected_body_sources(self):
+        """ Should have the expected body source text for each entry. """
+        result = self.function_to_test(self.test_document_text)
+        self.assertEqual(
+            self.expected_body_sources,
+            [str(entry.body_source) for entry in result])
+
+    def test_latest_entry_has_same_body_source(self):
+        """ Should get the same body source for only the latest entry. """
+        result = chug.parsers.rest.get_latest_change_log_entry(
+            self.test_document_text)
+        self.assertEqual(
+            self.expected_body_sources[0], str(result.body_source))
+
+    def test_body_source_none_without_document_source(self):
+        """ Should have no body source if the source is not specified. """
+        document = chug.parsers.rest.parse_rest_document_from_text(
+            self.test_document_text)
+        result = chug.parsers.rest.make_change_log_entries_from_document(
+            document)
+        self.assertEqual(
+            [None] * len(self.expected_body_sources),
+            [entry.body_source for entry in result])
+
+    def test_iter_entries_have_same_body_sources(self):
+        """ Should get the same body sources when generating entries. """
+        document = chug.parsers.rest.parse_rest_document_from_text(
+            self.test_document_text)
+        result = chug.parsers.rest.iter_change_log_entries_from_document(
+            document,
+            document_source=chug.parsers.core.DocumentSource(
+                self.test_document_text))
+        self.assertEqual(
+            self.expected_body_sources,
+            [str(entry.body_source) for entry in result])
+
+
+class get_latest_change_log_entry_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘get_latest_change_log_entry’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.get_latest_change_log_entry)
+
+    scenarios = make_rest_document_test_scenarios() + [
+        ('scanner-unsupported entries-two', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem *ipsum* dolor sit amet.
+
+
+                Version 0.8
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Donec venenatis nisl aliquam ipsum.
+                """),
+            'expected_change_log_entries': [
+                chug.model.ChangeLogEntry(
+                    release_date="2009-01-01",
+                    version="1.0",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body="Lorem ipsum dolor sit amet.",
+                ),
+            ],
+        }),
+        ('scanner-unsupported entries-two older-title-invalid', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem *ipsum* dolor sit amet.
+
+
+                Lorem ipsum
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Donec venenatis nisl aliquam ipsum.
+                """),
+            'expected_change_log_entries': [
+                chug.model.ChangeLogEntry(
+                    release_date="2009-01-01",
+                    version="1.0",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body="Lorem ipsum dolor sit amet.",
+                ),
+            ],
+        }),
+    ]
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_args = [self.test_document_text]
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(*self.test_args)
+        if hasattr(self, 'expected_change_log_entries'):
+            self.assertEqual(
+                self.expected_change_log_entries[0].as_version_info_entry(),
+                result.as_version_info_entry())
+
+
+class lint_document_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘lint_document’ function. """
+
+    function_to_test = staticmethod(chug.parsers.rest.lint_document)
+
+    scenarios = [
+        ('entries-valid', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem ipsum dolor sit amet.
+
+
+                Version 0.8
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Donec venenatis nisl aliquam ipsum.
+                """),
+            'expected_diagnostics': [],
+        }),
+        ('entries-invalid fields', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem ipsum dolor sit amet.
+
+
+                Version 0.8.x
+                =============
+
+                :Released: b0gUs
+                :Maintainer: Foo Bar
+
+                * Donec venenatis nisl aliquam ipsum.
+                """),
+            'expected_diagnostics': [
+                (1, 'release_date', 13),
+                (1, 'version', 10),
+                (1, 'maintainer', 14),
+            ],
+        }),
+        ('entries-invalid structure', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem ipsum dolor sit amet.
+
+
+                Version 0.8
+                ===========
+
+                * Donec venenatis nisl aliquam ipsum.
+
+
+                Lorem ipsum
+                ===========
+
+                * Donec venenatis nisl aliquam ipsum.
+                """),
+            'expected_diagnostics': [
+                (0, 'release_date', 4),
+                (1, None, 9),
+                (2, None, 15),
+            ],
+        }),
+        ('not-text', {
+            'test_document_text': 0xABCD,
+            'expected_error': TypeError,
+        }),
+    ]
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(self.test_document_text)
+        if hasattr(self, 'expected_diagnostics'):
+            self.assertEqual(
+                self.expected_diagnostics,
+                [
+                    (
+                        diagnostic.entry_index, diagnostic.field_name,
+                        diagnostic.line)
+                    for diagnostic in result])
+
+    def test_makes_no_change_log_entries(self):
+        """ Should not make any ‘ChangeLogEntry’ instances. """
+        if hasattr(self, 'expected_error'):
+            self.skipTest("no result expected")
+        with unittest.mock.patch.object(
+                chug.model, "ChangeLogEntry") as mock_entry_class:
+            __ = self.function_to_test(self.test_document_text)
+        mock_entry_class.assert_not_called()
+
+
+def make_file_test_scenarios(scenarios):
+    """ Make the `scenarios` that have document text, for files.
+
+        :param scenarios: Sequence of scenarios, each with a
+            `test_document_text` parameter.
+        :return: The sequence of those scenarios whose document text is a
+            text string, so it can be written to a file.
+        """
+    result = [
+        (name, params) for (name, params) in scenarios
+        if isinstance(params['test_document_text'], str)]
+    return result
+
+
+class make_change_log_entries_from_file_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘make_change_log_entries_from_file’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.make_change_log_entries_from_file)
+
+    scenarios = make_file_test_scenarios(
+        make_change_log_entries_from_text_TestCase.scenarios)
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_args = [
+            make_temporary_file_path(
+                self, self.test_document_text.encode('utf-8'))]
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(*self.test_args)
+        if hasattr(self, 'expected_change_log_entries'):
+            self.assertEqual(
+                [
+                    entry.as_version_info_entry()
+                    for entry in self.expected_change_log_entries],
+                [entry.as_version_info_entry() for entry in result])
+
+
+class get_latest_change_log_entry_from_file_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘get_latest_change_log_entry_from_file’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.rest.get_latest_change_log_entry_from_file)
+
+    scenarios = make_file_test_scenarios(
+        get_latest_change_log_entry_TestCase.scenarios)
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_args = [
+            make_temporary_file_path(
+                self, self.test_document_text.encode('utf-8'))]
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(*self.test_args)
+        if hasattr(self, 'expected_change_log_entries'):
+            self.assertEqual(
+                self.expected_change_log_entries[0].as_version_info_entry(),
+                result.as_version_info_entry())
+
+    def test_result_has_same_body_source_as_from_text(self):
+        """ Should get the same body source as from the document text. """
+        if hasattr(self, 'expected_change_log_entries'):
+            expected_entry = chug.parsers.rest.get_latest_change_log_entry(
+                self.test_document_text)
+            result = self.function_to_test(*self.test_args)
+            self.assertEqual(
+                str(expected_entry.body_source), str(result.body_source))
+
+
+class ChangeLogRestParser_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘ChangeLogRestParser’ class. """
+
+    scenarios = make_rest_document_test_scenarios()
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_instance = chug.parsers.rest.ChangeLogRestParser()
+
+    def test_parse_returns_document(self):
+        """ Should return a Docutils document from `parse`. """
+        result = self.test_instance.parse(self.test_document_text)
+        self.assertIsInstance(result, docutils.nodes.document)
+
+    def test_parse_result_has_same_entries_as_publish_doctree(self):
+        """ Should get the same entries as from ‘publish_doctree’. """
+        if hasattr(self, 'expected_error'):
+            self.skipTest("document is not a valid Change Log")
+        expected_entries = (
+            chug.parsers.rest.make_change_log_entries_from_document(
+                docutils.core.publish_doctree(self.test_document_text)))
+        result = chug.parsers.rest.make_change_log_entries_from_document(
+            self.test_instance.parse(self.test_document_text))
+        self.assertEqual(
+            [entry.as_version_info_entry() for entry in expected_entries],
+            [entry.as_version_info_entry() for entry in result])
+
+    def test_parse_reuses_parser(self):
+        """ Should use the same Docutils parser for each document. """
+        expected_parser = self.test_instance.parser
+        for __ in range(2):
+            __ = self.test_instance.parse(self.test_document_text)
+        self.assertIs(expected_parser, self.test_instance.parser)
+
+
+class ChangeLogRestParser_SettingsTestCase(testtools.TestCase):
+    """ Test cases for ‘ChangeLogRestParser’ settings. """
+
+    def test_has_default_settings(self):
+        """ Should have the Docutils default settings. """
+        instance = chug.parsers.rest.ChangeLogRestParser()
+        self.assertTrue(instance.settings.doctitle_xform)
+
+    def test_has_specified_settings_overrides(self):
+        """ Should have the specified `settings_overrides` values. """
+        instance = chug.parsers.rest.ChangeLogRestParser(
+            settings_overrides={'doctitle_xform': False})
+        self.assertFalse(instance.settings.doctitle_xform)
+
+    def test_parse_uses_settings(self):
+        """ Should parse documents using the instance settings. """
+        instance = chug.parsers.rest.ChangeLogRestParser(
+            settings_overrides={'doctitle_xform': False})
+        result = instance.parse(textwrap.dedent("""\
+            Lorem ipsum
+            ===========
+            """))
+        self.assertFalse(result.hasattr('title'))
+
+
+class ChangeLogRestParser_ErrorTestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Error test cases for ‘ChangeLogRestParser’ class. """
+
+    scenarios = [
+        ('type-none', {
+            'test_document_text': None,
+            'expected_error': TypeError,
+        }),
+        ('type-bytes', {
+            'test_document_text': b"b0gUs",
+            'expected_error': TypeError,
+        }),
+    ]
+
+    def test_parse_raises_expected_error(self):
+        """ Should raise expected error from `parse`. """
+        instance = chug.parsers.rest.ChangeLogRestParser()
+        with make_expected_error_context(self):
+            __ = instance.parse(self.test_document_text)
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
@@ -0,0 +1,732 @@
+# test/test_parsers_scanner.py
+# Part of ‘changelog-chug’, a parser for project Change Log documents.
+#
+# This is free software, and you are welcome to redistribute it under
+# certain conditions; see the end of this file for copyright
+# information, grant of license, and disclaimer of warranty.
+
+""" Test cases for ‘chug.parsers.scanner’ module. """
+
+import textwrap
+
+import docutils.core
+import testscenarios
+import testtools
+
+import chug.model
+import chug.parsers.core
+import chug.parsers.rest
+import chug.parsers.scanner
+
+from . import (
+    make_expected_error_context,
+    make_temporary_file_path,
+)
+from .test_parsers_rest import make_rest_document_test_scenarios
+
+
+class UnsupportedConstructError_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for class `UnsupportedConstructError`. """
+
+    scenarios = [
+        ('line-and-message', {
+            'test_args': [17, "Lorem ipsum"],
+            'expected_text': "Lorem ipsum: line 17",
+        }),
+        ('line-only', {
+            'test_args': [17],
+            'expected_text': "(no message): line 17",
+        }),
+        ('message-only', {
+            'test_args': [None, "Lorem ipsum"],
+            'expected_text': "Lorem ipsum: line (unknown)",
+        }),
+    ]
+
+    def test_is_value_error(self):
+        """ Should be a `ValueError`. """
+        instance = chug.parsers.scanner.UnsupportedConstructError(
+            *self.test_args)
+        self.assertIsInstance(instance, ValueError)
+
+    def test_has_expected_text(self):
+        """ Should have expected text representation. """
+        instance = chug.parsers.scanner.UnsupportedConstructError(
+            *self.test_args)
+        self.assertEqual(self.expected_text, str(instance))
+
+
+class get_document_lines_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘get_document_lines’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.scanner.get_document_lines)
+
+    scenarios = [
+        ('simple', {
+            'test_document_text': "Lorem\nipsum\n",
+            'expected_result': ["Lorem", "ipsum"],
+        }),
+        ('empty', {
+            'test_document_text': "",
+            'expected_result': [],
+        }),
+        ('trailing-whitespace', {
+            'test_document_text': "Lorem   \n\t\nipsum\t\n",
+            'expected_result': ["Lorem", "", "ipsum"],
+        }),
+        ('form-feed', {
+            'test_document_text': "Lorem\n\f\nipsum\n",
+            'expected_result': ["Lorem", "", "ipsum"],
+        }),
+        ('carriage-return', {
+            'test_document_text': "Lorem\r\nipsum\r\n",
+            'expected_result': ["Lorem", "ipsum"],
+        }),
+        ('byte-order-mark', {
+            'test_document_text': "\ufeffLorem\nipsum\n",
+            'expected_error': (
+                chug.parsers.scanner.UnsupportedConstructError),
+        }),
+        ('type-bytes', {
+            'test_document_text': b"b0gUs",
+            'expected_error': TypeError,
+        }),
+    ]
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(self.test_document_text)
+        if hasattr(self, 'expected_result'):
+            self.assertEqual(self.expected_result, result)
+
+
+def make_scanner_supported_document_test_scenarios():
+    """ Make scenarios for documents that the scanner should handle.
+
+        :return: Sequence of tuples `(name, parameters)`. Each is a scenario
+            as specified for `testscenarios`.
+        """
+    scenarios = [
+        ('entries-two body-lists', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem ipsum dolor sit amet,
+                  consectetur adipiscing elit.
+                * Donec venenatis nisl aliquam ipsum.
+
+                  Nulla purus dui.
+
+                  - Pellentesque elementum mollis finibus.
+
+
+                Version 0.8
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                Maecenas sodales posuere justo.
+                """),
+            'expected_change_log_entries': [
+                chug.model.ChangeLogEntry(
+                    release_date="2009-01-01",
+                    version="1.0",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body=textwrap.dedent("""\
+                        Lorem ipsum dolor sit amet,
+                        consectetur adipiscing elit.
+
+                        Donec venenatis nisl aliquam ipsum.
+
+                        Nulla purus dui.
+
+                        Pellentesque elementum mollis finibus."""),
+                ),
+                chug.model.ChangeLogEntry(
+                    release_date="2004-01-01",
+                    version="0.8",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body="Maecenas sodales posuere justo.",
+                ),
+            ],
+        }),
+        ('preamble-references entries-two trailing-comment', {
+            'test_document_text': textwrap.dedent("""\
+                This is the `change log`_ for this project.
+
+                ..  _change log: https://keepachangelog.com/
+
+
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                Lorem ipsum dolor sit amet.
+
+
+                Version 0.8
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                Maecenas sodales posuere justo.
+
+                \f
+                ..
+                    Local variables:
+                    coding: utf-8
+                    End:
+                """),
+            'expected_change_log_entries': [
+                chug.model.ChangeLogEntry(
+                    release_date="2009-01-01",
+                    version="1.0",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body="Lorem ipsum dolor sit amet.",
+                ),
+                chug.model.ChangeLogEntry(
+                    release_date="2004-01-01",
+                    version="0.8",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body=textwrap.dedent("""\
+                        Maecenas sodales posuere justo.
+
+                        Local variables:
+                        coding: utf-8
+                        End:"""),
+                ),
+            ],
+        }),
+        ('document-title-overline entries-two', {
+            'test_document_text': textwrap.dedent("""\
+                ##########
+                Change Log
+                ##########
+
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+                :License: AGPL-3+
+
+                Lorem ipsum dolor sit amet.
+
+                Version 0.8
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                Maecenas sodales posuere justo.
+                """),
+            'expected_change_log_entries': [
+                chug.model.ChangeLogEntry(
+                    release_date="2009-01-01",
+                    version="1.0",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body="Lorem ipsum dolor sit amet.",
+                ),
+                chug.model.ChangeLogEntry(
+                    release_date="2004-01-01",
+                    version="0.8",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body="Maecenas sodales posuere justo.",
+                ),
+            ],
+        }),
+    ]
+    return scenarios
+
+
+def make_scanner_unsupported_document_test_scenarios():
+    """ Make scenarios for documents that the scanner should decline.
+
+        :return: Sequence of tuples `(name, parameters)`. Each is a scenario
+            as specified for `testscenarios`.
+        """
+    entry_head_text = textwrap.dedent("""\
+        Version 1.0
+        ===========
+
+        :Released: 2009-01-01
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+        """)
+    entry_tail_text = textwrap.dedent("""\
+
+
+        Version 0.8
+        ===========
+
+        :Released: 2004-01-01
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+        Maecenas sodales posuere justo.
+        """)
+    body_scenarios = [
+        ('body-inline-markup', "Lorem *ipsum* dolor sit amet."),
+        ('body-reference', "See the documentation_."),
+        ('body-literal-block', "Example::\n\n    lorem ipsum"),
+        ('body-block-quote', "Lorem ipsum.\n\n    Dolor sit amet."),
+        ('body-definition-list', "Lorem\n    Ipsum dolor sit amet."),
+        ('body-enumerated-list', "1. Lorem ipsum.\n2. Dolor sit amet."),
+        ('body-directive', ".. note:: Lorem ipsum."),
+        ('body-target', "Lorem ipsum.\n\n.. _foo: https://example.org/"),
+        ('body-empty-comment', "Lorem ipsum.\n\n.."),
+        ('body-subsection', "Lorem ipsum.\n\nDolor\n-----\n\nSit amet."),
+        ('body-transition', "Lorem ipsum.\n\n----------\n\nSit amet."),
+        ('body-bullet-list-no-blank-end', "* Lorem ipsum.\nDolor sit."),
+    ]
+    scenarios = [
+        (name, {
+            'test_document_text': (
+                entry_head_text + body_text + entry_tail_text),
+        })
+        for (name, body_text) in body_scenarios
+    ] + [
+        ('entries-title-duplicate', {
+            'test_document_text': (
+                entry_head_text + "Lorem ipsum." + entry_tail_text.replace(
+                    "Version 0.8", "Version 1.0")),
+        }),
+        ('entry-field-list-missing', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                Lorem ipsum dolor sit amet.
+                """),
+        }),
+        ('entry-field-multi-line', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar
+                    <foo.bar@example.org>
+
+                Lorem ipsum dolor sit amet.
+                """),
+        }),
+        ('title-underline-too-short', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                =======
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+                """),
+        }),
+    ]
+    return scenarios
+
+
+class scan_change_log_entries_from_text_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘scan_change_log_entries_from_text’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.scanner.scan_change_log_entries_from_text)
+
+    scenarios = [
+        # The scanner declines any document that is not a valid Change Log.
+        (name, (
+            dict(
+                params,
+                expected_error=(
+                    chug.parsers.scanner.UnsupportedConstructError))
+            if 'expected_error' in params else params))
+        for (name, params) in make_rest_document_test_scenarios()
+    ] + make_scanner_supported_document_test_scenarios()
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(self.test_document_text)
+        if hasattr(self, 'expected_change_log_entries'):
+            self.assertEqual(
+                [
+                    entry.as_version_info_entry()
+                    for entry in self.expected_change_log_entries],
+                [entry.as_version_info_entry() for entry in result])
+
+    def test_result_matches_docutils_parser(self):
+        """ Should return the same entries as the Docutils parser. """
+        if hasattr(self, 'expected_error'):
+            self.skipTest("document is not a valid Change Log")
+        document = docutils.core.publish_doctree(self.test_document_text)
+        expected_entries = (
+            chug.parsers.rest.make_change_log_entries_from_document(
+                document))
+        result = self.function_to_test(self.test_document_text)
+        self.assertEqual(
+            [entry.as_version_info_entry() for entry in expected_entries],
+            [entry.as_version_info_entry() for entry in result])
+
+    def test_body_source_matches_docutils_parser(self):
+        """ Should get the same body source as the Docutils parser. """
+        if hasattr(self, 'expected_error'):
+            self.skipTest("document is not a valid Change Log")
+        document = docutils.core.publish_doctree(self.test_document_text)
+        expected_entries = (
+            chug.parsers.rest.make_change_log_entries_from_document(
+                document,
+                document_source=chug.parsers.core.DocumentSource(
+                    self.test_document_text)))
+        result = self.function_to_test(self.test_document_text)
+        self.assertEqual(
+            [str(entry.body_source) for entry in expected_entries],
+            [str(entry.body_source) for entry in result])
+
+
+class scan_change_log_entries_from_text_body_source_TestCase(
+        testtools.TestCase):
+    """ Test cases for ‘body_source’ of scanned entries. """
+
+    function_to_test = staticmethod(
+        chug.parsers.scanner.scan_change_log_entries_from_text)
+
+    test_document_text = textwrap.dedent("""\
+        Change Log
+        ##########
+
+        Version 1.0
+        ===========
+
+        :Released: 2009-01-01
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+        * Lorem ipsum dolor sit amet,
+          consectetur adipiscing elit.
+
+        ..
+            Donec venenatis nisl aliquam ipsum.
+
+
+        Version 0.8
+        ===========
+
+        :Released: 2004-01-01
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+
+        Version 0.7
+        ===========
+
+        :Released: 2001-01-01
+        :Maintainer: Foo Bar <foo.bar@example.org>
+
+        Pellentesque elementum mollis finibus.
+
+        """)
+
+    def test_body_source_has_expected_source_text(self):
+        """ Should have the source text of each entry body. """
+        result = self.function_to_test(self.test_document_text)
+        self.assertEqual(
+            [
+                textwrap.dedent("""\
+                    * Lorem ipsum dolor sit amet,
+                      consectetur adipiscing elit.
+
+                    ..
+                        Donec venenatis nisl aliquam ipsum.
+                    """),
+                "",
+                "Pellentesque elementum mollis finibus.\n",
+            ],
+            [str(entry.body_source) for entry in result])
+
+    def test_body_source_refers_to_document_text(self):
+        """ Should refer to the document text, without copying it. """
+        result = self.function_to_test(self.test_document_text)
+        for entry in result:
+            self.assertIs(self.test_document_text, entry.body_source.text)
+
+    def test_latest_entry_has_same_body_source(self):
+        """ Should get the same body source for only the latest entry. """
+        (expected_entry, *__) = self.function_to_test(
+            self.test_document_text)
+        result = chug.parsers.scanner.scan_latest_change_log_entry_from_text(
+            self.test_document_text)
+        self.assertEqual(expected_entry.body_source, result.body_source)
+
+
+class scan_change_log_entries_from_text_ErrorTestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Error test cases for ‘scan_change_log_entries_from_text’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.scanner.scan_change_log_entries_from_text)
+
+    scenarios = [
+        ('type-none', {
+            'test_document_text': None,
+            'expected_error': TypeError,
+        }),
+        ('empty', {
+            'test_document_text': "",
+            'expected_error': chug.parsers.scanner.UnsupportedConstructError,
+        }),
+        ('entry-release-date-invalid', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: b0gUs
+                :Maintainer: Foo Bar <foo.bar@example.org>
+                """),
+            'expected_error': chug.model.DateInvalidError,
+        }),
+    ] + [
+        (name, dict(
+            params,
+            expected_error=chug.parsers.scanner.UnsupportedConstructError))
+        for (name, params) in (
+            make_scanner_unsupported_document_test_scenarios())
+    ]
+
+    def test_raises_expected_error(self):
+        """ Should raise expected error. """
+        with make_expected_error_context(self):
+            __ = self.function_to_test(self.test_document_text)
+
+
+class scan_latest_change_log_entry_from_text_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘scan_latest_change_log_entry_from_text’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.scanner.scan_latest_change_log_entry_from_text)
+
+    scenarios = scan_change_log_entries_from_text_TestCase.scenarios + [
+        ('entries-two later-entry-not-scanned', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Lorem ipsum dolor sit amet.
+
+
+                Version 0.8
+                ===========
+
+                :Released: b0gUs
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                * Donec *venenatis* nisl aliquam ipsum.
+
+                ::
+
+                    Pellentesque elementum mollis finibus.
+                """),
+            'expected_change_log_entries': [
+                chug.model.ChangeLogEntry(
+                    release_date="2009-01-01",
+                    version="1.0",
+                    maintainer="Foo Bar <foo.bar@example.org>",
+                    body="Lorem ipsum dolor sit amet.",
+                ),
+            ],
+        }),
+        ('entries-one entry-subsection', {
+            'test_document_text': textwrap.dedent("""\
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+                Lorem ipsum
+                -----------
+
+                * Lorem ipsum dolor sit amet.
+
+
+                Version 0.8
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+                """),
+            'expected_error': chug.parsers.scanner.UnsupportedConstructError,
+        }),
+        ('document-title entries-two later-top-level-section', {
+            # The later top-level section means the first section title is
+            # not the document title, so the first entry has subsections.
+            'test_document_text': textwrap.dedent("""\
+                Felis gravida lacinia
+                #####################
+
+                Version 1.0
+                ===========
+
+                :Released: 2009-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+
+                Version 0.8
+                ===========
+
+                :Released: 2004-01-01
+                :Maintainer: Foo Bar <foo.bar@example.org>
+
+
+                Tempus lorem aliquet
+                ####################
+
+                Maecenas feugiat nibh sed enim fringilla faucibus.
+                """),
+            'expected_error': chug.parsers.scanner.UnsupportedConstructError,
+        }),
+    ]
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(self.test_document_text)
+        if hasattr(self, 'expected_change_log_entries'):
+            self.assertEqual(
+                self.expected_change_log_entries[0].as_version_info_entry(),
+                result.as_version_info_entry())
+
+
+class scan_latest_change_log_entry_from_text_ErrorTestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Error test cases for ‘scan_latest_change_log_entry_from_text’. """
+
+    function_to_test = staticmethod(
+        chug.parsers.scanner.scan_latest_change_log_entry_from_text)
+
+    scenarios = scan_change_log_entries_from_text_ErrorTestCase.scenarios
+
+    def test_raises_expected_error(self):
+        """ Should raise expected error. """
+        with make_expected_error_context(self):
+            __ = self.function_to_test(self.test_document_text)
+
+
+class scan_latest_change_log_entry_from_file_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘scan_latest_change_log_entry_from_file’ function. """
+
+    function_to_test = staticmethod(
+        chug.parsers.scanner.scan_latest_change_log_entry_from_file)
+
+    size_scenarios = [
+        ('size-tiny', {
+            'test_initial_size': 1,
+        }),
+        ('size-small', {
+            'test_initial_size': 40,
+        }),
+        ('size-default', {
+            'test_initial_size': None,
+        }),
+    ]
+
+    scenarios = testscenarios.multiply_scenarios(
+        [
+            (name, params) for (name, params) in (
+                scan_latest_change_log_entry_from_text_TestCase.scenarios
+                + scan_latest_change_log_entry_from_text_ErrorTestCase
+                .scenarios)
+            if isinstance(params['test_document_text'], str)
+        ] + [
+            ('entries-two adornment-after-first-part', {
+                # The later top-level section is found without scanning
+                # the part of the file that contains it.
+                'test_document_text': textwrap.dedent("""\
+                    Felis gravida lacinia
+                    #####################
+
+                    Version 1.0
+                    ===========
+
+                    :Released: 2009-01-01
+                    :Maintainer: Foo Bar <foo.bar@example.org>
+
+
+                    Version 0.8
+                    ===========
+
+                    :Released: 2004-01-01
+                    :Maintainer: Foo Bar <foo.bar@example.org>
+
+                    """) + ("* Lorem ipsum dolor sit amet.\n" * 100) + (
+                    textwrap.dedent("""\
+
+
+                    Tempus lorem aliquet
+                    ####################
+                    """)),
+                'expected_error': (
+                    chug.parsers.scanner.UnsupportedConstructError),
+            }),
+        ],
+        size_scenarios)
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+
+        self.test_document_file = chug.parsers.core.ChangeLogDocumentFile(
+            make_temporary_file_path(
+                self, self.test_document_text.encode('utf-8')))
+        self.addCleanup(self.test_document_file.close)
+        self.test_kwargs = (
+            {} if self.test_initial_size is None
+            else {'initial_size': self.test_initial_size})
+
+    def test_returns_expected_result_or_raises_expected_error(self):
+        """ Should return expected result or raise expected error. """
+        with make_expected_error_context(self):
+            result = self.function_to_test(
+                self.test_document_file, **self.test_kwargs)
+        if hasattr(self, 'expected_change_log_entries'):
+            self.assertEqual(
+                self.expected_change_log_entries[0].as_version_info_entry(),
+                result.as_version_info_entry())
+
+    def test_result_has_same_body_source_as_scanning_text(self):
+        """ Should get the same body source as scanning the whole text. """
+        if hasattr(self, 'expected_change_log_entries'):
+            expected_entry = (
+                chug.parsers.scanner.scan_latest_change_log_entry_from_text(
+                    self.test_document_text))
+            result = self.function_to_test(
+                self.test_document_file, **self.test_kwargs)
+            self.assertEqual(
+                str(expected_entry.body_source), str(result.body_source))
+
+
+# Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
+#
+# This is free software: you may copy, modify, and/or distribute this work
+# under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; version 3 or, at your option, a later version.
+# No warranty expressed or implied. See the file ‘LICENSE.AGPL-3’ for details.
+
+
+# Local variables:
+# coding: utf-8
+# mode: python
+# End:
+# vim: fileencoding=utf-8 filetype=python :
@@ -7,7 +7,10 @@
 
 """ Unit test for ‘util.metadata’ packaging module. """
 
+import json
+import os
 import textwrap
+import unittest.mock
 
 import testscenarios
 import testtools
@@ -15,7 +18,9 @@ import testtools
 from src.chug import model
 import util.metadata
 
+from . import make_temporary_file_path
 from .test_parsers import mock_builtin_open_for_fake_files
+from .test_parsers_cache import make_temporary_directory
 
 
 class FakeObject:
@@ -203,6 +208,167 @@ class get_latest_changelog_entry_TestCase(testtools.TestCase):
         )
         self.assertEqual(expected_result, result)
 
+
+test_changelog_text = textwrap.dedent("""\
+    Version 1.7.2
+    =============
+
+    :Released: 2020-01-10
+    :Maintainer: Cathy Morris <cathy.morris@example.com>
+
+    …
+    """)
+
+test_changelog_metadata = {
+    'version': "1.7.2",
+    'maintainer': "Cathy Morris <cathy.morris@example.com>",
+}
+
+
+class get_changelog_file_key_TestCase(testtools.TestCase):
+    """ Test cases for ‘get_changelog_file_key’ function. """
+
+    function_to_test = staticmethod(util.metadata.get_changelog_file_key)
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+        self.test_infile_path = make_temporary_file_path(
+            self, test_changelog_text.encode('utf-8'))
+
+    def test_returns_key_of_file_stat_and_hash(self):
+        """ Should return key of file mtime, size, and content hash. """
+        result = self.function_to_test(self.test_infile_path)
+        infile_stat = os.stat(self.test_infile_path)
+        self.assertEqual(infile_stat.st_mtime_ns, result['mtime_ns'])
+        self.assertEqual(infile_stat.st_size, result['size'])
+        self.assertEqual(64, len(result['sha256']))
+
+    def test_returns_different_key_for_changed_content(self):
+        """ Should return a different key when the file content changes. """
+        key = self.function_to_test(self.test_infile_path)
+        infile_stat = os.stat(self.test_infile_path)
+        with open(self.test_infile_path, 'wb') as outfile:
+            outfile.write(test_changelog_text.replace("1.7.2", "1.7.3").encode(
+                'utf-8'))
+        os.utime(
+            self.test_infile_path,
+            ns=(infile_stat.st_atime_ns, infile_stat.st_mtime_ns))
+        result = self.function_to_test(self.test_infile_path)
+        self.assertNotEqual(key['sha256'], result['sha256'])
+
+
+class changelog_memo_TestCase(testtools.TestCase):
+    """ Test cases for ‘read_changelog_memo’ and ‘write_changelog_memo’. """
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+        self.test_memo_path = os.path.join(
+            make_temporary_directory(self), "build", "memo.json")
+        self.test_key = {'mtime_ns': 1, 'size': 2, 'sha256': "beef"}
+
+    def test_read_returns_written_metadata(self):
+        """ Should read the metadata written for the same key. """
+        util.metadata.write_changelog_memo(
+            self.test_memo_path, self.test_key, test_changelog_metadata)
+        result = util.metadata.read_changelog_memo(
+            self.test_memo_path, self.test_key)
+        self.assertEqual(test_changelog_metadata, result)
+
+    def test_read_returns_none_for_different_key(self):
+        """ Should return ``None`` when the memo is for a different key. """
+        util.metadata.write_changelog_memo(
+            self.test_memo_path, self.test_key, test_changelog_metadata)
+        result = util.metadata.read_changelog_memo(
+            self.test_memo_path, dict(self.test_key, size=3))
+        self.assertIsNone(result)
+
+    def test_read_returns_none_for_missing_memo(self):
+        """ Should return ``None`` when there is no memo file. """
+        result = util.metadata.read_changelog_memo(
+            self.test_memo_path, self.test_key)
+        self.assertIsNone(result)
+
+    def test_read_returns_none_for_other_format(self):
+        """ Should return ``None`` when the memo is of another format. """
+        os.makedirs(os.path.dirname(self.test_memo_path))
+        with open(self.test_memo_path, 'w', encoding='utf-8') as outfile:
+            json.dump({
+                'format': -1,
+                'key': self.test_key,
+                'metadata': test_changelog_metadata,
+            }, outfile)
+        result = util.metadata.read_changelog_memo(
+            self.test_memo_path, self.test_key)
+        self.assertIsNone(result)
+
+    def test_read_returns_none_for_corrupt_memo(self):
+        """ Should return ``None`` when the memo is not valid JSON. """
+        os.makedirs(os.path.dirname(self.test_memo_path))
+        with open(self.test_memo_path, 'w', encoding='utf-8') as outfile:
+            outfile.write("{lorem")
+        result = util.metadata.read_changelog_memo(
+            self.test_memo_path, self.test_key)
+        self.assertIsNone(result)
+
+    def test_write_ignores_error(self):
+        """ Should not raise an error when the memo cannot be written. """
+        with unittest.mock.patch.object(
+                os, "makedirs", side_effect=PermissionError):
+            util.metadata.write_changelog_memo(
+                self.test_memo_path, self.test_key, test_changelog_metadata)
+        self.assertFalse(os.path.exists(self.test_memo_path))
+
+
+class get_latest_changelog_metadata_TestCase(testtools.TestCase):
+    """ Test cases for ‘get_latest_changelog_metadata’ function. """
+
+    function_to_test = staticmethod(
+        util.metadata.get_latest_changelog_metadata)
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+        self.test_infile_path = make_temporary_file_path(
+            self, test_changelog_text.encode('utf-8'))
+        self.test_memo_path = os.path.join(
+            make_temporary_directory(self), "memo.json")
+        patcher = unittest.mock.patch.object(
+            util.metadata, "get_latest_changelog_entry",
+            wraps=util.metadata.get_latest_changelog_entry)
+        self.mock_get_latest_changelog_entry = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_returns_metadata_without_memo(self):
+        """ Should return the metadata, parsed each time, with no memo. """
+        for __ in range(2):
+            result = self.function_to_test(self.test_infile_path)
+        self.assertEqual(test_changelog_metadata, result)
+        self.assertEqual(2, self.mock_get_latest_changelog_entry.call_count)
+
+    def test_reuses_memo_for_unchanged_file(self):
+        """ Should parse the document only once, for an unchanged file. """
+        for __ in range(3):
+            result = self.function_to_test(
+                self.test_infile_path, memo_path=self.test_memo_path)
+        self.assertEqual(test_changelog_metadata, result)
+        self.mock_get_latest_changelog_entry.assert_called_once_with(
+            self.test_infile_path)
+
+    def test_parses_again_for_changed_file(self):
+        """ Should parse the document again, when the file has changed. """
+        self.function_to_test(
+            self.test_infile_path, memo_path=self.test_memo_path)
+        with open(self.test_infile_path, 'wb') as outfile:
+            outfile.write(test_changelog_text.replace("1.7.2", "1.8").encode(
+                'utf-8'))
+        result = self.function_to_test(
+            self.test_infile_path, memo_path=self.test_memo_path)
+        self.assertEqual(
+            dict(test_changelog_metadata, version="1.8"), result)
+        self.assertEqual(2, self.mock_get_latest_changelog_entry.call_count)
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
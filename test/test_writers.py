@@ -7,12 +7,15 @@
 
 """ Test cases for ‘chug.writers’ package. """
 
+import datetime
+import io
 import json
 import unittest.mock
 
 import testscenarios
 import testtools
 
+import chug.model
 import chug.writers
 
 
@@ -48,6 +51,382 @@ class serialise_version_info_from_mapping_to_json_TestCase(
         value = json.loads(result)
         self.assertEqual(self.expected_value, value)
 
+
+test_entries = [
+    chug.model.ChangeLogEntry(
+        release_date="FUTURE", version="1.0",
+        maintainer="Foo Bar <foo.bar@example.org>",
+        body="Lorem ipsum dolor sit amet. ‘Quoted’."),
+    chug.model.ChangeLogEntry(
+        release_date="2009-01-01", version="0.9",
+        maintainer="Foo Bar <foo.bar@example.org>",
+        body="Donec venenatis nisl aliquam ipsum."),
+]
+
+
+class write_entries_to_ndjson_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘write_entries_to_ndjson’ function. """
+
+    function_to_test = staticmethod(chug.writers.write_entries_to_ndjson)
+
+    scenarios = [
+        ('entries', {
+            'test_entries': test_entries,
+        }),
+        ('mappings', {
+            'test_entries': [
+                entry.as_version_info_entry() for entry in test_entries],
+        }),
+        ('compact-entries', {
+            'test_entries': [
+                chug.model.CompactChangeLogEntry.from_entry(entry)
+                for entry in test_entries],
+        }),
+        ('empty', {
+            'test_entries': [],
+        }),
+    ]
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+        self.test_outfile = io.BytesIO()
+        self.expected_values = [
+            dict(entry.as_version_info_entry()) for entry in test_entries
+        ][:len(self.test_entries)]
+
+    def test_writes_one_json_line_per_entry(self):
+        """ Should write each entry as one line of JSON. """
+        self.function_to_test(iter(self.test_entries), self.test_outfile)
+        content = self.test_outfile.getvalue()
+        lines = content.splitlines(keepends=True)
+        self.assertTrue(all(line.endswith(b"\n") for line in lines))
+        self.assertEqual(
+            self.expected_values,
+            [json.loads(line.decode('utf-8')) for line in lines])
+
+    def test_writes_compact_separators(self):
+        """ Should write the JSON with compact separators. """
+        self.function_to_test(self.test_entries, self.test_outfile)
+        content = self.test_outfile.getvalue()
+        expected_content = b"".join(
+            json.dumps(
+                value, ensure_ascii=False, separators=(",", ":")
+            ).encode('utf-8') + b"\n"
+            for value in self.expected_values)
+        self.assertEqual(expected_content, content)
+
+    def test_returns_number_of_bytes_written(self):
+        """ Should return the number of bytes written. """
+        result = self.function_to_test(self.test_entries, self.test_outfile)
+        self.assertEqual(len(self.test_outfile.getvalue()), result)
+
+
+class write_entries_to_ndjson_chunks_TestCase(testtools.TestCase):
+    """ Test cases for ‘write_entries_to_ndjson’ writing in chunks. """
+
+    function_to_test = staticmethod(chug.writers.write_entries_to_ndjson)
+
+    def test_writes_chunks_while_consuming_entries(self):
+        """ Should write chunks before all the entries are consumed. """
+        outfile = io.BytesIO()
+        written_lengths = []
+
+        def generate_entries():
+            for entry in test_entries * 5:
+                written_lengths.append(len(outfile.getvalue()))
+                yield entry
+
+        self.function_to_test(generate_entries(), outfile, chunk_size=1)
+        self.assertEqual(0, written_lengths[0])
+        self.assertLess(written_lengths[-1], len(outfile.getvalue()))
+        self.assertEqual(
+            sorted(set(written_lengths)), written_lengths)
+
+    def test_writes_remainder_of_partial_write(self):
+        """ Should write again the bytes not written by a partial write. """
+        outfile = io.BytesIO()
+        written_chunks = []
+
+        def fake_write(content):
+            chunk = bytes(content[:7])
+            written_chunks.append(chunk)
+            outfile.write(chunk)
+            return len(chunk)
+
+        fake_outfile = unittest.mock.MagicMock(write=fake_write)
+        result = self.function_to_test(test_entries, fake_outfile)
+        self.assertGreater(len(written_chunks), 1)
+        self.assertEqual(len(outfile.getvalue()), result)
+        self.assertEqual(
+            len(test_entries), outfile.getvalue().count(b"\n"))
+
+
+binary_test_entries = [
+    *test_entries,
+    chug.model.ChangeLogEntry(
+        release_date="2008-01-01", version="0.1.2",
+        maintainer="Foo Bar <foo.bar@example.org>",
+        body="Donec venenatis nisl aliquam ipsum."),
+    chug.model.ChangeLogEntry(
+        release_date="2007-1-1", version="0.0.1-alpha1",
+        maintainer="Baz Qux <baz.qux@example.org>", body=""),
+    chug.model.ChangeLogEntry(
+        release_date="UNKNOWN", version="NEXT"),
+    chug.model.ChangeLogEntry(
+        release_date="2006-01-01", version="1000000.0.0",
+        maintainer="Foo Bar <foo.bar@example.org>",
+        body="Vestibulum eu risus sed velit."),
+]
+
+
+class binary_format_round_trip_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for round trip of entries through the binary format. """
+
+    scenarios = [
+        ('several', {
+            'test_entries': binary_test_entries,
+        }),
+        ('one', {
+            'test_entries': binary_test_entries[:1],
+        }),
+        ('empty', {
+            'test_entries': [],
+        }),
+    ]
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+        self.test_data = chug.writers.serialise_entries_to_binary(
+            iter(self.test_entries))
+
+    def test_data_starts_with_header(self):
+        """ Should serialise data that starts with the header. """
+        (magic, format_version, entry_count, __) = (
+            chug.writers.binary_header_struct.unpack_from(self.test_data))
+        self.assertEqual(chug.writers.binary_format_magic, magic)
+        self.assertEqual(chug.writers.binary_format_version, format_version)
+        self.assertEqual(len(self.test_entries), entry_count)
+
+    def test_read_returns_equal_entries(self):
+        """ Should read entries equal to those serialised. """
+        result = chug.writers.read_entries_from_binary(self.test_data)
+        self.assertEqual(self.test_entries, result)
+        self.assertEqual(
+            [entry.field_values() for entry in self.test_entries],
+            [entry.field_values() for entry in result])
+
+    def test_read_entries_have_equal_parsed_values(self):
+        """ Should read entries with the same parsed values. """
+        result = chug.writers.read_entries_from_binary(self.test_data)
+        self.assertEqual(
+            [
+                (entry.release_date_value, entry.version_info)
+                for entry in self.test_entries],
+            [
+                (entry.release_date_value, entry.version_info)
+                for entry in result])
+
+    def test_reads_packed_values_without_parsing_text(self):
+        """ Should not parse the text of packed dates and versions. """
+        packed_entries = [
+            entry for entry in self.test_entries
+            if chug.writers.binary_version_regex.match(entry.version)
+            and isinstance(entry.release_date_value, datetime.date)
+            and entry.release_date_value.isoformat() == entry.release_date]
+        with unittest.mock.patch.object(
+                chug.model.ChangeLogEntry, 'parse_release_date',
+                side_effect=AssertionError
+        ), unittest.mock.patch.object(
+                chug.model.ChangeLogEntry, 'parse_version',
+                side_effect=AssertionError):
+            result = chug.writers.read_entries_from_binary(
+                chug.writers.serialise_entries_to_binary(packed_entries))
+        self.assertEqual(packed_entries, result)
+
+    def test_reads_from_memoryview(self):
+        """ Should read entries from any bytes-like object. """
+        result = chug.writers.read_entries_from_binary(
+            memoryview(bytearray(self.test_data)))
+        self.assertEqual(self.test_entries, result)
+
+
+class serialise_entries_to_binary_TestCase(testtools.TestCase):
+    """ Test cases for ‘serialise_entries_to_binary’ function. """
+
+    function_to_test = staticmethod(chug.writers.serialise_entries_to_binary)
+
+    def test_stores_each_distinct_text_once(self):
+        """ Should store each distinct text once in the string table. """
+        entries = [
+            chug.model.ChangeLogEntry(
+                release_date="2009-01-01", version="1.{}.0".format(number),
+                maintainer="Foo Bar <foo.bar@example.org>",
+                body="Lorem ipsum.")
+            for number in range(10)]
+        result = self.function_to_test(entries)
+        self.assertEqual(1, result.count(b"Foo Bar <foo.bar@example.org>"))
+        self.assertEqual(1, result.count(b"Lorem ipsum."))
+
+    def test_packs_dates_and_versions_as_integers(self):
+        """ Should not store packable dates and versions as text. """
+        result = self.function_to_test(binary_test_entries[:3])
+        self.assertNotIn(b"2009-01-01", result)
+        self.assertNotIn(b"0.1.2", result)
+        self.assertIn(b"FUTURE", result)
+
+
+class pack_binary_version_TestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘pack_binary_version’ function. """
+
+    function_to_test = staticmethod(chug.writers.pack_binary_version)
+
+    scenarios = [
+        ('packable', {
+            'test_text': "1.2.3",
+            'expected_packed': True,
+        }),
+        ('packable-maximum', {
+            'test_text': "999999.999999.999999",
+            'expected_packed': True,
+        }),
+        ('component-too-large', {
+            'test_text': "1000000.0.0",
+            'expected_packed': False,
+        }),
+        ('leading-zero', {
+            'test_text': "1.02.3",
+            'expected_packed': False,
+        }),
+        ('prerelease', {
+            'test_text': "1.2.3-alpha1",
+            'expected_packed': False,
+        }),
+        ('special', {
+            'test_text': "NEXT",
+            'expected_packed': False,
+        }),
+    ]
+
+    def test_returns_expected_code(self):
+        """ Should return a packed version, or a negative string code. """
+        index_by_string = {}
+        result = self.function_to_test(self.test_text, index_by_string)
+        if self.expected_packed:
+            self.assertGreaterEqual(result, 0)
+            self.assertEqual({}, index_by_string)
+            self.assertEqual(
+                self.test_text,
+                ".".join(map(str, chug.writers.unpack_binary_version(result))))
+        else:
+            self.assertEqual(-1, result)
+            self.assertEqual({self.test_text: 0}, index_by_string)
+
+
+class BinaryEntryReader_TestCase(testtools.TestCase):
+    """ Test cases for ‘BinaryEntryReader’ class. """
+
+    def setUp(self):
+        """ Set up fixtures for this test case. """
+        super().setUp()
+        self.test_data = chug.writers.serialise_entries_to_binary(
+            binary_test_entries)
+        self.instance = chug.writers.BinaryEntryReader(self.test_data)
+
+    def test_has_length_of_entry_count(self):
+        """ Should have length equal to the number of entries. """
+        self.assertEqual(len(binary_test_entries), len(self.instance))
+
+    def test_gets_entry_at_index(self):
+        """ Should get the entry at each index, counting from either end. """
+        for index in [0, 3, -1, -len(binary_test_entries)]:
+            self.assertEqual(
+                binary_test_entries[index].field_values(),
+                self.instance[index].field_values())
+
+    def test_gets_list_of_entries_in_slice(self):
+        """ Should get a list of the entries in a slice. """
+        for index in [
+                slice(0, 2), slice(-3, None), slice(None, None, -2),
+                slice(10, 20)]:
+            result = self.instance[index]
+            self.assertIsInstance(result, list)
+            self.assertEqual(binary_test_entries[index], result)
+
+    def test_raises_type_error_for_index_not_integer(self):
+        """ Should raise TypeError for an index not an integer or slice. """
+        with testtools.ExpectedException(TypeError):
+            self.instance["1"]
+
+    def test_raises_index_error_for_index_out_of_range(self):
+        """ Should raise IndexError for an index out of range. """
+        for index in [len(binary_test_entries), -len(binary_test_entries) - 1]:
+            with testtools.ExpectedException(IndexError):
+                self.instance[index]
+
+    def test_get_entry_raises_index_error_for_index_out_of_range(self):
+        """ Should raise IndexError from ‘get_entry’ for an invalid index. """
+        for index in [len(binary_test_entries), -1]:
+            with testtools.ExpectedException(IndexError):
+                self.instance.get_entry(index)
+
+    def test_gets_entry_without_decoding_other_entries(self):
+        """ Should decode only the strings of the entry accessed. """
+        with unittest.mock.patch.object(
+                chug.writers.BinaryEntryReader, 'get_string',
+                autospec=True,
+                side_effect=chug.writers.BinaryEntryReader.get_string
+        ) as mock_get_string:
+            self.instance[2]
+        self.assertEqual(2, mock_get_string.call_count)
+
+    def test_raises_error_for_string_code_not_in_table(self):
+        """ Should raise BinaryFormatError for a string code not in table. """
+        data = bytearray(self.test_data)
+        maintainer_offset = chug.writers.binary_header_struct.size + 12
+        data[maintainer_offset:maintainer_offset + 4] = (
+            (9999).to_bytes(4, 'little'))
+        instance = chug.writers.BinaryEntryReader(data)
+        with testtools.ExpectedException(chug.writers.BinaryFormatError):
+            instance[0]
+        with testtools.ExpectedException(chug.writers.BinaryFormatError):
+            list(instance)
+
+
+class BinaryEntryReader_ErrorTestCase(
+        testscenarios.WithScenarios, testtools.TestCase):
+    """ Test cases for ‘BinaryEntryReader’ with data not valid. """
+
+    test_data = chug.writers.serialise_entries_to_binary(binary_test_entries)
+
+    scenarios = [
+        ('too-short-for-header', {
+            'test_data': test_data[:10],
+        }),
+        ('wrong-magic', {
+            'test_data': b"JSON" + test_data[4:],
+        }),
+        ('unsupported-format-version', {
+            'test_data': (
+                test_data[:4] + (99).to_bytes(2, 'little') + test_data[6:]),
+        }),
+        ('too-short-for-entries', {
+            'test_data': test_data[:40],
+        }),
+        ('too-short-for-strings', {
+            'test_data': test_data[:-1],
+        }),
+    ]
+
+    def test_raises_binary_format_error(self):
+        """ Should raise BinaryFormatError. """
+        with testtools.ExpectedException(chug.writers.BinaryFormatError):
+            chug.writers.BinaryEntryReader(self.test_data)
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #
@@ -11,10 +11,14 @@
     time.
     """
 
+import hashlib
 import inspect
+import json
+import os
 import pydoc
+import tempfile
 
-import src.chug.parsers.rest
+import src.chug
 chug = src.chug
 
 
@@ -53,13 +57,123 @@ def get_latest_changelog_entry(infile_path):
             change log document.
         :return: The most recent change log entry, as a `chug.ChangeLogEntry`.
         """
+    import src.chug.parsers.rest
+
     document_text = chug.parsers.get_changelog_document_text(infile_path)
-    document = chug.parsers.rest.parse_rest_document_from_text(document_text)
-    entries = chug.parsers.rest.make_change_log_entries_from_document(
-        document)
-    latest_entry = entries[0]
+    latest_entry = src.chug.parsers.rest.get_latest_change_log_entry(
+        document_text)
     return latest_entry
 
+
+changelog_memo_format_version = 1
+""" Version of the format of the memo file; change it to invalidate memos. """
+
+
+def get_changelog_file_key(infile_path):
+    """ Get the key identifying the content of the file at `infile_path`.
+
+        :param infile_path: The filesystem path (text) of the file.
+        :return: A mapping of ‘mtime_ns’, ‘size’, and ‘sha256’ (the
+            hexadecimal digest of the file content), to their values.
+        """
+    with open(infile_path, 'rb') as infile:
+        infile_stat = os.fstat(infile.fileno())
+        content_hash = hashlib.sha256(infile.read())
+    key = {
+        'mtime_ns': infile_stat.st_mtime_ns,
+        'size': infile_stat.st_size,
+        'sha256': content_hash.hexdigest(),
+    }
+    return key
+
+
+def read_changelog_memo(memo_path, key):
+    """ Read the metadata memoised in the file at `memo_path`, if valid.
+
+        :param memo_path: The filesystem path (text) of the memo file.
+        :param key: The key (as from `get_changelog_file_key`) of the
+            current change log file.
+        :return: The mapping of metadata field name to value, or ``None``
+            if there is no valid memo for `key`.
+        """
+    try:
+        with open(memo_path, encoding='utf-8') as infile:
+            memo = json.load(infile)
+        if (
+                memo['format'] == changelog_memo_format_version
+                and memo['key'] == key):
+            metadata = dict(memo['metadata'])
+        else:
+            metadata = None
+    except (OSError, ValueError, TypeError, KeyError):
+        metadata = None
+    return metadata
+
+
+def write_changelog_memo(memo_path, key, metadata):
+    """ Write the `metadata` for `key` to the memo file at `memo_path`.
+
+        :param memo_path: The filesystem path (text) of the memo file.
+        :param key: The key (as from `get_changelog_file_key`) of the
+            change log file.
+        :param metadata: The mapping of metadata field name to value.
+        :return: ``None``.
+
+        The memo is written to a temporary file, which is then renamed to
+        `memo_path`; so another process never reads a partly written memo.
+        Failing to write the memo is not an error.
+        """
+    content = json.dumps({
+        'format': changelog_memo_format_version,
+        'key': key,
+        'metadata': metadata,
+    })
+    memo_directory_path = os.path.dirname(os.path.abspath(memo_path))
+    try:
+        os.makedirs(memo_directory_path, exist_ok=True)
+        (outfile_fd, temp_path) = tempfile.mkstemp(
+            dir=memo_directory_path, prefix=".tmp-")
+        try:
+            with os.fdopen(outfile_fd, 'w', encoding='utf-8') as outfile:
+                outfile.write(content)
+            os.replace(temp_path, memo_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        pass
+
+
+def get_latest_changelog_metadata(infile_path, *, memo_path=None):
+    """ Get the metadata of the latest entry in the changelog, memoised.
+
+        :param infile_path: The filesystem path (text) from which to read the
+            change log document.
+        :param memo_path: The filesystem path (text) of the memo file, or
+            ``None`` to not use a memo.
+        :return: A mapping of ‘version’ and ‘maintainer’, to the values
+            from the most recent change log entry.
+
+        The build system runs the build program several times for one
+        build, once for each build hook. The memo, keyed by the size,
+        modification time, and content hash of the change log file, lets
+        every run after the first reuse the metadata instead of parsing the
+        document again.
+        """
+    key = None if memo_path is None else get_changelog_file_key(infile_path)
+    metadata = (
+        None if memo_path is None
+        else read_changelog_memo(memo_path, key))
+    if metadata is None:
+        latest_entry = get_latest_changelog_entry(infile_path)
+        metadata = {
+            'version': latest_entry.version,
+            'maintainer': latest_entry.maintainer,
+        }
+        if memo_path is not None:
+            write_changelog_memo(memo_path, key, metadata)
+    return metadata
+
 
 # Copyright © 2008–2024 Ben Finney <ben+python@benfinney.id.au>
 #